@@ -0,0 +1,60 @@
+import sys
+import os
+import time
+from typing import Callable, List, Optional
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+
+NUM_OF_COMMANDS: int = 5000
+NUM_OF_PARSES: int = 2000
+NUM_OF_REPETITIONS: int = 3
+
+COMMAND_NAMES: List[str] = [f'command{i:05}_with_long_name' for i in range(NUM_OF_COMMANDS)]
+ABBREVIATIONS: List[str] = [f'command{(i * 7919) % NUM_OF_COMMANDS:05}' for i in range(NUM_OF_PARSES)]
+
+
+def resolve_by_scanning(command_names: List[str], token: str) -> Optional[str]:
+    # the naive way: every name is checked whether it starts with the token
+    matching_names: List[str] = [command_name for command_name in command_names if command_name.startswith(token)]
+
+    return matching_names[0] if len(matching_names) == 1 else None
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], abbreviations_enabled=True)
+    cli.add_commands((command_name, f'Command {command_name}') for command_name in COMMAND_NAMES)
+
+    return cli
+
+
+def measure(function: Callable[[], None]) -> float:
+    best_duration: float = float('inf')
+
+    for _ in range(NUM_OF_REPETITIONS):
+        start_time: float = time.perf_counter()
+        function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+def resolve_all_by_scanning() -> None:
+    for abbreviation in ABBREVIATIONS:
+        resolve_by_scanning(COMMAND_NAMES, abbreviation)
+
+
+def parse_all(cli: CommandLineInterface) -> None:
+    for abbreviation in ABBREVIATIONS:
+        cli.parse(['program.exe', abbreviation])
+
+
+if __name__ == '__main__':
+    cli: CommandLineInterface = create_cli()
+    start_time: float = time.perf_counter()
+    cli.parse(['program.exe', ABBREVIATIONS[0]])
+    trie_build_duration: float = time.perf_counter() - start_time
+
+    print(f'Resolving {NUM_OF_PARSES} abbreviations among {NUM_OF_COMMANDS} commands (best of {NUM_OF_REPETITIONS}):')
+    print(f'Scanning all names:               {measure(resolve_all_by_scanning) * 1000:10.2f} ms')
+    print(f'cli.parse() resolving with trie:  {measure(lambda: parse_all(cli)) * 1000:10.2f} ms')
+    print(f'Building trie (first parse only): {trie_build_duration * 1000:10.2f} ms')
@@ -0,0 +1,115 @@
+import sys
+import os
+import argparse
+import contextlib
+import io
+import time
+from typing import Callable, List, Tuple
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.argparse_converter import ArgparseConverter
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.comlint_error import ComlintError
+
+NUMS_OF_COMMANDS: List[int] = [10, 100, 1000]
+NUM_OF_OPTIONS: int = 5
+NUM_OF_FLAGS: int = 5
+NUM_OF_PARSES: int = 1000
+NUM_OF_REPETITIONS: int = 3
+
+OPTION_NAMES: List[str] = [f'opt{i}' for i in range(NUM_OF_OPTIONS)]
+FLAG_NAMES: List[str] = [f'flag{i}' for i in range(NUM_OF_FLAGS)]
+
+
+def create_argparse_parser(num_of_commands: int) -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog='program', description='Synthetic interface')
+    subparsers = parser.add_subparsers(dest='command')
+
+    for i in range(num_of_commands):
+        subparser: argparse.ArgumentParser = subparsers.add_parser(f'command{i}', help=f'Command number {i}')
+        subparser.add_argument('value')
+
+        for option_name in OPTION_NAMES:
+            subparser.add_argument(f'-{option_name}', help=f'Option {option_name}')
+        for flag_name in FLAG_NAMES:
+            subparser.add_argument(f'--{flag_name}', action='store_true', help=f'Flag {flag_name}')
+
+    return parser
+
+
+def create_cli(num_of_commands: int) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program'], description='Synthetic interface')
+    option_names: List[str] = [f'-{option_name}' for option_name in OPTION_NAMES]
+    flag_names: List[str] = [f'--{flag_name}' for flag_name in FLAG_NAMES]
+
+    cli.add_options((option_name, f'Option {option_name[1:]}') for option_name in option_names)
+    cli.add_flags((flag_name, f'Flag {flag_name[2:]}') for flag_name in flag_names)
+    cli.add_commands((f'command{i}', f'Command number {i}', 1, None, option_names, flag_names)
+                     for i in range(num_of_commands))
+
+    return cli
+
+
+def parse_invalid_with_argparse(parser: argparse.ArgumentParser, arguments: List[str]) -> None:
+    # argparse prints the usage and exits on errors, which has to be captured
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            parser.parse_args(arguments)
+    except SystemExit:
+        pass
+
+
+def parse_invalid_with_comlint(cli: CommandLineInterface, argv: List[str]) -> None:
+    try:
+        str(cli.parse(argv))
+    except ComlintError as e:
+        str(e)
+
+
+def measure(function: Callable[[], None], num_of_calls: int = 1) -> float:
+    best_duration: float = float('inf')
+
+    for _ in range(NUM_OF_REPETITIONS):
+        start_time: float = time.perf_counter()
+        for _ in range(num_of_calls):
+            function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration / num_of_calls
+
+
+def get_verdict(argparse_duration: float, comlint_duration: float) -> str:
+    if comlint_duration <= argparse_duration:
+        return f'comlint {argparse_duration / comlint_duration:6.1f}x faster'
+
+    return f'comlint {comlint_duration / argparse_duration:6.1f}x slower'
+
+
+def print_row(operation: str, argparse_duration: float, comlint_duration: float) -> None:
+    print(f'{operation:28} {argparse_duration * 1e6:14.1f} {comlint_duration * 1e6:14.1f}   '
+          f'{get_verdict(argparse_duration, comlint_duration)}')
+
+
+if __name__ == '__main__':
+    for num_of_commands in NUMS_OF_COMMANDS:
+        parser: argparse.ArgumentParser = create_argparse_parser(num_of_commands)
+        cli: CommandLineInterface = create_cli(num_of_commands)
+        command_name: str = f'command{num_of_commands // 2}'
+        argparse_arguments: List[str] = [command_name, 'value', '-opt1', 'x', '-opt3', 'y', '--flag2']
+        invalid_arguments: List[str] = [command_name, 'value', '-opt1', 'x', '--unknown']
+        results: List[Tuple[str, float, float]] = [
+            ('construction', measure(lambda: create_argparse_parser(num_of_commands)),
+             measure(lambda: create_cli(num_of_commands))),
+            ('parse()', measure(lambda: parser.parse_args(argparse_arguments), NUM_OF_PARSES),
+             measure(lambda: cli.parse(['program'] + argparse_arguments), NUM_OF_PARSES)),
+            ('parse() with error message', measure(lambda: parse_invalid_with_argparse(parser, invalid_arguments),
+                                                   NUM_OF_PARSES),
+             measure(lambda: parse_invalid_with_comlint(cli, ['program'] + invalid_arguments), NUM_OF_PARSES)),
+            ('help rendering', measure(parser.format_help), measure(cli.get_help))]
+        conversion_duration: float = measure(lambda: ArgparseConverter.convert(parser))
+
+        print(f'\n{num_of_commands} commands, {NUM_OF_OPTIONS} options and {NUM_OF_FLAGS} flags each '
+              f'(best of {NUM_OF_REPETITIONS}):')
+        print(f'{"operation":28} {"argparse [us]":>14} {"comlint [us]":>14}')
+        for operation, argparse_duration, comlint_duration in results:
+            print_row(operation, argparse_duration, comlint_duration)
+        print(f'Converting argparse definition with ArgparseConverter: {conversion_duration * 1e6:.1f} us')
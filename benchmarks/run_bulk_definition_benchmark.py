@@ -0,0 +1,93 @@
+import csv
+import io
+import sys
+import os
+import time
+from typing import Callable, List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+
+NUM_OF_COMMANDS: int = 50000
+NUM_OF_OPTIONS: int = 20
+NUM_OF_FLAGS: int = 20
+NUM_OF_REPETITIONS: int = 5
+
+OPTION_NAMES: List[str] = [f'-option_{i}' for i in range(NUM_OF_OPTIONS)]
+FLAG_NAMES: List[str] = [f'--flag_{i}' for i in range(NUM_OF_FLAGS)]
+
+
+def define_one_by_one() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+    for i in range(NUM_OF_COMMANDS):
+        cli.add_command(f'command_{i}', f'Some command {i}', 1, [], OPTION_NAMES, FLAG_NAMES, OPTION_NAMES[:1])
+    for option_name in OPTION_NAMES:
+        cli.add_option(option_name, f'Some option {option_name}')
+    for flag_name in FLAG_NAMES:
+        cli.add_flag(flag_name, f'Some flag {flag_name}')
+
+    return cli
+
+
+def define_in_bulk() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+    cli.add_commands((f'command_{i}', f'Some command {i}', 1, [], OPTION_NAMES, FLAG_NAMES, OPTION_NAMES[:1])
+                     for i in range(NUM_OF_COMMANDS))
+    cli.add_options((option_name, f'Some option {option_name}') for option_name in OPTION_NAMES)
+    cli.add_flags((flag_name, f'Some flag {flag_name}') for flag_name in FLAG_NAMES)
+
+    return cli
+
+
+def define_in_bulk_with_reference_check() -> CommandLineInterface:
+    cli: CommandLineInterface = define_in_bulk()
+    cli.check_references()
+
+    return cli
+
+
+def define_from_csv(csv_text: str) -> Callable[[], CommandLineInterface]:
+    def define() -> CommandLineInterface:
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        cli.add_commands(csv.DictReader(io.StringIO(csv_text)))
+        cli.add_options((option_name, f'Some option {option_name}') for option_name in OPTION_NAMES)
+        cli.add_flags((flag_name, f'Some flag {flag_name}') for flag_name in FLAG_NAMES)
+
+        return cli
+
+    return define
+
+
+def get_csv_text() -> str:
+    stream: io.StringIO = io.StringIO()
+    writer: csv.writer = csv.writer(stream)
+
+    writer.writerow(['command_name', 'description', 'num_of_required_values', 'allowed_options', 'allowed_flags',
+                     'required_options'])
+    for i in range(NUM_OF_COMMANDS):
+        writer.writerow([f'command_{i}', f'Some command {i}', 1, ' '.join(OPTION_NAMES), ' '.join(FLAG_NAMES),
+                         OPTION_NAMES[0]])
+
+    return stream.getvalue()
+
+
+def measure(define: Callable[[], CommandLineInterface]) -> float:
+    best_duration: float = float('inf')
+
+    for _ in range(NUM_OF_REPETITIONS):
+        start_time: float = time.perf_counter()
+        define()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+if __name__ == '__main__':
+    print(f'Defining {NUM_OF_COMMANDS} commands, {NUM_OF_OPTIONS} options and {NUM_OF_FLAGS} flags '
+          f'(best of {NUM_OF_REPETITIONS}):')
+    print(f'add_command() one by one:              {measure(define_one_by_one) * 1000:8.2f} ms')
+    print(f'add_commands() with tuple rows:        {measure(define_in_bulk) * 1000:8.2f} ms')
+    print(f'add_commands() + check_references():   {measure(define_in_bulk_with_reference_check) * 1000:8.2f} ms')
+    print(f'add_commands() with csv.DictReader:    {measure(define_from_csv(get_csv_text())) * 1000:8.2f} ms')
@@ -0,0 +1,56 @@
+import sys
+import os
+import subprocess
+import tempfile
+import time
+from typing import List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+NUM_OF_COMMANDS: int = 20
+PROGRAM_SOURCE: str = '''import sys
+sys.path.append({package_path!r})
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+
+
+class StepCommandHandler(CommandHandlerInterface):
+    def run(self, command):
+        return 0
+
+
+if __name__ == '__main__':
+    cli = CommandLineInterface(sys.argv)
+    cli.add_command('step', 'Runs one step', num_of_required_values=1)
+    cli.add_command_handler('step', StepCommandHandler())
+    sys.exit(cli.run_chain())
+'''
+
+
+def run_program(program_path: str, arguments: List[str]) -> None:
+    subprocess.run([sys.executable, program_path] + arguments, check=True)
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        program_path: str = os.path.join(directory, 'program.py')
+
+        with open(program_path, 'w', encoding='utf-8') as program_file:
+            program_file.write(PROGRAM_SOURCE.format(
+                package_path=os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))))
+
+        start_time: float = time.perf_counter()
+        for i in range(NUM_OF_COMMANDS):
+            run_program(program_path, ['step', str(i)])
+        separate_duration: float = time.perf_counter() - start_time
+
+        chained_arguments: List[str] = []
+        for i in range(NUM_OF_COMMANDS):
+            chained_arguments += ['step', str(i), '+']
+
+        start_time = time.perf_counter()
+        run_program(program_path, chained_arguments)
+        chained_duration: float = time.perf_counter() - start_time
+
+    print(f'Running {NUM_OF_COMMANDS} commands:')
+    print(f'One process per command:     {separate_duration * 1000:10.2f} ms')
+    print(f'One process with run_chain:  {chained_duration * 1000:10.2f} ms')
@@ -0,0 +1,68 @@
+import sys
+import os
+import threading
+import time
+from typing import List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+from comlint.interface_snapshot import InterfaceSnapshot
+
+NUM_OF_COMMANDS: int = 500
+NUM_OF_PARSES_PER_THREAD: int = 20000
+NUMS_OF_THREADS: List[int] = [1, 2, 4, 8]
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    option_names: List[str] = [f'-option_{i}' for i in range(20)]
+    flag_names: List[str] = [f'--flag_{i}' for i in range(20)]
+
+    for i in range(NUM_OF_COMMANDS):
+        cli.add_command(f'command_{i}', f'Some command {i}', num_of_required_values=1, allowed_options=option_names,
+                        allowed_flags=flag_names)
+    for option_name in option_names:
+        cli.add_option(option_name, f'Some option {option_name}')
+    for flag_name in flag_names:
+        cli.add_flag(flag_name, f'Some flag {flag_name}')
+
+    return cli
+
+
+def measure_throughput(snapshot: InterfaceSnapshot, num_of_threads: int) -> float:
+    argv: List[str] = ['program.exe', f'command_{NUM_OF_COMMANDS - 1}', 'value', '-option_0', 'a', '-option_19', 'b',
+                       '--flag_0', '--flag_19']
+    barrier: threading.Barrier = threading.Barrier(num_of_threads + 1)
+
+    def parse_many() -> None:
+        barrier.wait()
+        for _ in range(NUM_OF_PARSES_PER_THREAD):
+            snapshot.parse(argv)
+
+    threads: List[threading.Thread] = [threading.Thread(target=parse_many) for _ in range(num_of_threads)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start_time: float = time.perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    return num_of_threads * NUM_OF_PARSES_PER_THREAD / (time.perf_counter() - start_time)
+
+
+if __name__ == '__main__':
+    is_gil_enabled: bool = getattr(sys, '_is_gil_enabled', lambda: True)()
+    snapshot: InterfaceSnapshot = create_cli().snapshot()
+    single_thread_throughput: float = measure_throughput(snapshot, 1)
+
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if is_gil_enabled else "disabled"}')
+
+    for num_of_threads in NUMS_OF_THREADS:
+        throughput: float = measure_throughput(snapshot, num_of_threads)
+        print(f'{num_of_threads} thread(s): {throughput:,.0f} parses/s '
+              f'({throughput / single_thread_throughput:.2f}x of single thread)')
+
+    if is_gil_enabled:
+        print('Throughput scales with number of threads only on free-threaded builds of CPython (3.13t or newer).')
@@ -0,0 +1,83 @@
+import csv
+import gc
+import io
+import sys
+import os
+import tracemalloc
+from typing import Callable, List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+
+NUM_OF_COMMANDS: int = 50000
+NUM_OF_OPTIONS: int = 20
+NUM_OF_FLAGS: int = 20
+NUM_OF_OPTION_SETS: int = 10
+
+OPTION_NAMES: List[str] = [f'-option_{i}' for i in range(NUM_OF_OPTIONS)]
+FLAG_NAMES: List[str] = [f'--flag_{i}' for i in range(NUM_OF_FLAGS)]
+
+
+def define_one_by_one() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+    # every command gets its own lists, as it happens when the definition is generated from some catalogue
+    for i in range(NUM_OF_COMMANDS):
+        option_set: int = i % NUM_OF_OPTION_SETS
+        cli.add_command(f'command_{i}', f'Some command {i}', 1, [], OPTION_NAMES[option_set:],
+                        FLAG_NAMES[option_set:], OPTION_NAMES[option_set:option_set + 1])
+    for option_name in OPTION_NAMES:
+        cli.add_option(option_name, f'Some option {option_name}')
+    for flag_name in FLAG_NAMES:
+        cli.add_flag(flag_name, f'Some flag {flag_name}')
+
+    return cli
+
+
+def define_from_csv(csv_text: str) -> Callable[[], CommandLineInterface]:
+    def define() -> CommandLineInterface:
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        cli.add_commands(csv.DictReader(io.StringIO(csv_text)))
+        cli.add_options((option_name, f'Some option {option_name}') for option_name in OPTION_NAMES)
+        cli.add_flags((flag_name, f'Some flag {flag_name}') for flag_name in FLAG_NAMES)
+
+        return cli
+
+    return define
+
+
+def get_csv_text() -> str:
+    stream: io.StringIO = io.StringIO()
+    writer: csv.writer = csv.writer(stream)
+
+    writer.writerow(['command_name', 'description', 'num_of_required_values', 'allowed_options', 'allowed_flags',
+                     'required_options'])
+    for i in range(NUM_OF_COMMANDS):
+        option_set: int = i % NUM_OF_OPTION_SETS
+        writer.writerow([f'command_{i}', f'Some command {i}', 1, ' '.join(OPTION_NAMES[option_set:]),
+                         ' '.join(FLAG_NAMES[option_set:]), OPTION_NAMES[option_set]])
+
+    return stream.getvalue()
+
+
+def measure(define: Callable[[], CommandLineInterface]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    cli: CommandLineInterface = define()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cli
+
+    return size
+
+
+if __name__ == '__main__':
+    csv_text: str = get_csv_text()
+
+    print(f'Memory retained by definition of {NUM_OF_COMMANDS} commands, {NUM_OF_OPTIONS} options and {NUM_OF_FLAGS} '
+          f'flags:')
+    for name, define in (('add_command() one by one', define_one_by_one),
+                         ('add_commands() from CSV', define_from_csv(csv_text))):
+        size: int = measure(define)
+        print(f'{name:<28}{size / 1024 / 1024:8.2f} MiB ({size / NUM_OF_COMMANDS:6.0f} B per command)')
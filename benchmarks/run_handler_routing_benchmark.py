@@ -0,0 +1,73 @@
+import sys
+import os
+import time
+from typing import Callable, List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus
+
+NUM_OF_FLAGS: int = 8
+NUM_OF_RUNS: int = 20000
+NUM_OF_REPETITIONS: int = 3
+
+FLAG_NAMES: List[str] = [f'--flag{i}' for i in range(NUM_OF_FLAGS)]
+
+
+class VariantCommandHandler(CommandHandlerInterface):
+    def __init__(self, variant: int):
+        self.variant: int = variant
+
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        return 0
+
+
+class BranchingCommandHandler(CommandHandlerInterface):
+    # the way handlers were written before: every run checks the flags until the matching variant is found
+    def __init__(self):
+        self.variants: List[VariantCommandHandler] = [VariantCommandHandler(i) for i in range(NUM_OF_FLAGS)]
+
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        for i in range(NUM_OF_FLAGS - 1, -1, -1):
+            if command.flags[FLAG_NAMES[i]] and all(not command.flags[FLAG_NAMES[j]] for j in range(i)):
+                return self.variants[i].run(command)
+
+        return 0
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], parse_cache_size=16)
+    cli.add_command('branching', 'Handler branching on flags', allowed_flags=FLAG_NAMES)
+    cli.add_command('routed', 'Handlers routed by flags', allowed_flags=FLAG_NAMES)
+    cli.add_flags((flag_name, f'Flag {flag_name}') for flag_name in FLAG_NAMES)
+    cli.add_command_handler('branching', BranchingCommandHandler())
+
+    for i in range(NUM_OF_FLAGS):
+        cli.add_routed_command_handler('routed', VariantCommandHandler(i), present_names=[FLAG_NAMES[i]],
+                                       absent_names=FLAG_NAMES[:i])
+
+    return cli
+
+
+def measure(function: Callable[[], None]) -> float:
+    best_duration: float = float('inf')
+
+    for _ in range(NUM_OF_REPETITIONS):
+        start_time: float = time.perf_counter()
+        for _ in range(NUM_OF_RUNS):
+            function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+if __name__ == '__main__':
+    cli: CommandLineInterface = create_cli()
+    argv_suffix: List[str] = [FLAG_NAMES[-1]]
+
+    print(f'Running {NUM_OF_RUNS} commands with {NUM_OF_FLAGS} handler variants (best of {NUM_OF_REPETITIONS}):')
+    print(f'Handler branching on flags:  '
+          f'{measure(lambda: cli.run(["program.exe", "branching"] + argv_suffix)) * 1000:10.2f} ms')
+    print(f'Handlers routed by table:    '
+          f'{measure(lambda: cli.run(["program.exe", "routed"] + argv_suffix)) * 1000:10.2f} ms')
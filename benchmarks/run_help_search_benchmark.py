@@ -0,0 +1,70 @@
+import contextlib
+import io
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from typing import Callable, List, Tuple
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+
+NUM_OF_COMMANDS: int = 5000
+NUM_OF_WORDS: int = 2000
+NUM_OF_WORDS_PER_DESCRIPTION: int = 8
+NUM_OF_REPETITIONS: int = 10
+
+randomizer: random.Random = random.Random(0)
+WORDS: List[str] = [''.join(randomizer.choices(string.ascii_lowercase, k=randomizer.randint(3, 10)))
+                    for _ in range(NUM_OF_WORDS)]
+DESCRIPTIONS: List[str] = [' '.join(randomizer.choices(WORDS, k=NUM_OF_WORDS_PER_DESCRIPTION)).capitalize()
+                           for _ in range(NUM_OF_COMMANDS)]
+SEARCH_TERMS: List[str] = [WORDS[7], WORDS[42]]
+
+
+def create_cli(help_index_path: str = '') -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], help_index_path=help_index_path)
+    cli.add_commands((f'command{i}', DESCRIPTIONS[i], 0, [], [], []) for i in range(NUM_OF_COMMANDS))
+
+    return cli
+
+
+def print_help(help_index_path: str, search_terms: List[str]) -> float:
+    # stands for a new process, which defines the interface and prints the help once, only printing is measured
+    cli: CommandLineInterface = create_cli(help_index_path)
+    argv: List[str] = ['program.exe', 'help', '--search', *search_terms] if search_terms else ['program.exe', 'help']
+    start_time: float = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        cli.parse(argv)
+
+    return time.perf_counter() - start_time
+
+
+def build_and_store(help_index_path: str) -> float:
+    if os.path.isfile(help_index_path):
+        os.remove(help_index_path)
+
+    return print_help(help_index_path, SEARCH_TERMS)
+
+
+def measure(function: Callable[[], float]) -> float:
+    return min(function() for _ in range(NUM_OF_REPETITIONS))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        index_path: str = os.path.join(directory, 'help_index.json')
+        measurements: List[Tuple[str, Callable[[], float]]] = [
+            ('Full help:', lambda: print_help('', [])),
+            ('Search, index built in memory:', lambda: print_help('', SEARCH_TERMS)),
+            ('Search, index built and stored:', lambda: build_and_store(index_path)),
+            ('Search, stored index loaded:', lambda: print_help(index_path, SEARCH_TERMS)),
+        ]
+
+        print(f'Printing help of {NUM_OF_COMMANDS} commands, searched for "{" ".join(SEARCH_TERMS)}" '
+              f'(best of {NUM_OF_REPETITIONS}):')
+
+        for label, function in measurements:
+            print(f'{label:<35}{measure(function) * 1000:10.2f} ms')
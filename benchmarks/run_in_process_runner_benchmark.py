@@ -0,0 +1,63 @@
+import sys
+import os
+import subprocess
+import time
+from typing import List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.in_process_runner import InProcessRunner
+from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus
+
+NUM_OF_CASES: int = 200
+PROGRAM_INDICATOR: str = '--as-program'
+
+
+class EchoCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        print(' '.join(command.values))
+
+        return 0
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(sys.argv)
+    cli.add_command('echo', 'Prints its values', 2)
+    cli.add_command_handler('echo', EchoCommandHandler())
+
+    return cli
+
+
+def get_cases() -> List[List[str]]:
+    return [['program.exe', 'echo', 'case', str(i)] if i % 10 else ['program.exe', 'ehco', 'case', str(i)]
+            for i in range(NUM_OF_CASES)]
+
+
+def run_in_subprocesses() -> None:
+    for argv in get_cases():
+        subprocess.run([sys.executable, __file__, PROGRAM_INDICATOR] + argv[1:], capture_output=True, text=True)
+
+
+if __name__ == '__main__' and len(sys.argv) > 1 and sys.argv[1] == PROGRAM_INDICATOR:
+    del sys.argv[1]
+
+    try:
+        sys.exit(create_cli().run())
+    except Exception as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+elif __name__ == '__main__':
+    print(f'Running {NUM_OF_CASES} test cases (one in ten failing):')
+
+    start_time: float = time.perf_counter()
+    run_in_subprocesses()
+    print(f'Subprocess per case:          {(time.perf_counter() - start_time) * 1000:10.2f} ms')
+
+    start_time = time.perf_counter()
+    InProcessRunner(create_cli, max_workers=1).run_all(get_cases())
+    print(f'In process:                   {(time.perf_counter() - start_time) * 1000:10.2f} ms')
+
+    start_time = time.perf_counter()
+    InProcessRunner(create_cli).run_all(get_cases())
+    print(f'In pool of {os.cpu_count() or 1} worker processes: {(time.perf_counter() - start_time) * 1000:10.2f} ms')
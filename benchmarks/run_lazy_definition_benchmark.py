@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+from typing import Callable, List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+
+NUM_OF_SHARDS: int = 200
+NUM_OF_COMMANDS_PER_SHARD: int = 5
+NUM_OF_OPTIONS_PER_SHARD: int = 20
+NUM_OF_REPETITIONS: int = 5
+
+
+def get_command_names(shard_index: int) -> List[str]:
+    return [f'command{shard_index}x{i}' for i in range(NUM_OF_COMMANDS_PER_SHARD)]
+
+
+def define_shard(cli: CommandLineInterface, shard_index: int) -> None:
+    # stands for a module of the definition executed at startup
+    option_names: List[str] = [f'-shard{shard_index}option{i}' for i in range(NUM_OF_OPTIONS_PER_SHARD)]
+    flag_names: List[str] = [f'--shard{shard_index}flag{i}' for i in range(NUM_OF_OPTIONS_PER_SHARD)]
+
+    cli.add_options((option_name, f'Option {option_name}', ['1', '2', '3']) for option_name in option_names)
+    cli.add_flags((flag_name, f'Flag {flag_name}') for flag_name in flag_names)
+    cli.add_commands((command_name, f'Command {command_name}', 1, [], option_names, flag_names)
+                     for command_name in get_command_names(shard_index))
+
+
+def start_eagerly(argv: List[str]) -> None:
+    cli: CommandLineInterface = CommandLineInterface(argv)
+
+    for shard_index in range(NUM_OF_SHARDS):
+        define_shard(cli, shard_index)
+
+    cli.parse(argv)
+
+
+def start_lazily(argv: List[str]) -> None:
+    cli: CommandLineInterface = CommandLineInterface(argv)
+
+    for shard_index in range(NUM_OF_SHARDS):
+        cli.add_lazy_commands(((command_name, f'Command {command_name}')
+                               for command_name in get_command_names(shard_index)),
+                              lambda loaded_cli, index=shard_index: define_shard(loaded_cli, index))
+
+    cli.parse(argv)
+
+
+def measure(function: Callable[[], None]) -> float:
+    best_duration: float = float('inf')
+
+    for _ in range(NUM_OF_REPETITIONS):
+        start_time: float = time.perf_counter()
+        function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+if __name__ == '__main__':
+    argv: List[str] = ['program.exe', 'command7x3', 'value', '-shard7option1', '2', '--shard7flag4']
+
+    print(f'Defining {NUM_OF_SHARDS * NUM_OF_COMMANDS_PER_SHARD} commands in {NUM_OF_SHARDS} shards and parsing one of '
+          f'them (best of {NUM_OF_REPETITIONS}):')
+    print(f'All shards defined at startup: {measure(lambda: start_eagerly(argv)) * 1000:10.2f} ms')
+    print(f'Only invoked shard loaded:     {measure(lambda: start_lazily(argv)) * 1000:10.2f} ms')
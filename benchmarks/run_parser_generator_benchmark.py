@@ -0,0 +1,61 @@
+import sys
+import os
+import importlib
+import tempfile
+import timeit
+from typing import List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+from comlint.parser_generator import ParserGenerator
+
+NUM_OF_COMMANDS: int = 2000
+NUM_OF_OPTIONS: int = 50
+NUM_OF_FLAGS: int = 50
+NUM_OF_PARSES: int = 50000
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    option_names: List[str] = [f'-option_{i}' for i in range(NUM_OF_OPTIONS)]
+    flag_names: List[str] = [f'--flag_{i}' for i in range(NUM_OF_FLAGS)]
+
+    for i in range(NUM_OF_COMMANDS):
+        cli.add_command(f'command_{i}', f'Some command {i}', num_of_required_values=2,
+                        allowed_values=[f'value_{j}' for j in range(20)], allowed_options=option_names,
+                        allowed_flags=flag_names, required_options=option_names[:2])
+    for option_name in option_names:
+        cli.add_option(option_name, f'Some option {option_name}')
+    for flag_name in flag_names:
+        cli.add_flag(flag_name, f'Some flag {flag_name}')
+
+    return cli
+
+
+if __name__ == '__main__':
+    cli: CommandLineInterface = create_cli()
+    argv: List[str] = ['program.exe', f'command_{NUM_OF_COMMANDS - 1}', 'value_19', 'value_3', '-option_0', 'a', '-option_1', 'b',
+            '-option_49', 'c', '--flag_0', '--flag_49']
+
+    with tempfile.TemporaryDirectory() as module_directory:
+        generation_time: float = timeit.timeit(lambda: ParserGenerator.write(cli, os.path.join(module_directory,
+                                                                                               'generated_parser.py')),
+                                               number=1)
+        sys.path.insert(0, module_directory)
+        sys.dont_write_bytecode = False
+        import_time: float = timeit.timeit(lambda: importlib.import_module('generated_parser'), number=1)
+        del sys.modules['generated_parser']
+        cached_import_time: float = timeit.timeit(lambda: importlib.import_module('generated_parser'), number=1)
+        generated_parser = importlib.import_module('generated_parser')
+
+        assert generated_parser.parse(argv) == cli.parse(argv)
+
+        generic_time: float = timeit.timeit(lambda: cli.parse(argv), number=NUM_OF_PARSES)
+        generated_time: float = timeit.timeit(lambda: generated_parser.parse(argv), number=NUM_OF_PARSES)
+
+    print(f'Interface: {NUM_OF_COMMANDS} commands, {NUM_OF_OPTIONS} options, {NUM_OF_FLAGS} flags')
+    print(f'Module generation time:            {generation_time * 1000:.1f} ms')
+    print(f'Generated module import time:      {import_time * 1000:.1f} ms (compiling bytecode)')
+    print(f'Generated module import time:      {cached_import_time * 1000:.1f} ms (cached bytecode)')
+    print(f'Generic parse():                   {generic_time / NUM_OF_PARSES * 1e6:.2f} us per command line')
+    print(f'Generated parse():                 {generated_time / NUM_OF_PARSES * 1e6:.2f} us per command line')
+    print(f'Speedup:                           {generic_time / generated_time:.1f}x')
@@ -0,0 +1,62 @@
+import sys
+import os
+import tempfile
+import time
+from typing import List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+from comlint.plugin_loader import PluginLoader
+
+PLUGIN_GROUP: str = 'comlint_benchmark.plugins'
+NUMS_OF_PLUGINS: List[int] = [10, 100, 500]
+PLUGIN_SOURCE: str = '''
+import json
+import xml.dom.minidom
+from comlint.command_plugin_interface import CommandPluginInterface
+
+
+class Plugin(CommandPluginInterface):
+    def get_commands(self):
+        return [('{command_name}', 'Command contributed by plugin {index}', 0)]
+
+    def get_command_handler(self, command_name):
+        return None
+'''
+
+
+def create_plugins(directory: str, num_of_plugins: int) -> None:
+    for index in range(num_of_plugins):
+        module_name: str = f'comlint_benchmark_plugin_{num_of_plugins}_{index}'
+        dist_info_path: str = os.path.join(directory, f'{module_name}-1.0.dist-info')
+        os.mkdir(dist_info_path)
+
+        with open(os.path.join(dist_info_path, 'METADATA'), 'w', encoding='utf-8') as metadata_file:
+            metadata_file.write(f'Metadata-Version: 2.1\nName: {module_name}\nVersion: 1.0\n')
+        with open(os.path.join(dist_info_path, 'entry_points.txt'), 'w', encoding='utf-8') as entry_points_file:
+            entry_points_file.write(f'[{PLUGIN_GROUP}]\nplugin_{index} = {module_name}:Plugin\n')
+        with open(os.path.join(directory, f'{module_name}.py'), 'w', encoding='utf-8') as module_file:
+            module_file.write(PLUGIN_SOURCE.format(command_name=f'command_{index}', index=index))
+
+
+def measure_load(manifest_path: str) -> float:
+    start_time: float = time.perf_counter()
+    PluginLoader(manifest_path, PLUGIN_GROUP).load(CommandLineInterface(['program.exe']))
+
+    return time.perf_counter() - start_time
+
+
+if __name__ == '__main__':
+    print('Loading plugins (first load imports all plugins and writes the manifest):')
+
+    for num_of_plugins in NUMS_OF_PLUGINS:
+        with tempfile.TemporaryDirectory() as directory:
+            create_plugins(directory, num_of_plugins)
+            sys.path.insert(0, directory)
+            manifest_path: str = os.path.join(directory, 'plugins.json')
+
+            cold_duration: float = measure_load(manifest_path)
+            warm_duration: float = measure_load(manifest_path)
+            sys.path.remove(directory)
+
+        print(f'{num_of_plugins:5} plugins - first load: {cold_duration * 1000:10.2f} ms, '
+              f'cached manifest: {warm_duration * 1000:10.2f} ms')
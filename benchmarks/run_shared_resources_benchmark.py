@@ -0,0 +1,86 @@
+import sys
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Callable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus
+
+NUM_OF_ROWS: int = 1000
+NUM_OF_RUNS: int = 2000
+NUM_OF_REPETITIONS: int = 3
+QUERY: str = 'SELECT value FROM items WHERE id = ?'
+
+
+class OwnConnectionCommandHandler(CommandHandlerInterface):
+    # the way handlers were written before: every run opens and closes its own connection
+    def __init__(self, database_path: str):
+        self.database_path: str = database_path
+
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        connection: sqlite3.Connection = sqlite3.connect(self.database_path)
+
+        try:
+            connection.execute(QUERY, (int(command.values[0]),)).fetchone()
+        finally:
+            connection.close()
+
+        return 0
+
+
+class SharedConnectionCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        with command.resources.acquire('database') as connection:
+            connection.execute(QUERY, (int(command.values[0]),)).fetchone()
+
+        return 0
+
+
+def create_database(database_path: str) -> None:
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    connection.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)')
+    connection.executemany('INSERT INTO items VALUES (?, ?)', ((i, f'value {i}') for i in range(NUM_OF_ROWS)))
+    connection.commit()
+    connection.close()
+
+
+def create_cli(database_path: str) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], parse_cache_size=16)
+    cli.add_command('own', 'Queries with its own connection', 1)
+    cli.add_command('shared', 'Queries with a shared connection', 1)
+    cli.add_command_handler('own', OwnConnectionCommandHandler(database_path))
+    cli.add_command_handler('shared', SharedConnectionCommandHandler())
+    cli.resources.register('database', lambda resources: sqlite3.connect(database_path, check_same_thread=False),
+                           pool_size=4)
+
+    return cli
+
+
+def measure(function: Callable[[], None]) -> float:
+    best_duration: float = float('inf')
+
+    for _ in range(NUM_OF_REPETITIONS):
+        start_time: float = time.perf_counter()
+        for _ in range(NUM_OF_RUNS):
+            function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        database_path: str = os.path.join(directory, 'benchmark.db')
+        create_database(database_path)
+        cli: CommandLineInterface = create_cli(database_path)
+
+        with cli.resources:
+            print(f'Running {NUM_OF_RUNS} queries (best of {NUM_OF_REPETITIONS}):')
+            print(f'Connection opened by every run: '
+                  f'{measure(lambda: cli.run(["program.exe", "own", "42"])) * 1000:10.2f} ms')
+            print(f'Connection from the context:    '
+                  f'{measure(lambda: cli.run(["program.exe", "shared", "42"])) * 1000:10.2f} ms')
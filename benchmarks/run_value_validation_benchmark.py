@@ -0,0 +1,59 @@
+import sys
+import os
+import time
+from typing import Callable, List
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.unsupported_command_value import UnsupportedCommandValue
+
+NUM_OF_VALUES: int = 20000
+NUM_OF_ALLOWED_VALUES: int = 20000
+NUM_OF_REPETITIONS: int = 3
+
+ALLOWED_VALUES: List[str] = [f'package_{i}' for i in range(NUM_OF_ALLOWED_VALUES)]
+VALUES: List[str] = [f'package_{(i * 7919) % NUM_OF_ALLOWED_VALUES}' for i in range(NUM_OF_VALUES)]
+
+
+def validate_one_by_one(values: List[str], allowed_values: List[str]) -> None:
+    # the way values were validated before: every value is searched in the list of allowed values
+    for value in values:
+        if value not in allowed_values:
+            raise UnsupportedCommandValue(token=value)
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    cli.add_command('install', 'Install packages', num_of_required_values=NUM_OF_VALUES, allowed_values=ALLOWED_VALUES)
+
+    return cli
+
+
+def measure(function: Callable[[], None]) -> float:
+    best_duration: float = float('inf')
+
+    for _ in range(NUM_OF_REPETITIONS):
+        start_time: float = time.perf_counter()
+        function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+def parse_invalid(cli: CommandLineInterface, argv: List[str]) -> None:
+    try:
+        cli.parse(argv)
+    except UnsupportedCommandValue:
+        pass
+
+
+if __name__ == '__main__':
+    cli: CommandLineInterface = create_cli()
+    argv: List[str] = ['program.exe', 'install'] + VALUES
+    invalid_argv: List[str] = argv[:-1] + ['unknown_package']
+
+    print(f'Validating {NUM_OF_VALUES} command values against {NUM_OF_ALLOWED_VALUES} allowed values '
+          f'(best of {NUM_OF_REPETITIONS}):')
+    print(f'Value by value in list:             '
+          f'{measure(lambda: validate_one_by_one(VALUES, ALLOWED_VALUES)) * 1000:10.2f} ms')
+    print(f'cli.parse() with valid values:      {measure(lambda: cli.parse(argv)) * 1000:10.2f} ms')
+    print(f'cli.parse() with one invalid value: {measure(lambda: parse_invalid(cli, invalid_argv)) * 1000:10.2f} ms')
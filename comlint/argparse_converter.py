@@ -0,0 +1,146 @@
+import argparse
+from typing import Dict, List, Optional, Tuple
+from comlint.command_line_interface import CommandLineInterface
+from comlint.constraint_type import ConstraintType
+from comlint.interface_validator import OPTION_PREFIX, FLAG_PREFIX
+from comlint.types import CommandName, OptionName, FlagName, OptionNames, FlagNames
+
+ArgparseNames = Tuple[OptionNames, FlagNames]
+
+SKIPPED_ACTION_TYPES: Tuple[type, ...] = (argparse._HelpAction, argparse._VersionAction)
+NUM_OF_VALUES_BY_NARGS: Dict[Optional[str], int] = {None: 1, argparse.OPTIONAL: 0, argparse.ZERO_OR_MORE: 0,
+                                                    argparse.ONE_OR_MORE: 1, argparse.REMAINDER: 0}
+
+
+class ArgparseConverter:
+    """
+    Converter of argparse.ArgumentParser definitions into equivalent command line interfaces, e.g. to migrate an
+    existing tool or to compare both libraries on the same interface. Elements are mapped as follows:
+        - subparsers - commands, with aliases of subparsers added as aliases of the commands
+        - positional arguments of subparsers - command values, where "?", "*" and argparse.REMAINDER require no value,
+                                               "+" requires one value and choices of the only positional argument
+                                               become allowed values of the command
+        - optional arguments taking values - options named after their single dash option string (or after the double
+                                             dash one with one dash removed, e.g. "--level" becomes "-level"), with
+                                             choices as allowed values and required ones as required options
+        - optional arguments taking no values (e.g. store_true or count) - flags named after their double dash option
+                                                                           string (or after the single dash one with a
+                                                                           dash added)
+        - mutually exclusive groups - MUTUALLY_EXCLUSIVE constraints, together with AT_LEAST_ONE ones if the group is
+                                      required
+    Because of the renaming, command lines accepted by argparse are not always accepted unchanged, e.g. "--level 3"
+    has to be given as "-level 3". Optional arguments and mutually exclusive groups of the main parser are allowed and
+    checked for every command. Options and flags defined by many subparsers are added once, with the description and
+    allowed values of the first definition. Help and version actions are skipped, because help is provided by comlint
+    itself.
+    """
+    @staticmethod
+    def convert(parser: argparse.ArgumentParser, argv: List[str] = None) -> CommandLineInterface:
+        cli: CommandLineInterface = CommandLineInterface(argv if argv is not None else [parser.prog],
+                                                         program_name=parser.prog,
+                                                         description=parser.description or '')
+        option_rows: Dict[OptionName, tuple] = {}
+        flag_rows: Dict[FlagName, tuple] = {}
+        command_rows: List[tuple] = []
+        aliases: List[Tuple[str, CommandName]] = []
+        constraints: List[Tuple[CommandName, ConstraintType, List[str]]] = []
+        global_names: ArgparseNames = ArgparseConverter.__add_optionals(parser, option_rows, flag_rows)
+        global_constraints: List[Tuple[ConstraintType, List[str]]] = ArgparseConverter.__get_constraints(parser)
+
+        for subparsers_action in ArgparseConverter.__get_subparsers_actions(parser):
+            descriptions: Dict[CommandName, str] = {choice_action.dest: choice_action.help or ''
+                                                    for choice_action in subparsers_action._choices_actions}
+            command_names: Dict[int, CommandName] = {}
+
+            for name, subparser in subparsers_action.choices.items():
+                if id(subparser) in command_names:
+                    aliases.append((name, command_names[id(subparser)]))
+                    continue
+
+                command_names[id(subparser)] = name
+                allowed_options, allowed_flags = ArgparseConverter.__add_optionals(subparser, option_rows, flag_rows)
+                positionals: List[argparse.Action] = [action for action in subparser._actions
+                                                      if not action.option_strings and
+                                                      not isinstance(action, argparse._SubParsersAction)]
+                required_options: OptionNames = [ArgparseConverter.__get_option_name(action)
+                                                 for action in subparser._actions
+                                                 if action.required and action.option_strings and action.nargs != 0]
+
+                command_rows.append((name, descriptions.get(name) or subparser.description or '',
+                                     sum(NUM_OF_VALUES_BY_NARGS.get(action.nargs, action.nargs)
+                                         for action in positionals),
+                                     [str(choice) for choice in positionals[0].choices]
+                                     if len(positionals) == 1 and positionals[0].choices else None,
+                                     list(dict.fromkeys(global_names[0] + allowed_options)),
+                                     list(dict.fromkeys(global_names[1] + allowed_flags)),
+                                     required_options))
+                constraints += [(name, constraint_type, names) for constraint_type, names in
+                                global_constraints + ArgparseConverter.__get_constraints(subparser)]
+
+        cli.add_options(option_rows.values())
+        cli.add_flags(flag_rows.values())
+        cli.add_commands(command_rows)
+
+        for alias, command_name in aliases:
+            cli.add_alias(alias, command_name)
+        for command_name, constraint_type, names in constraints:
+            cli.add_constraint(command_name, constraint_type, names)
+
+        return cli
+
+    @staticmethod
+    def __get_subparsers_actions(parser: argparse.ArgumentParser) -> List[argparse._SubParsersAction]:
+        return [action for action in parser._actions if isinstance(action, argparse._SubParsersAction)]
+
+    @staticmethod
+    def __add_optionals(parser: argparse.ArgumentParser, option_rows: Dict[OptionName, tuple],
+                        flag_rows: Dict[FlagName, tuple]) -> ArgparseNames:
+        option_names: OptionNames = []
+        flag_names: FlagNames = []
+
+        for action in parser._actions:
+            if not action.option_strings or isinstance(action, SKIPPED_ACTION_TYPES):
+                continue
+
+            if action.nargs == 0:
+                flag_name: FlagName = ArgparseConverter.__get_flag_name(action)
+                flag_rows.setdefault(flag_name, (flag_name, action.help or ''))
+                flag_names.append(flag_name)
+            else:
+                option_name: OptionName = ArgparseConverter.__get_option_name(action)
+                option_rows.setdefault(option_name, (option_name, action.help or '',
+                                                     [str(choice) for choice in action.choices or []]))
+                option_names.append(option_name)
+
+        return option_names, flag_names
+
+    @staticmethod
+    def __get_constraints(parser: argparse.ArgumentParser) -> List[Tuple[ConstraintType, List[str]]]:
+        constraints: List[Tuple[ConstraintType, List[str]]] = []
+
+        for group in parser._mutually_exclusive_groups:
+            names: List[str] = [ArgparseConverter.__get_flag_name(action) if action.nargs == 0 else
+                                ArgparseConverter.__get_option_name(action) for action in group._group_actions]
+
+            if len(names) > 1:
+                constraints.append((ConstraintType.MUTUALLY_EXCLUSIVE, names))
+            if group.required:
+                constraints.append((ConstraintType.AT_LEAST_ONE, names))
+
+        return constraints
+
+    @staticmethod
+    def __get_option_name(action: argparse.Action) -> OptionName:
+        for option_string in action.option_strings:
+            if option_string[:2] != FLAG_PREFIX:
+                return option_string
+
+        return action.option_strings[0][1:]
+
+    @staticmethod
+    def __get_flag_name(action: argparse.Action) -> FlagName:
+        for option_string in action.option_strings:
+            if option_string[:2] == FLAG_PREFIX:
+                return option_string
+
+        return OPTION_PREFIX + action.option_strings[0]
@@ -1,8 +1,10 @@
 from abc import abstractmethod
+from typing import Any, Iterable, Optional, Union
 from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus
 
 
 class CommandHandlerInterface:
     @abstractmethod
-    def run(self, command: ParsedCommand) -> None:
+    def run(self, command: ParsedCommand) -> Optional[Union[ExitStatus, Iterable[Any]]]:
         pass
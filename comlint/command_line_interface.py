@@ -1,8 +1,20 @@
-from typing import List
-import comlint.utils as utils
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_token import CommandLineToken
 from comlint.command_line_element_type import CommandLineElementType
 from comlint.command_properties import CommandProperties
+from comlint.constraint import Constraint
+from comlint.constraint_checker import ConstraintChecker
+from comlint.constraint_type import ConstraintType
+from comlint.definition_interner import DefinitionInterner
+from comlint.definition_shard import DefinitionShard, ShardLoader
+from comlint.definition_row_parser import DefinitionRowParser, DefinitionRow
+from comlint.exceptions.ambiguous_abbreviation import AmbiguousAbbreviation
+from comlint.exceptions.comlint_error import NO_POSITION
 from comlint.exceptions.duplicated_command import DuplicatedCommand
 from comlint.exceptions.duplicated_flag import DuplicatedFlag
 from comlint.exceptions.duplicated_option import DuplicatedOption
@@ -11,26 +23,49 @@ from comlint.exceptions.forbidden_option import ForbiddenOption
 from comlint.exceptions.forbidden_option_value import ForbiddenOptionValue
 from comlint.exceptions.invalid_command_name import InvalidCommandName
 from comlint.exceptions.invalid_command_position import InvalidCommandPosition
+from comlint.exceptions.invalid_constraint import InvalidConstraint
+from comlint.exceptions.invalid_definition_shard import InvalidDefinitionShard
 from comlint.exceptions.invalid_flag_name import InvalidFlagName
+from comlint.exceptions.invalid_handler_route import InvalidHandlerRoute
 from comlint.exceptions.invalid_option_name import InvalidOptionName
 from comlint.exceptions.missing_command_handler import MissingCommandHandler
 from comlint.exceptions.missing_command_value import MissingCommandValue
+from comlint.exceptions.missing_file import MissingFile
 from comlint.exceptions.missing_option_value import MissingOptionValue
 from comlint.exceptions.missing_required_option import MissingRequiredOption
+from comlint.exceptions.undefined_reference import UndefinedReference
 from comlint.exceptions.unsupported_command import UnsupportedCommand
 from comlint.exceptions.unsupported_command_value import UnsupportedCommandValue
 from comlint.exceptions.unsupported_flag import UnsupportedFlag
 from comlint.exceptions.unsupported_option import UnsupportedOption
 from comlint.flag_properties import FlagProperties
+from comlint.handler_route import HandlerRoute
+from comlint.handler_router import HandlerRouter
+from comlint.handler_profiler import HandlerProfiler
+from comlint.help_index import HelpIndex
 from comlint.interface_helper import Commands, Options, Flags, InterfaceHelper
+from comlint.interface_snapshot import InterfaceSnapshot
 from comlint.interface_validator import InterfaceValidator
-from comlint.option_properties import OptionProperties
+from comlint.invocation_journal import InvocationJournal
+from comlint.journal_record import JournalRecord
+from comlint.mapped_file import MappedFile
+from comlint.option_properties import OptionProperties, DEFAULT_OPTION_VALUE
+from comlint.parse_cache import ParseCache, ParseCacheKey
 from comlint.parsed_command import ParsedCommand
+from comlint.prefix_trie import PrefixTrie, AMBIGUOUS_TARGET
+from comlint.record_writer import RecordWriter
+from comlint.resource_context import ResourceContext
+from comlint.result_cache_interface import ResultCacheInterface, ResultCacheKey, ResultCacheEntry
+from comlint.tokenizer import Tokenizer
+from comlint.value_type import ValueType
 from comlint.types import CommandValues, ANY, OptionNames, NONE, FlagNames, OptionName, OptionValues, OptionValue, \
-    FlagName, CommandName, OptionsMap, FlagsMap, CommandValue
+    FlagName, CommandName, OptionsMap, FlagsMap, CommandValue, ExitStatus, SUCCESS, FAILURE, CommandNames
 
-DEFAULT_OPTION_VALUE: OptionValue = ''
 HELP_COMMAND_INDICATOR: str = 'help'
+MIN_NUM_OF_CONSTRAINT_NAMES: int = 2
+DEFAULT_CHAIN_DELIMITER: str = '+'
+
+ChainSegment = Tuple[List[str], ParsedCommand, float, float]
 
 
 class CommandLineInterface:
@@ -62,72 +97,351 @@ class CommandLineInterface:
                  Example of usage of command with a single flag, where "pull" is a command name and "--rebase" is a flag:
                                           git pull --rebase
     """
-    def __init__(self, argv: List[str], program_name: str = '', description: str = '', allow_no_arguments: bool = True):
+    def __init__(self, argv: List[str], program_name: str = '', description: str = '', allow_no_arguments: bool = True,
+                 parse_cache_size: int = 0, help_index_path: str = '', suggestions_enabled: bool = True,
+                 journal: InvocationJournal = None, abbreviations_enabled: bool = False,
+                 resources: ResourceContext = None):
         self.__argv: List[str] = argv
         self.__program_name: str = program_name if program_name else argv[0]
         self.__description: str = description
         self.__allow_no_arguments: bool = allow_no_arguments
+        self.__suggestions_enabled: bool = suggestions_enabled
+        self.__journal: Optional[InvocationJournal] = journal
+        self.__abbreviations_enabled: bool = abbreviations_enabled
+        self.__profiler: Optional[HandlerProfiler] = HandlerProfiler.from_environment()
+        self.__help_index_path: str = help_index_path
         self.__interface_commands: Commands = {}
         self.__interface_options: Options = {}
         self.__interface_flags: Flags = {}
+        self.__aliases: Dict[str, str] = {}
+        self.__name_trie: Optional[PrefixTrie] = None
+        self.__shards: Dict[CommandName, DefinitionShard] = {}
+        self.__loading_command_names: Set[CommandName] = set()
+        self.__interner: DefinitionInterner = DefinitionInterner()
+        self.parse_cache: ParseCache = ParseCache(parse_cache_size)
+        self.resources: ResourceContext = resources if resources is not None else ResourceContext()
+        self.__help_index: HelpIndex = HelpIndex(self.__interface_commands, self.__interface_options,
+                                                 self.__interface_flags, help_index_path)
 
     def add_command(self, command_name: str, description: str, num_of_required_values: int = 0,
                     allowed_values: CommandValues = ANY, allowed_options: OptionNames = NONE,
-                    allowed_flags: FlagNames = NONE, required_options: OptionNames = NONE) -> None:
+                    allowed_flags: FlagNames = NONE, required_options: OptionNames = NONE,
+                    value_type: ValueType = ValueType.TEXT) -> None:
         if not InterfaceValidator.is_command_name_valid(command_name):
-            raise InvalidCommandName(f'Unable to add {command_name} command! Name of the command is invalid.')
-        if command_name in self.__interface_commands.keys():
-            raise DuplicatedCommand(f'Unable to add {command_name} command! Command with the same name is already added.')
-
-        self.__interface_commands[command_name] = CommandProperties(allowed_values, allowed_options, allowed_flags,
-                                                                    description, num_of_required_values, required_options)
-
-    def add_option(self, option_name: OptionName, description: str, allowed_values: OptionValues = ANY) -> None:
+            raise InvalidCommandName(token=command_name)
+        if command_name in self.__interface_commands.keys() and command_name not in self.__loading_command_names:
+            raise DuplicatedCommand(token=command_name)
+
+        self.__loading_command_names.discard(command_name)
+        self.parse_cache.clear()
+        self.__help_index.invalidate()
+        self.__name_trie = None
+        self.__interface_commands[command_name] = self.__intern_command(CommandProperties(
+            allowed_values, allowed_options, allowed_flags, description, num_of_required_values, required_options,
+            value_type))
+
+    def add_option(self, option_name: OptionName, description: str, allowed_values: OptionValues = ANY,
+                   value_type: ValueType = ValueType.TEXT) -> None:
         if not InterfaceValidator.is_option_name_valid(option_name):
-            raise InvalidOptionName(f'Unable to add {option_name} option! Name of the option is invalid.')
+            raise InvalidOptionName(token=option_name)
         if option_name in self.__interface_options.keys():
-            raise DuplicatedOption(f'Unable to add {option_name} option! Option with the same name is already added.')
+            raise DuplicatedOption(token=option_name)
 
+        self.parse_cache.clear()
+        self.__help_index.invalidate()
+        self.__name_trie = None
         # TODO: implement handling of user defined default option value
-        self.__interface_options[option_name] = OptionProperties(description, allowed_values, DEFAULT_OPTION_VALUE)
+        self.__interface_options[option_name] = self.__intern_option(OptionProperties(description, allowed_values,
+                                                                                      DEFAULT_OPTION_VALUE, value_type))
 
     def add_flag(self, flag_name: FlagName, description: str) -> None:
         if not InterfaceValidator.is_flag_name_valid(flag_name):
-            raise InvalidFlagName(f'Unable to add {flag_name} flag! Name of the flag is invalid.')
+            raise InvalidFlagName(token=flag_name)
         if flag_name in self.__interface_flags.keys():
-            raise DuplicatedFlag(f'Unable to add {flag_name} flag! Flag with the same name is already added.')
+            raise DuplicatedFlag(token=flag_name)
 
+        self.parse_cache.clear()
+        self.__help_index.invalidate()
+        self.__name_trie = None
         self.__interface_flags[flag_name] = FlagProperties(description)
 
-    def parse(self) -> ParsedCommand:
-        if InterfaceHelper.is_help_required(self.__argv, self.__allow_no_arguments):
-            print(f'{InterfaceHelper.get_help(self.__program_name, self.__description, self.__interface_commands, self.__interface_options, self.__interface_flags)}')
+    def add_commands(self, rows: Iterable[DefinitionRow]) -> None:
+        # placeholders of commands whose shard is being loaded are replaced instead of being reported as duplicates
+        defined_commands: Commands = self.__interface_commands if not self.__loading_command_names else \
+            {name: properties for name, properties in self.__interface_commands.items()
+             if name not in self.__loading_command_names}
+        commands: Dict[CommandName, CommandProperties] = CommandLineInterface.__get_definitions(
+            rows, DefinitionRowParser.get_command, InterfaceValidator.is_command_name_valid, defined_commands,
+            InvalidCommandName, DuplicatedCommand)
+
+        self.__loading_command_names.difference_update(commands.keys())
+        self.parse_cache.clear()
+        self.__help_index.invalidate()
+        self.__name_trie = None
+        self.__interface_commands.update((command_name, self.__intern_command(command_properties))
+                                         for command_name, command_properties in commands.items())
+
+    def add_options(self, rows: Iterable[DefinitionRow]) -> None:
+        options: Dict[OptionName, OptionProperties] = CommandLineInterface.__get_definitions(
+            rows, DefinitionRowParser.get_option, InterfaceValidator.is_option_name_valid, self.__interface_options,
+            InvalidOptionName, DuplicatedOption)
+
+        self.parse_cache.clear()
+        self.__help_index.invalidate()
+        self.__name_trie = None
+        self.__interface_options.update((option_name, self.__intern_option(option_properties))
+                                        for option_name, option_properties in options.items())
+
+    def add_flags(self, rows: Iterable[DefinitionRow]) -> None:
+        flags: Dict[FlagName, FlagProperties] = CommandLineInterface.__get_definitions(
+            rows, DefinitionRowParser.get_flag, InterfaceValidator.is_flag_name_valid, self.__interface_flags,
+            InvalidFlagName, DuplicatedFlag)
+
+        self.parse_cache.clear()
+        self.__help_index.invalidate()
+        self.__name_trie = None
+        self.__interface_flags.update(flags)
+
+    def add_lazy_commands(self, rows: Iterable[Tuple[CommandName, str]], loader: Union[ShardLoader, str]) -> None:
+        descriptions: Dict[CommandName, str] = CommandLineInterface.__get_definitions(
+            rows, tuple, InterfaceValidator.is_command_name_valid, self.__interface_commands, InvalidCommandName,
+            DuplicatedCommand)
+        shard: DefinitionShard = DefinitionShard(self.__interner.intern(descriptions.keys()), loader)
+
+        self.parse_cache.clear()
+        self.__help_index.invalidate()
+        self.__name_trie = None
+
+        # until the shard is loaded, its commands are known only by name and description, which is enough for the
+        # help, suggestions and abbreviations
+        for command_name, description in descriptions.items():
+            self.__interface_commands[command_name] = self.__intern_command(CommandProperties(
+                ANY, NONE, NONE, description, 0, NONE))
+            self.__shards[command_name] = shard
+
+    def load_command(self, command_name: CommandName) -> None:
+        shard: Optional[DefinitionShard] = self.__shards.get(command_name)
+
+        if shard is None:
+            return
+
+        for name in shard.command_names:
+            del self.__shards[name]
+
+        # loader may itself load other shards, so names of the outer shard are restored afterwards
+        outer_loading_command_names: Set[CommandName] = self.__loading_command_names
+        self.__loading_command_names = set(shard.command_names)
+
+        try:
+            try:
+                loader: ShardLoader = shard.get_loader()
+            except (ImportError, AttributeError) as e:
+                raise InvalidDefinitionShard(token=command_name, error=e,
+                                             template='Unable to load definition of command {token}! Unable to '
+                                                      'import its loader ({error}).') from e
+
+            loader(self)
+        finally:
+            undefined_command_names: Set[CommandName] = self.__loading_command_names
+            self.__loading_command_names = outer_loading_command_names
+
+            # commands which were not added by the loader are dropped, so that they are not run without definition
+            for name in undefined_command_names:
+                del self.__interface_commands[name]
+            if undefined_command_names:
+                self.parse_cache.clear()
+                self.__help_index.invalidate()
+                self.__name_trie = None
+
+        if undefined_command_names:
+            raise InvalidDefinitionShard(token=min(undefined_command_names),
+                                         reason='Its loader did not add it to command line interface definition.')
+
+    def load_commands(self) -> None:
+        while self.__shards:
+            self.load_command(next(iter(self.__shards)))
+
+    def is_command_loaded(self, command_name: CommandName) -> bool:
+        return command_name in self.__interface_commands.keys() and command_name not in self.__shards
+
+    def add_alias(self, alias: str, name: str) -> None:
+        if name in self.__interface_commands.keys():
+            is_alias_valid, invalid_alias_error, duplicated_alias_error = \
+                InterfaceValidator.is_command_name_valid, InvalidCommandName, DuplicatedCommand
+        elif name in self.__interface_options.keys():
+            is_alias_valid, invalid_alias_error, duplicated_alias_error = \
+                InterfaceValidator.is_option_name_valid, InvalidOptionName, DuplicatedOption
+        elif name in self.__interface_flags.keys():
+            is_alias_valid, invalid_alias_error, duplicated_alias_error = \
+                InterfaceValidator.is_flag_name_valid, InvalidFlagName, DuplicatedFlag
+        else:
+            raise UndefinedReference(token=name, alias=alias,
+                                     template='Unable to add alias {alias}! {token} is not added to command line '
+                                              'interface definition!')
+
+        if not is_alias_valid(alias):
+            raise invalid_alias_error(token=alias)
+        if alias in self.__aliases.keys() or alias in self.__interface_commands.keys() or \
+           alias in self.__interface_options.keys() or alias in self.__interface_flags.keys():
+            raise duplicated_alias_error(token=alias)
+
+        self.parse_cache.clear()
+        self.__name_trie = None
+        self.__aliases[alias] = name
+
+    def add_constraint(self, command_name: CommandName, constraint_type: ConstraintType, names: List[str]) -> None:
+        self.load_command(command_name)
+
+        if command_name not in self.__interface_commands.keys():
+            raise UnsupportedCommand(token=command_name, template='Unable to add constraint! Command {token} is not '
+                                                                  'added to command line interface definition!')
+        for name in names:
+            if not InterfaceValidator.is_option_name_valid(name) and not InterfaceValidator.is_flag_name_valid(name):
+                raise InvalidConstraint(token=name, command=command_name,
+                                        template='Unable to add constraint to command {command}! {token} is neither '
+                                                 'option nor flag name!')
+        if len(set(names)) != len(names) or \
+           (constraint_type != ConstraintType.AT_LEAST_ONE and len(names) < MIN_NUM_OF_CONSTRAINT_NAMES) or not names:
+            raise InvalidConstraint(command=command_name, constraint_type=constraint_type.name,
+                                    template='Unable to add {constraint_type} constraint to command {command}! Names '
+                                             'must be unique and at least two of them (one for AT_LEAST_ONE) are '
+                                             'required.')
+
+        command_properties: CommandProperties = self.__interface_commands[command_name]
+        command_properties.constraints += (Constraint(constraint_type, self.__interner.intern(names)),)
+        command_properties.compiled_constraints = ConstraintChecker.compile(command_properties.constraints)
+        self.parse_cache.clear()
+
+    def check_references(self) -> None:
+        self.load_commands()
+
+        option_names: FrozenSet[OptionName] = frozenset(self.__interface_options.keys())
+        flag_names: FrozenSet[FlagName] = frozenset(self.__interface_flags.keys())
+        element_names: FrozenSet[str] = option_names | flag_names
+        undefined_references: List[Tuple[CommandName, str]] = []
+        # commands usually share the same (interned) lists of names, so every list object is checked only once against
+        # every set of defined names
+        checked_lists: Set[Tuple[int, int]] = set()
+
+        for command_name, command_properties in self.__interface_commands.items():
+            for names, defined_names in ((command_properties.allowed_options, option_names),
+                                         (command_properties.allowed_flags, flag_names),
+                                         (command_properties.required_options, option_names),
+                                         *((constraint.names, element_names)
+                                           for constraint in command_properties.constraints),
+                                         *((names, element_names)
+                                           for route in command_properties.handler_routes
+                                           for names in (route.present_names, route.absent_names))):
+                if not names or (id(names), id(defined_names)) in checked_lists:
+                    continue
+                if defined_names.issuperset(names):
+                    checked_lists.add((id(names), id(defined_names)))
+                else:
+                    undefined_references += [(command_name, name) for name in names if name not in defined_names]
+
+        if undefined_references:
+            command_name, name = undefined_references[0]
+            raise UndefinedReference(token=name, command=command_name, undefined_references=undefined_references,
+                                     num_of_undefined_references=len(undefined_references))
+
+    def parse(self, argv: List[str] = None) -> ParsedCommand:
+        argv = self.__argv if argv is None else argv
+
+        if self.__journal is None:
+            return self.__parse_arguments(argv)
+
+        timestamp: float = time.time()
+        start_time: float = time.perf_counter()
+
+        try:
+            parsed_command: ParsedCommand = self.__parse_arguments(argv)
+        except Exception as e:
+            self.__record(argv, timestamp, start_time, None, FAILURE, type(e).__name__)
+            raise
+
+        self.__record(argv, timestamp, start_time, None, SUCCESS, '')
+
+        return parsed_command
+
+    def __parse_arguments(self, argv: List[str]) -> ParsedCommand:
+        if InterfaceHelper.is_help_required(argv, self.__allow_no_arguments):
+            help_command_name: CommandName = InterfaceHelper.get_help_command_name(argv)
+
+            if help_command_name in self.__interface_commands.keys():
+                print(f'{self.get_command_help(help_command_name)}')
+            else:
+                print(f'{self.get_help(InterfaceHelper.get_search_terms(argv))}')
             return ParsedCommand(HELP_COMMAND_INDICATOR, [], {}, {})
+        if self.parse_cache.max_size <= 0:
+            return self.__parse(argv)
+
+        cache_key: ParseCacheKey = tuple(argv)
+        parsed_command: Optional[ParsedCommand] = self.parse_cache.get(cache_key)
+
+        if parsed_command is None:
+            parsed_command = self.__parse(argv)
 
+            # existence of files has to be checked on every parse, so command lines referring to files are not cached
+            if not self.__refers_to_files(parsed_command):
+                self.parse_cache.put(cache_key, parsed_command)
+
+        return parsed_command
+
+    def __refers_to_files(self, parsed_command: ParsedCommand) -> bool:
+        if parsed_command.values and self.__interface_commands[parsed_command.name].value_type == ValueType.FILE:
+            return True
+
+        return any(self.__interface_options[option_name].value_type == ValueType.FILE
+                   for option_name in parsed_command.options.keys())
+
+    def __parse(self, argv: List[str]) -> ParsedCommand:
         command_name: CommandName = ''
         command_values: CommandValues = []
         options: OptionsMap = {}
         flags: FlagsMap = {}
 
-        for i in range(1, len(self.__argv)):
-            element: str = self.__argv[i]
-            element_type: CommandLineElementType = self.__get_command_line_element_type(element, i)
+        missing_files: List[Tuple[str, str, int]] = []
+
+        tokens: List[CommandLineToken] = Tokenizer.tokenize(argv)
 
-            if element_type == CommandLineElementType.COMMAND:
-                command_name = element
-                command_values = self.__parse_command(command_name, i)
-            if element_type == CommandLineElementType.OPTION:
-                option_name, option_value = self.__parse_option(command_name, element, i)
+        if self.__shards:
+            self.__load_invoked_command(tokens)
+        if self.__aliases or self.__abbreviations_enabled:
+            tokens = self.__resolve_names(tokens)
+
+        for token_index, token in enumerate(tokens):
+            if token.element_type == CommandLineElementType.COMMAND:
+                command_name = token.text
+                command_values = self.__parse_command(tokens, token_index)
+
+                if self.__interface_commands[command_name].value_type == ValueType.FILE:
+                    missing_files += [(value, command_name, token.position + i + 1)
+                                      for i, value in enumerate(command_values) if not os.path.isfile(value)]
+            elif token.element_type == CommandLineElementType.OPTION:
+                option_name, option_value = self.__parse_option(tokens, token_index, command_name)
                 options[option_name] = option_value
-            if element_type == CommandLineElementType.FLAG:
-                flag: FlagName = self.__parse_flag(command_name, element, i)
+
+                if self.__interface_options[option_name].value_type == ValueType.FILE and \
+                   not os.path.isfile(option_value):
+                    missing_files.append((option_value, option_name, token.position + 1))
+            elif token.element_type == CommandLineElementType.FLAG:
+                flag: FlagName = self.__parse_flag(token, command_name)
                 flags[flag] = True
 
         if command_name and command_name in self.__interface_commands.keys():
             for required_option in self.__interface_commands[command_name].required_options:
                 if required_option not in options.keys():
-                    raise MissingRequiredOption(f'Command {command_name} requires option {required_option}, but such '
-                                                f'option has not been provided!')
+                    raise MissingRequiredOption(token=required_option, command=command_name)
+
+            if self.__interface_commands[command_name].compiled_constraints is not None:
+                ConstraintChecker.check(command_name, options, flags,
+                                        self.__interface_commands[command_name].compiled_constraints)
+
+        # existence of all files is checked at once, so that user may fix all paths before the next try
+        if missing_files:
+            path, element, position = missing_files[0]
+            raise MissingFile(token=path, position=position, command=command_name, element=element,
+                              missing_files=missing_files, num_of_missing_files=len(missing_files))
 
         for flag_name, flag_properties in self.__interface_flags.items():
             if flag_name not in flags:
@@ -135,99 +449,504 @@ class CommandLineInterface:
 
         return ParsedCommand(command_name, command_values, options, flags)
 
-    def add_command_handler(self, command_name: CommandName, command_handler: CommandHandlerInterface) -> None:
+    def get_commands(self) -> Commands:
+        return self.__interface_commands
+
+    def get_options(self) -> Options:
+        return self.__interface_options
+
+    def get_flags(self) -> Flags:
+        return self.__interface_flags
+
+    def get_help(self, search_terms: List[str] = None) -> str:
+        if search_terms:
+            return InterfaceHelper.get_search_help(self.__program_name, search_terms, self.__interface_commands,
+                                                   self.__interface_options, self.__interface_flags,
+                                                   self.__help_index.search(search_terms))
+
+        return InterfaceHelper.get_help(self.__program_name, self.__description, self.__interface_commands,
+                                        self.__interface_options, self.__interface_flags)
+
+    def get_command_help(self, command_name: CommandName) -> str:
         if command_name not in self.__interface_commands.keys():
-            raise UnsupportedCommand(f'Unable to add command handler! Command {command_name} is not added to command '
-                                     f'line interface definition!')
+            raise UnsupportedCommand(token=command_name, candidates=self.__get_candidates(self.__interface_commands))
+
+        self.load_command(command_name)
+
+        return InterfaceHelper.get_command_help(self.__program_name, command_name, self.__interface_commands,
+                                                self.__interface_options, self.__interface_flags)
+
+    def get_aliases(self) -> Dict[str, str]:
+        return self.__aliases
+
+    def get_program_name(self) -> str:
+        return self.__program_name
+
+    def is_no_arguments_allowed(self) -> bool:
+        return self.__allow_no_arguments
+
+    def are_abbreviations_enabled(self) -> bool:
+        return self.__abbreviations_enabled
+
+    def snapshot(self) -> InterfaceSnapshot:
+        # snapshot may be shared by many threads, so it must not load anything later
+        self.load_commands()
+
+        cli: CommandLineInterface = CommandLineInterface(self.__argv, self.__program_name, self.__description,
+                                                         self.__allow_no_arguments, self.parse_cache.max_size,
+                                                         self.__help_index_path, self.__suggestions_enabled,
+                                                         self.__journal, self.__abbreviations_enabled,
+                                                         self.resources)
+
+        # names and values are already stored in interned tuples, so only the properties themselves are copied
+        cli.__interface_commands.update((command_name, replace(command_properties))
+                                        for command_name, command_properties in self.__interface_commands.items())
+        cli.__interface_options.update((option_name, replace(option_properties))
+                                       for option_name, option_properties in self.__interface_options.items())
+        cli.__interface_flags.update((flag_name, replace(flag_properties))
+                                     for flag_name, flag_properties in self.__interface_flags.items())
+        cli.__aliases.update(self.__aliases)
+
+        return InterfaceSnapshot(cli)
+
+    def add_command_handler(self, command_name: CommandName, command_handler: CommandHandlerInterface,
+                            record_writer: RecordWriter = None, result_cache: ResultCacheInterface = None,
+                            invalidated_commands: CommandNames = NONE) -> None:
+        self.load_command(command_name)
+
+        if command_name not in self.__interface_commands.keys():
+            raise UnsupportedCommand(token=command_name, template='Unable to add command handler! Command {token} is '
+                                                                  'not added to command line interface definition!')
+        for invalidated_command in invalidated_commands:
+            if invalidated_command not in self.__interface_commands.keys():
+                raise UnsupportedCommand(token=invalidated_command,
+                                         template='Unable to add command handler! Invalidated command {token} is not '
+                                                  'added to command line interface definition!')
 
         self.__interface_commands[command_name].command_handler = command_handler
+        self.__interface_commands[command_name].record_writer = record_writer
+        self.__interface_commands[command_name].result_cache = result_cache
+        self.__interface_commands[command_name].invalidated_commands = self.__interner.intern(invalidated_commands)
+
+    def add_routed_command_handler(self, command_name: CommandName, command_handler: CommandHandlerInterface,
+                                   present_names: List[str] = NONE, absent_names: List[str] = NONE) -> None:
+        self.load_command(command_name)
+
+        if command_name not in self.__interface_commands.keys():
+            raise UnsupportedCommand(token=command_name, template='Unable to add command handler! Command {token} is '
+                                                                  'not added to command line interface definition!')
+        for name in list(present_names) + list(absent_names):
+            if not InterfaceValidator.is_option_name_valid(name) and not InterfaceValidator.is_flag_name_valid(name):
+                raise InvalidHandlerRoute(token=name, command=command_name,
+                                          template='Unable to route handler of command {command}! {token} is neither '
+                                                   'option nor flag name!')
+        if not present_names and not absent_names or set(present_names) & set(absent_names):
+            raise InvalidHandlerRoute(command=command_name,
+                                      template='Unable to route handler of command {command}! At least one name is '
+                                               'required and no name may be both present and absent.')
+
+        command_properties: CommandProperties = self.__interface_commands[command_name]
+        handler_routes: Tuple[HandlerRoute, ...] = command_properties.handler_routes + (
+            HandlerRoute(command_handler, self.__interner.intern(present_names), self.__interner.intern(absent_names)),)
+        # routes are compiled before they are stored, so that a rejected route does not break later ones
+        command_properties.compiled_routes = HandlerRouter.compile(command_name, handler_routes)
+        command_properties.handler_routes = handler_routes
+
+    def invalidate_cached_results(self, command_name: Optional[CommandName] = None) -> None:
+        for name, command_properties in self.__interface_commands.items():
+            if command_properties.result_cache is not None and (command_name is None or name == command_name):
+                command_properties.result_cache.invalidate(name)
+
+    def run(self, argv: List[str] = None) -> ExitStatus:
+        argv = self.__argv if argv is None else argv
+
+        if self.__journal is None and self.__profiler is None:
+            return self.__run_command(self.__parse_arguments(argv))
+
+        timestamp: float = time.time()
+        start_time: float = time.perf_counter()
+        parse_duration: Optional[float] = None
+
+        try:
+            parsed_command: ParsedCommand = self.__parse_arguments(argv)
+            parse_duration = time.perf_counter() - start_time
+            exit_status: ExitStatus = self.__run_command(parsed_command, parse_duration)
+        except Exception as e:
+            if self.__journal is not None:
+                self.__record(argv, timestamp, start_time, parse_duration, FAILURE, type(e).__name__)
+            raise
+
+        if self.__journal is not None:
+            self.__record(argv, timestamp, start_time, parse_duration, exit_status, '')
+
+        return exit_status
+
+    def run_chain(self, argv: List[str] = None, delimiter: str = DEFAULT_CHAIN_DELIMITER, concurrent: bool = False,
+                  max_workers: Optional[int] = None) -> ExitStatus:
+        argv = self.__argv if argv is None else argv
+        segments: List[ChainSegment] = []
+
+        # all segments are parsed before any of them is run, so a mistake in the last one does not leave the chain
+        # half done
+        for segment_argv in CommandLineInterface.__split_chain(argv, delimiter):
+            timestamp: float = time.time()
+            start_time: float = time.perf_counter()
+
+            try:
+                parsed_command: ParsedCommand = self.__parse_arguments(segment_argv)
+            except Exception as e:
+                if self.__journal is not None:
+                    self.__record(segment_argv, timestamp, start_time, None, FAILURE, type(e).__name__)
+                raise
+
+            segments.append((segment_argv, parsed_command, timestamp, time.perf_counter() - start_time))
+
+        if not concurrent:
+            exit_status: ExitStatus = SUCCESS
+
+            for segment in segments:
+                exit_status = self.__run_segment(*segment)
+
+                if exit_status != SUCCESS:
+                    break
+
+            return exit_status
+
+        # files are opened into and closed from the files dict of the parsed command during each run, so segments
+        # running concurrently get their own dicts
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: List[Future] = [executor.submit(self.__run_segment, segment_argv,
+                                                     replace(parsed_command, files={}), timestamp, parse_duration)
+                                     for segment_argv, parsed_command, timestamp, parse_duration in segments]
+            wait(futures)
+
+        for future in futures:
+            if future.exception() is not None:
+                raise future.exception()
+
+        return max((future.result() for future in futures), default=SUCCESS)
+
+    @staticmethod
+    def __split_chain(argv: List[str], delimiter: str) -> List[List[str]]:
+        segments: List[List[str]] = [[argv[0]]]
+
+        for element in argv[1:]:
+            if element == delimiter:
+                segments.append([argv[0]])
+            else:
+                segments[-1].append(element)
+
+        # empty segments (e.g. after a trailing delimiter) are skipped, unless the whole command line is empty
+        return [segment for segment in segments if len(segment) > 1] or segments[:1]
+
+    def __run_segment(self, segment_argv: List[str], parsed_command: ParsedCommand, timestamp: float,
+                      parse_duration: float) -> ExitStatus:
+        # start time is moved back by the parse duration, so that the journal does not count waiting for preceding
+        # segments as the handler duration
+        start_time: float = time.perf_counter() - parse_duration
+
+        try:
+            exit_status: ExitStatus = self.__run_command(parsed_command, parse_duration)
+        except Exception as e:
+            if self.__journal is not None:
+                self.__record(segment_argv, timestamp, start_time, parse_duration, FAILURE, type(e).__name__)
+            raise
 
-    def run(self) -> None:
-        parsed_command: ParsedCommand = self.parse()
+        if self.__journal is not None:
+            self.__record(segment_argv, timestamp, start_time, parse_duration, exit_status, '')
+
+        return exit_status
+
+    def __run_command(self, parsed_command: ParsedCommand, parse_duration: float = 0.0) -> ExitStatus:
+        dispatch_start_time: float = time.perf_counter() if self.__profiler is not None else 0.0
 
         if parsed_command.name == HELP_COMMAND_INDICATOR:
-            return
-        if not self.__interface_commands[parsed_command.name].command_handler:
-            raise MissingCommandHandler(f'Unable to run command handler for {parsed_command.name} command! No command '
-                                        f'handler has been added for this command.')
+            return SUCCESS
+
+        command_properties: CommandProperties = self.__interface_commands[parsed_command.name]
+        command_handler: Optional[CommandHandlerInterface] = command_properties.command_handler
+
+        if command_properties.compiled_routes is not None:
+            command_handler = HandlerRouter.route(parsed_command.options, parsed_command.flags,
+                                                  command_properties.compiled_routes) or command_handler
+        if not command_handler:
+            raise MissingCommandHandler(command=parsed_command.name)
+
+        self.__open_files(parsed_command, command_properties)
+        parsed_command.resources = self.resources
+
+        try:
+            if self.__profiler is not None and self.__profiler.is_profiled(parsed_command.name):
+                return self.__profiler.profile(parsed_command.name, parse_duration, dispatch_start_time,
+                                               self.__execute_command, parsed_command, command_properties,
+                                               command_handler)
+
+            return self.__execute_command(parsed_command, command_properties, command_handler)
+        finally:
+            for mapped_file in parsed_command.files.values():
+                mapped_file.close()
+
+    def __open_files(self, parsed_command: ParsedCommand, command_properties: CommandProperties) -> None:
+        # files are only wrapped in handles here, they are opened and mapped on the first access
+        if command_properties.value_type == ValueType.FILE:
+            for value in parsed_command.values:
+                parsed_command.files.setdefault(value, MappedFile(value))
+
+        for option_name, option_value in parsed_command.options.items():
+            if self.__interface_options[option_name].value_type == ValueType.FILE:
+                parsed_command.files.setdefault(option_value, MappedFile(option_value))
+
+    def __execute_command(self, parsed_command: ParsedCommand, command_properties: CommandProperties,
+                          command_handler: CommandHandlerInterface) -> ExitStatus:
+        try:
+            if command_properties.result_cache is not None:
+                return self.__run_cached_command(parsed_command, command_properties, command_handler)
+
+            return self.__write_result(command_properties, command_handler.run(parsed_command))
+        finally:
+            # handler may have changed the state even if it failed, so results depending on it are dropped anyway
+            for invalidated_command in command_properties.invalidated_commands:
+                self.invalidate_cached_results(invalidated_command)
+
+    def __run_cached_command(self, parsed_command: ParsedCommand, command_properties: CommandProperties,
+                             command_handler: CommandHandlerInterface) -> ExitStatus:
+        cache_key: ResultCacheKey = CommandLineInterface.__get_result_cache_key(parsed_command)
+        entry: Optional[ResultCacheEntry] = command_properties.result_cache.get(cache_key)
+
+        if entry is None:
+            result: Any = command_handler.run(parsed_command)
+            entry = CommandLineInterface.__get_result_cache_entry(command_properties, result)
+
+            # only successful results are cached, so that failures are retried on the next run
+            if not CommandLineInterface.__is_exit_status(entry) or entry == SUCCESS:
+                command_properties.result_cache.put(cache_key, entry)
+
+        return self.__write_result(command_properties, entry)
+
+    @staticmethod
+    def __write_result(command_properties: CommandProperties, result: Any) -> ExitStatus:
+        # records are written only by handlers with a record writer, others return their exit status as before
+        if command_properties.record_writer is None:
+            return SUCCESS if result is None else result
+        if result is None:
+            return SUCCESS
+        if CommandLineInterface.__is_exit_status(result):
+            return result
+
+        command_properties.record_writer.write_records(CommandLineInterface.__get_records(result))
+
+        return SUCCESS
+
+    @staticmethod
+    def __get_records(result: Any) -> Iterable[Any]:
+        # a string or any other single value (e.g. float or bool) is written as one record
+        return [result] if isinstance(result, str) or not isinstance(result, Iterable) else result
+
+    @staticmethod
+    def __is_exit_status(result: Any) -> bool:
+        # bool is a subclass of int, but True or False returned by a handler is a record, not an exit status
+        return isinstance(result, ExitStatus) and not isinstance(result, bool)
+
+    @staticmethod
+    def __get_result_cache_key(parsed_command: ParsedCommand) -> ResultCacheKey:
+        return (parsed_command.name, tuple(parsed_command.values), tuple(sorted(parsed_command.options.items())),
+                tuple(sorted(flag_name for flag_name, is_set in parsed_command.flags.items() if is_set)))
+
+    @staticmethod
+    def __get_result_cache_entry(command_properties: CommandProperties, result: Any) -> ResultCacheEntry:
+        if result is None:
+            return SUCCESS
+        if command_properties.record_writer is None or CommandLineInterface.__is_exit_status(result):
+            return result
+
+        return tuple(CommandLineInterface.__get_records(result))
+
+    def __record(self, argv: List[str], timestamp: float, start_time: float, parse_duration: Optional[float],
+                 exit_status: ExitStatus, outcome: str) -> None:
+        duration: float = time.perf_counter() - start_time
+
+        if parse_duration is None:
+            parse_duration = duration
+
+        # handlers may return any value, so it is recorded with the status sys.exit would report for it
+        if exit_status is None:
+            exit_status = SUCCESS
+        elif not isinstance(exit_status, int):
+            exit_status = FAILURE
+
+        self.__journal.record(JournalRecord(list(argv), timestamp, parse_duration, duration - parse_duration,
+                                            exit_status, outcome))
+
+    def resolve_name(self, name: str, position: int = NO_POSITION, command_name: CommandName = '') -> str:
+        if not self.__aliases and not self.__abbreviations_enabled or name in self.__interface_commands or \
+           name in self.__interface_options or name in self.__interface_flags:
+            return name
+
+        resolved_name: Optional[str] = self.__get_name_trie().resolve(name) if self.__abbreviations_enabled else \
+            self.__aliases.get(name)
+
+        if resolved_name == AMBIGUOUS_TARGET:
+            matching_names: List[str] = self.__get_name_trie().get_targets(name)
+            raise AmbiguousAbbreviation(token=name, position=position, command=command_name,
+                                        matching_names=matching_names, num_of_matching_names=len(matching_names))
+
+        return name if resolved_name is None else resolved_name
+
+    def __resolve_names(self, tokens: List[CommandLineToken]) -> List[CommandLineToken]:
+        resolved_tokens: List[CommandLineToken] = []
+        command_name: CommandName = ''
 
-        self.__interface_commands[parsed_command.name].command_handler.run(parsed_command)
+        for token in tokens:
+            if token.element_type != CommandLineElementType.CUSTOM_VALUE:
+                token = token._replace(text=self.resolve_name(token.text, token.position, command_name))
+            if token.element_type == CommandLineElementType.COMMAND:
+                command_name = token.text
 
-    def __get_command_line_element_type(self, element: str, element_position_index: int) -> CommandLineElementType:
-        if InterfaceValidator.is_command_name_valid(element) and element_position_index == 1:
-            return CommandLineElementType.COMMAND
-        if InterfaceValidator.is_option_name_valid(element):
-            return CommandLineElementType.OPTION
-        if InterfaceValidator.is_flag_name_valid(element):
-            return CommandLineElementType.FLAG
+            resolved_tokens.append(token)
 
-        return CommandLineElementType.CUSTOM_VALUE
+        return resolved_tokens
 
-    def __parse_command(self, command_name: CommandName, command_index: int) -> CommandValues:
-        if command_name not in self.__interface_commands.keys():
-            similar_commands: str = utils.get_similar_keys(self.__interface_commands, command_name, delimiter='\n')
+    def __load_invoked_command(self, tokens: List[CommandLineToken]) -> None:
+        # shard is loaded before names are resolved, so that abbreviations of its options and flags are recognized
+        for token in tokens:
+            if token.element_type == CommandLineElementType.COMMAND:
+                command_name: Optional[str] = token.text
 
-            raise UnsupportedCommand(f'Command {command_name} is not supported!'
-                                     f'{InterfaceHelper.get_hint(similar_commands)}')
-        if command_index != 1:
-            raise InvalidCommandPosition(f'Detected command {command_name} is not directly after program name!')
+                if command_name not in self.__interface_commands and self.__abbreviations_enabled:
+                    command_name = self.__get_name_trie().resolve(command_name)
+                elif command_name not in self.__interface_commands:
+                    command_name = self.__aliases.get(command_name)
+                if command_name in self.__shards:
+                    self.load_command(command_name)
 
-        if not self.__interface_commands[command_name].requires_value():
-            return []
-        elif command_index + self.__interface_commands[command_name].num_of_required_values >= len(self.__argv) or \
-             self.__get_command_line_element_type(self.__argv[command_index + 1], command_index + 1) == CommandLineElementType.OPTION or \
-             self.__get_command_line_element_type(self.__argv[command_index + 1], command_index + 1) == CommandLineElementType.FLAG:
-            raise MissingCommandValue(f'Command {command_name} requires '
-                                      f'{self.__interface_commands[command_name].num_of_required_values} value(s), but'
-                                      f'they were not provided!')
+                return
 
-        values: CommandValues = []
+    def __get_name_trie(self) -> PrefixTrie:
+        # trie is built on the first use after every change of the definition, so adding many names one by one does
+        # not rebuild it every time
+        if self.__name_trie is None:
+            name_trie: PrefixTrie = PrefixTrie()
 
-        for i in range(self.__interface_commands[command_name].num_of_required_values):
-            command_value: CommandValue = self.__argv[command_index + i + 1]
+            for names in (self.__interface_commands, self.__interface_options, self.__interface_flags):
+                for name in names.keys():
+                    name_trie.add(name, name)
+            for alias, name in self.__aliases.items():
+                name_trie.add(alias, name)
 
-            if self.__interface_commands[command_name].allowed_values and \
-               command_value not in self.__interface_commands[command_name].allowed_values:
-                similar_values: str = utils.get_similar_values(self.__interface_commands[command_name].allowed_values,
-                                                               command_value,
-                                                               delimiter='\n')
-                raise UnsupportedCommandValue(f'Unsupported value {command_value} for {command_name} command!'
-                                              f'{InterfaceHelper.get_hint(similar_values)}')
+            self.__name_trie = name_trie
+
+        return self.__name_trie
+
+    def __parse_command(self, tokens: List[CommandLineToken], token_index: int) -> CommandValues:
+        command_name: CommandName = tokens[token_index].text
+        command_index: int = tokens[token_index].position
+
+        if command_name not in self.__interface_commands.keys():
+            raise UnsupportedCommand(token=command_name, position=command_index,
+                                     candidates=self.__get_candidates(self.__interface_commands))
+        if command_index != 1:
+            raise InvalidCommandPosition(token=command_name, position=command_index, command=command_name)
 
-            values.append(self.__argv[command_index + i + 1])
+        if not self.__interface_commands[command_name].requires_value():
+            return []
+        elif token_index + self.__interface_commands[command_name].num_of_required_values >= len(tokens) or \
+             tokens[token_index + 1].element_type == CommandLineElementType.OPTION or \
+             tokens[token_index + 1].element_type == CommandLineElementType.FLAG:
+            raise MissingCommandValue(token=command_name, position=command_index, command=command_name,
+                                      num_of_required_values=self.__interface_commands[command_name]
+                                      .num_of_required_values)
+
+        command_properties: CommandProperties = self.__interface_commands[command_name]
+        values: CommandValues = [token.text for token in
+                                 tokens[token_index + 1:token_index + 1 + command_properties.num_of_required_values]]
+
+        # all values are checked at once, and only if some of them are not allowed, they are searched one by one
+        if command_properties.allowed_values and not command_properties.allowed_value_set.issuperset(values):
+            unsupported_values: List[Tuple[CommandValue, int]] = [
+                (value, command_index + i + 1) for i, value in enumerate(values)
+                if value not in command_properties.allowed_value_set]
+            raise UnsupportedCommandValue(token=unsupported_values[0][0], position=unsupported_values[0][1],
+                                          command=command_name,
+                                          candidates=self.__get_candidates(command_properties.allowed_values),
+                                          unsupported_values=unsupported_values)
 
         return values
 
-    def __parse_option(self, command_name: CommandName, option_name: OptionName,
-                       option_index: int) -> (OptionName, OptionValue):
-        if option_name not in self.__interface_options.keys():
-            similar_options: str = utils.get_similar_keys(self.__interface_options, option_name, delimiter='\n')
+    def __parse_option(self, tokens: List[CommandLineToken], token_index: int,
+                       command_name: CommandName) -> (OptionName, OptionValue):
+        option_name: OptionName = tokens[token_index].text
+        option_index: int = tokens[token_index].position
 
-            raise UnsupportedOption(f'Option {option_name} is not supported!{InterfaceHelper.get_hint(similar_options)}')
-        if option_index + 1 >= len(self.__argv):
-            raise MissingOptionValue(f'Option {option_name} requires value, but no value has been provided!')
+        if option_name not in self.__interface_options.keys():
+            raise UnsupportedOption(token=option_name, position=option_index, command=command_name,
+                                    candidates=self.__get_candidates(self.__interface_options))
+        if token_index + 1 >= len(tokens):
+            raise MissingOptionValue(token=option_name, position=option_index, command=command_name)
         if command_name in self.__interface_commands and \
            option_name not in self.__interface_commands[command_name].allowed_options:
-            raise ForbiddenOption(f'Option {option_name} is not allowed for {command_name} command!')
+            raise ForbiddenOption(token=option_name, position=option_index, command=command_name)
 
-        value: OptionValue = self.__argv[option_index + 1]
+        value: OptionValue = tokens[token_index + 1].text
 
         if self.__interface_options[option_name].allowed_values and \
-           value not in self.__interface_options[option_name].allowed_values:
-            similar_values: str = utils.get_similar_values(self.__interface_options[option_name].allowed_values, value,
-                                                           delimiter='\n')
-            raise ForbiddenOptionValue(f'Given value {value} for option {option_name} is not allowed!'
-                                       f'{InterfaceHelper.get_hint(similar_values)}')
+           value not in self.__interface_options[option_name].allowed_value_set:
+            raise ForbiddenOptionValue(token=value, position=option_index + 1, command=command_name,
+                                       candidates=self.__get_candidates(
+                                           self.__interface_options[option_name].allowed_values),
+                                       option_name=option_name)
 
         return option_name, value
 
-    def __parse_flag(self, command_name: CommandName, flag_name: FlagName, flag_index: int) -> FlagName:
-        if flag_name not in self.__interface_flags.keys():
-            similar_flags: str = utils.get_similar_keys(self.__interface_flags, flag_name, delimiter='\n')
+    def __parse_flag(self, token: CommandLineToken, command_name: CommandName) -> FlagName:
+        flag_name: FlagName = token.text
+        flag_index: int = token.position
 
-            raise UnsupportedFlag(f'Flag {flag_name} is not supported!{InterfaceHelper.get_hint(similar_flags)}')
+        if flag_name not in self.__interface_flags.keys():
+            raise UnsupportedFlag(token=flag_name, position=flag_index, command=command_name,
+                                  candidates=self.__get_candidates(self.__interface_flags))
         if command_name in self.__interface_commands.keys() and \
            flag_name not in self.__interface_commands[command_name].allowed_flags:
-            raise ForbiddenFlag(f'Flag {flag_name} is not allowed for {command_name} command!')
+            raise ForbiddenFlag(token=flag_name, position=flag_index, command=command_name)
+
+        return flag_name
+
+    def __intern_command(self, command_properties: CommandProperties) -> CommandProperties:
+        command_properties.allowed_values = self.__interner.intern(command_properties.allowed_values)
+        command_properties.allowed_options = self.__interner.intern(command_properties.allowed_options)
+        command_properties.allowed_flags = self.__interner.intern(command_properties.allowed_flags)
+        command_properties.required_options = self.__interner.intern(command_properties.required_options)
+        command_properties.allowed_value_set = self.__interner.intern_set(command_properties.allowed_values)
+
+        return command_properties
+
+    def __intern_option(self, option_properties: OptionProperties) -> OptionProperties:
+        option_properties.allowed_values = self.__interner.intern(option_properties.allowed_values)
+        option_properties.allowed_value_set = self.__interner.intern_set(option_properties.allowed_values)
+
+        return option_properties
+
+    @staticmethod
+    def __get_definitions(rows: Iterable[DefinitionRow], get_definition: Callable[[DefinitionRow], Tuple[str, Any]],
+                          is_name_valid: Callable[[str], bool], existing_definitions: dict, invalid_name_error: type,
+                          duplicated_name_error: type) -> dict:
+        definitions: List[Tuple[str, Any]] = [get_definition(row) for row in rows]
+        new_definitions: dict = dict(definitions)
+
+        for name in new_definitions.keys():
+            # rows without a name (e.g. dictionaries missing the name key) give None or other non-string names
+            if not isinstance(name, str) or not is_name_valid(name):
+                raise invalid_name_error(token=str(name))
+
+        # duplicates are searched one by one only when the set operations show that there are any
+        if len(new_definitions) != len(definitions) or not existing_definitions.keys().isdisjoint(new_definitions):
+            seen_names: set = set(existing_definitions.keys())
+
+            for name, _ in definitions:
+                if name in seen_names:
+                    raise duplicated_name_error(token=name)
+                seen_names.add(name)
+
+        return new_definitions
 
-        return self.__argv[flag_index]
+    def __get_candidates(self, candidates: Iterable[str]) -> Optional[Iterable[str]]:
+        return candidates if self.__suggestions_enabled else None
@@ -0,0 +1,8 @@
+from typing import NamedTuple
+from comlint.command_line_element_type import CommandLineElementType
+
+
+class CommandLineToken(NamedTuple):
+    element_type: CommandLineElementType
+    text: str
+    position: int
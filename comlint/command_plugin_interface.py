@@ -0,0 +1,28 @@
+from abc import abstractmethod
+from typing import List
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.definition_row_parser import DefinitionRow
+from comlint.types import CommandName
+
+
+class CommandPluginInterface:
+    """
+    Interface of plugins contributing commands to a command line interface. Plugin is exposed by an installed package
+    as an entry point (in "comlint.plugins" group by default) referring to a class implementing this interface (which
+    is instantiated without arguments) or to its instance. Commands, options and flags are described with the same
+    rows as the ones accepted by add_commands, add_options and add_flags. Options and flags which are already added to
+    the interface are shared instead of being added again.
+    """
+    @abstractmethod
+    def get_commands(self) -> List[DefinitionRow]:
+        pass
+
+    def get_options(self) -> List[DefinitionRow]:
+        return []
+
+    def get_flags(self) -> List[DefinitionRow]:
+        return []
+
+    @abstractmethod
+    def get_command_handler(self, command_name: CommandName) -> CommandHandlerInterface:
+        pass
@@ -1,9 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional, Tuple
 from comlint.command_handler_interface import CommandHandlerInterface
-from comlint.types import CommandValues, OptionNames, FlagNames
+from comlint.constraint import Constraint, CompiledConstraints
+from comlint.handler_route import HandlerRoute, CompiledRoutes
+from comlint.record_writer import RecordWriter
+from comlint.result_cache_interface import ResultCacheInterface
+from comlint.types import CommandValues, OptionNames, FlagNames, CommandNames
+from comlint.value_type import ValueType
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandProperties:
     allowed_values: CommandValues
     allowed_options: OptionNames
@@ -11,7 +17,17 @@ class CommandProperties:
     description: str
     num_of_required_values: int
     required_options: OptionNames
+    value_type: ValueType = ValueType.TEXT
+    # derived from allowed_values for fast membership tests
+    allowed_value_set: FrozenSet[str] = field(default=frozenset(), compare=False, repr=False)
     command_handler: CommandHandlerInterface = None
+    record_writer: RecordWriter = None
+    result_cache: ResultCacheInterface = None
+    invalidated_commands: CommandNames = ()
+    constraints: Tuple[Constraint, ...] = ()
+    compiled_constraints: Optional[CompiledConstraints] = None
+    handler_routes: Tuple[HandlerRoute, ...] = ()
+    compiled_routes: Optional[CompiledRoutes] = None
 
     def requires_value(self) -> bool:
         return self.num_of_required_values > 0
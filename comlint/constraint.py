@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+from comlint.constraint_type import ConstraintType
+
+ConstraintBits = Dict[str, int]
+ConstraintRule = Tuple[int, int, int]
+CompiledConstraints = Tuple[ConstraintBits, Tuple[ConstraintRule, ...]]
+
+
+@dataclass(slots=True)
+class Constraint:
+    constraint_type: ConstraintType
+    names: Tuple[str, ...]
@@ -0,0 +1,93 @@
+from typing import List, Tuple
+from comlint.constraint import Constraint, ConstraintBits, ConstraintRule, CompiledConstraints
+from comlint.constraint_type import ConstraintType
+from comlint.exceptions.conflicting_element import ConflictingElement
+from comlint.exceptions.missing_one_of_elements import MissingOneOfElements
+from comlint.exceptions.missing_required_element import MissingRequiredElement
+from comlint.exceptions.mutually_exclusive_elements import MutuallyExclusiveElements
+from comlint.types import CommandName, OptionsMap, FlagsMap
+
+MUTUALLY_EXCLUSIVE: int = ConstraintType.MUTUALLY_EXCLUSIVE.value
+REQUIRES: int = ConstraintType.REQUIRES.value
+CONFLICTS_WITH: int = ConstraintType.CONFLICTS_WITH.value
+AT_LEAST_ONE: int = ConstraintType.AT_LEAST_ONE.value
+NAMES_DELIMITER: str = ', '
+
+
+class ConstraintChecker:
+    """
+    Checks constraints of commands on the options and flags used together. Constraints of a command are compiled once
+    into a bit assigned to every option and flag they mention and a tuple of rules (type, subject mask, group mask),
+    where for REQUIRES and CONFLICTS_WITH the subject is the first name of the constraint and the group are the other
+    names, and for MUTUALLY_EXCLUSIVE and AT_LEAST_ONE the group are all the names. Checking a command line builds a
+    mask of the used options and flags and evaluates every rule with a few integer operations. Names are decoded from
+    the masks only when a constraint is violated. Compiled constraints consist of literals only, so they may be also
+    embedded in generated parsers.
+    """
+    @staticmethod
+    def compile(constraints: Tuple[Constraint, ...]) -> CompiledConstraints:
+        bits: ConstraintBits = {}
+        rules: List[ConstraintRule] = []
+
+        for constraint in constraints:
+            for name in constraint.names:
+                bits.setdefault(name, 1 << len(bits))
+
+        for constraint in constraints:
+            if constraint.constraint_type in (ConstraintType.REQUIRES, ConstraintType.CONFLICTS_WITH):
+                rules.append((constraint.constraint_type.value, bits[constraint.names[0]],
+                              ConstraintChecker.__get_mask(bits, constraint.names[1:])))
+            else:
+                rules.append((constraint.constraint_type.value, 0,
+                              ConstraintChecker.__get_mask(bits, constraint.names)))
+
+        return bits, tuple(rules)
+
+    @staticmethod
+    def check(command_name: CommandName, options: OptionsMap, flags: FlagsMap,
+              compiled_constraints: CompiledConstraints) -> None:
+        bits, rules = compiled_constraints
+        used_mask: int = 0
+
+        for name, bit in bits.items():
+            if name in options or flags.get(name):
+                used_mask |= bit
+
+        for constraint_type, subject_mask, group_mask in rules:
+            if constraint_type == MUTUALLY_EXCLUSIVE:
+                used_group_mask: int = used_mask & group_mask
+
+                if used_group_mask & (used_group_mask - 1):
+                    used_names: List[str] = ConstraintChecker.__get_names(bits, used_group_mask)
+                    raise MutuallyExclusiveElements(token=used_names[1], command=command_name,
+                                                    names=ConstraintChecker.__join(bits, group_mask),
+                                                    used_names=NAMES_DELIMITER.join(used_names))
+            elif constraint_type == REQUIRES:
+                if used_mask & subject_mask and used_mask & group_mask != group_mask:
+                    raise MissingRequiredElement(
+                        token=ConstraintChecker.__get_names(bits, group_mask & ~used_mask)[0], command=command_name,
+                        required_by=ConstraintChecker.__join(bits, subject_mask))
+            elif constraint_type == CONFLICTS_WITH:
+                if used_mask & subject_mask and used_mask & group_mask:
+                    raise ConflictingElement(token=ConstraintChecker.__get_names(bits, group_mask & used_mask)[0],
+                                             command=command_name,
+                                             conflicts_with=ConstraintChecker.__join(bits, subject_mask))
+            elif constraint_type == AT_LEAST_ONE and not used_mask & group_mask:
+                raise MissingOneOfElements(command=command_name, names=ConstraintChecker.__join(bits, group_mask))
+
+    @staticmethod
+    def __get_mask(bits: ConstraintBits, names: Tuple[str, ...]) -> int:
+        mask: int = 0
+
+        for name in names:
+            mask |= bits[name]
+
+        return mask
+
+    @staticmethod
+    def __get_names(bits: ConstraintBits, mask: int) -> List[str]:
+        return [name for name, bit in bits.items() if mask & bit]
+
+    @staticmethod
+    def __join(bits: ConstraintBits, mask: int) -> str:
+        return NAMES_DELIMITER.join(ConstraintChecker.__get_names(bits, mask))
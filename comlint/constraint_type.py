@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ConstraintType(Enum):
+    MUTUALLY_EXCLUSIVE = 0
+    REQUIRES = 1
+    CONFLICTS_WITH = 2
+    AT_LEAST_ONE = 3
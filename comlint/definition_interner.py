@@ -0,0 +1,47 @@
+import sys
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+Names = Tuple[str, ...]
+
+EMPTY_NAMES: Names = ()
+EMPTY_NAME_SET: FrozenSet[str] = frozenset()
+
+
+class DefinitionInterner:
+    """
+    Pool of immutable name tuples shared by all elements of the interface definition. Commands of large interfaces
+    usually allow the same sets of options and flags, so every distinct sequence of names (and every distinct name) is
+    stored only once, no matter how many commands refer to it. Sets used for fast membership tests are shared the same
+    way.
+    """
+    def __init__(self):
+        self.__names: Dict[Names, Names] = {}
+        self.__name_sets: Dict[Names, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def intern(self, names: Iterable[str]) -> Names:
+        if not names:
+            return EMPTY_NAMES
+
+        key: Names = tuple(names)
+        interned_names: Names = self.__names.get(key)
+
+        if interned_names is None:
+            interned_names = tuple(sys.intern(name) for name in key)
+            self.__names[interned_names] = interned_names
+
+        return interned_names
+
+    def intern_set(self, names: Names) -> FrozenSet[str]:
+        if not names:
+            return EMPTY_NAME_SET
+
+        name_set: FrozenSet[str] = self.__name_sets.get(names)
+
+        if name_set is None:
+            name_set = frozenset(names)
+            self.__name_sets[names] = name_set
+
+        return name_set
@@ -0,0 +1,83 @@
+from typing import Any, Dict, Sequence, Tuple, Union
+from comlint.command_properties import CommandProperties
+from comlint.exceptions.invalid_value_type import InvalidValueType
+from comlint.flag_properties import FlagProperties
+from comlint.option_properties import OptionProperties, DEFAULT_OPTION_VALUE
+from comlint.types import CommandName, OptionName, FlagName, ANY, NONE
+from comlint.value_type import ValueType
+
+DefinitionRow = Union[Dict[str, Any], Sequence[Any]]
+
+COMMAND_COLUMNS: Tuple[str, ...] = ('command_name', 'description', 'num_of_required_values', 'allowed_values',
+                                    'allowed_options', 'allowed_flags', 'required_options', 'value_type')
+OPTION_COLUMNS: Tuple[str, ...] = ('option_name', 'description', 'allowed_values', 'value_type')
+FLAG_COLUMNS: Tuple[str, ...] = ('flag_name', 'description')
+
+
+class DefinitionRowParser:
+    """
+    Converts rows of tabular definitions into properties of commands, options and flags. Row may be a dictionary keyed
+    by names of parameters of add_command, add_option and add_flag (e.g. a row read by csv.DictReader) or a sequence
+    of their values in the same order. Missing trailing values and empty cells mean default values. Lists may also be
+    given as strings with space separated elements and value types as names of ValueType members, as read from CSV
+    files.
+    """
+    @staticmethod
+    def get_command(row: DefinitionRow) -> Tuple[CommandName, CommandProperties]:
+        command_name, description, num_of_required_values, allowed_values, allowed_options, allowed_flags, \
+            required_options, value_type = DefinitionRowParser.__get_values(row, COMMAND_COLUMNS)
+
+        # lists are checked inline, because conversion is needed only for rows read from text
+        return command_name, CommandProperties(
+            allowed_values if type(allowed_values) is list else DefinitionRowParser.__get_list(allowed_values, ANY),
+            allowed_options if type(allowed_options) is list else DefinitionRowParser.__get_list(allowed_options, NONE),
+            allowed_flags if type(allowed_flags) is list else DefinitionRowParser.__get_list(allowed_flags, NONE),
+            description or '',
+            num_of_required_values if type(num_of_required_values) is int else int(num_of_required_values or 0),
+            required_options if type(required_options) is list else DefinitionRowParser.__get_list(required_options,
+                                                                                                   NONE),
+            DefinitionRowParser.__get_value_type(command_name, value_type))
+
+    @staticmethod
+    def get_option(row: DefinitionRow) -> Tuple[OptionName, OptionProperties]:
+        option_name, description, allowed_values, value_type = DefinitionRowParser.__get_values(row, OPTION_COLUMNS)
+
+        return option_name, OptionProperties(description or '', DefinitionRowParser.__get_list(allowed_values, ANY),
+                                             DEFAULT_OPTION_VALUE,
+                                             DefinitionRowParser.__get_value_type(option_name, value_type))
+
+    @staticmethod
+    def get_flag(row: DefinitionRow) -> Tuple[FlagName, FlagProperties]:
+        flag_name, description = DefinitionRowParser.__get_values(row, FLAG_COLUMNS)
+
+        return flag_name, FlagProperties(description or '')
+
+    @staticmethod
+    def __get_values(row: DefinitionRow, columns: Tuple[str, ...]) -> Tuple[Any, ...]:
+        if isinstance(row, dict):
+            return tuple(row.get(column) for column in columns)
+        if len(row) == len(columns):
+            return row
+
+        return tuple(row) + (None,) * (len(columns) - len(row))
+
+    @staticmethod
+    def __get_list(value: Any, default: list) -> list:
+        if not value:
+            return default
+        if isinstance(value, str):
+            return value.split()
+
+        return value if isinstance(value, list) else list(value)
+
+    @staticmethod
+    def __get_value_type(name: Any, value: Any) -> ValueType:
+        if not value:
+            return ValueType.TEXT
+        if isinstance(value, ValueType):
+            return value
+        if value not in ValueType.__members__:
+            raise InvalidValueType(token=str(name), value_type=value,
+                                   value_types=', '.join(ValueType.__members__.keys()))
+
+        return ValueType[value]
@@ -0,0 +1,23 @@
+import importlib
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+from comlint.types import CommandNames
+
+ShardLoader = Callable[[Any], None]
+
+LOADER_PATH_SEPARATOR: str = ':'
+
+
+@dataclass(slots=True)
+class DefinitionShard:
+    command_names: CommandNames
+    # either the loader itself or "module:function" path, so that the module is not even imported until it is needed
+    loader: Union[ShardLoader, str]
+
+    def get_loader(self) -> ShardLoader:
+        if callable(self.loader):
+            return self.loader
+
+        module_name, _, function_name = self.loader.partition(LOADER_PATH_SEPARATOR)
+
+        return getattr(importlib.import_module(module_name), function_name)
@@ -0,0 +1,95 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import Optional
+from comlint.result_cache_interface import ResultCacheInterface, ResultCacheKey, ResultCacheEntry
+from comlint.types import CommandName
+
+DEFAULT_TIME_TO_LIVE: float = 3600.0
+ENTRY_FILE_PREFIX: str = 'comlint-result-'
+ENTRY_FILE_EXTENSION: str = '.pickle'
+TEMPORARY_FILE_EXTENSION: str = '.tmp'
+
+
+class DiskResultCache(ResultCacheInterface):
+    """
+    Cache of command handler results stored in a directory, so that results survive between processes. Every result
+    is stored in its own file, named with a common prefix after hashes of the command name and of the canonical key,
+    together with the time it expires at. Only files with the prefix are read and removed, so the directory may be
+    shared with other files. Expired results are treated as missing and removed on lookup. Results which cannot be
+    pickled are not cached. Files are replaced atomically, so many processes may use the same directory at once.
+    Results are unpickled, which may execute arbitrary code, so the directory must be writable only by trusted users.
+    It is created accessible only by its owner.
+    """
+    def __init__(self, directory: str, time_to_live: float = DEFAULT_TIME_TO_LIVE):
+        self.directory: str = directory
+        self.time_to_live: float = time_to_live
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+
+    def get(self, key: ResultCacheKey) -> Optional[ResultCacheEntry]:
+        entry_path: str = self.__get_entry_path(key)
+        entry: Optional[ResultCacheEntry] = None
+
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                expiration_time, entry = pickle.load(entry_file)
+
+            if expiration_time < time.time():
+                entry = None
+                os.remove(entry_path)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError):
+            entry = None
+
+        with self.__lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return entry
+
+    def put(self, key: ResultCacheKey, entry: ResultCacheEntry) -> None:
+        try:
+            data: bytes = pickle.dumps((time.time() + self.time_to_live, entry))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(TEMPORARY_FILE_EXTENSION, ENTRY_FILE_PREFIX, self.directory)
+
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temporary_file:
+                temporary_file.write(data)
+            os.replace(temporary_path, self.__get_entry_path(key))
+        except OSError:
+            if os.path.isfile(temporary_path):
+                os.remove(temporary_path)
+
+    def invalidate(self, command_name: Optional[CommandName] = None) -> None:
+        if not os.path.isdir(self.directory):
+            return
+
+        prefix: str = ENTRY_FILE_PREFIX if command_name is None else \
+            ENTRY_FILE_PREFIX + DiskResultCache.__get_command_prefix(command_name)
+
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith(prefix) and file_name.endswith(ENTRY_FILE_EXTENSION):
+                try:
+                    os.remove(os.path.join(self.directory, file_name))
+                except OSError:
+                    pass
+
+    def __get_entry_path(self, key: ResultCacheKey) -> str:
+        key_hash: str = hashlib.sha256(repr(key).encode('utf-8', 'surrogateescape')).hexdigest()
+
+        return os.path.join(self.directory, f'{ENTRY_FILE_PREFIX}{DiskResultCache.__get_command_prefix(key[0])}'
+                                            f'{key_hash}{ENTRY_FILE_EXTENSION}')
+
+    @staticmethod
+    def __get_command_prefix(command_name: CommandName) -> str:
+        return f'{hashlib.sha1(command_name.encode("utf-8", "surrogateescape")).hexdigest()[:16]}-'
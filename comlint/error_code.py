@@ -0,0 +1,38 @@
+from enum import Enum
+
+
+class ErrorCode(Enum):
+    UNKNOWN = 0
+    DUPLICATED_COMMAND = 1
+    DUPLICATED_FLAG = 2
+    DUPLICATED_OPTION = 3
+    FORBIDDEN_FLAG = 4
+    FORBIDDEN_OPTION = 5
+    FORBIDDEN_OPTION_VALUE = 6
+    INVALID_COMMAND_NAME = 7
+    INVALID_COMMAND_POSITION = 8
+    INVALID_FAN_OUT_SETTINGS = 9
+    INVALID_FLAG_NAME = 10
+    INVALID_OPTION_NAME = 11
+    MISSING_COMMAND_HANDLER = 12
+    MISSING_COMMAND_VALUE = 13
+    MISSING_OPTION_VALUE = 14
+    MISSING_REQUIRED_OPTION = 15
+    UNSUPPORTED_COMMAND = 16
+    UNSUPPORTED_COMMAND_VALUE = 17
+    UNSUPPORTED_FLAG = 18
+    UNSUPPORTED_OPTION = 19
+    UNDEFINED_REFERENCE = 20
+    INVALID_CONSTRAINT = 21
+    MUTUALLY_EXCLUSIVE_ELEMENTS = 22
+    MISSING_REQUIRED_ELEMENT = 23
+    CONFLICTING_ELEMENT = 24
+    MISSING_ONE_OF_ELEMENTS = 25
+    MISSING_FILE = 26
+    INVALID_PLUGIN = 27
+    AMBIGUOUS_ABBREVIATION = 28
+    INVALID_HANDLER_ROUTE = 29
+    DUPLICATED_RESOURCE = 30
+    UNSUPPORTED_RESOURCE = 31
+    INVALID_DEFINITION_SHARD = 32
+    INVALID_VALUE_TYPE = 33
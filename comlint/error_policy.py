@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ErrorPolicy(Enum):
+    FAIL_FAST = 0
+    COLLECT_ERRORS = 1
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class AmbiguousAbbreviation(ComlintError):
+    error_code: ErrorCode = ErrorCode.AMBIGUOUS_ABBREVIATION
+    template: str = 'Abbreviation {token} is ambiguous! It matches {num_of_matching_names} names: {matching_names}.'
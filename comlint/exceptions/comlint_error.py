@@ -0,0 +1,66 @@
+from typing import Any, Iterable, List, Optional
+import comlint.utils as utils
+from comlint.error_code import ErrorCode
+from comlint.interface_helper import InterfaceHelper
+
+NO_POSITION: int = -1
+SUGGESTIONS_DELIMITER: str = '\n'
+
+
+class ComlintError(Exception):
+    """
+    Base class of all Comlint exceptions. Besides the message, every exception carries structured information about
+    the error:
+        - error_code - kind of the error, the same for all instances of the particular exception class
+        - token - command line element (or name of the interface element) which caused the error
+        - position - index of the token in the command line arguments, if the error was detected during parsing
+        - command - name of the command which was being parsed
+        - details - any other values used in the message
+    Message is formatted from the template only when the exception is converted to a string, and suggestions are
+    searched among candidates (e.g. names of supported commands) only when they are requested, so raising exceptions
+    is cheap when only the kind of the error matters. Exceptions may still be created with a ready message.
+    """
+    error_code: ErrorCode = ErrorCode.UNKNOWN
+    template: str = ''
+
+    def __init__(self, message: str = '', token: str = '', position: int = NO_POSITION, command: str = '',
+                 candidates: Optional[Iterable[str]] = None, template: Optional[str] = None, **details: Any):
+        # message is formatted lazily, so Exception gets the ready message or the template as its argument
+        super().__init__(message or (template if template is not None else self.template))
+        self.token: str = token
+        self.position: int = position
+        self.command: str = command
+        self.details: dict = details
+        self.__message: str = message
+        self.__candidates: Optional[Iterable[str]] = candidates
+        self.__suggestions: Optional[List[str]] = None
+
+        if template is not None:
+            self.template = template
+
+    @property
+    def suggestions(self) -> List[str]:
+        if self.__suggestions is None:
+            self.__suggestions = [] if self.__candidates is None else utils.find_similar(self.__candidates,
+                                                                                          self.token)
+
+        return self.__suggestions
+
+    @property
+    def message(self) -> str:
+        if not self.__message:
+            self.__message = self.template.format(token=self.token, position=self.position, command=self.command,
+                                                  **self.details)
+
+        return self.__message
+
+    def __str__(self) -> str:
+        return f'{self.message}{InterfaceHelper.get_hint(SUGGESTIONS_DELIMITER.join(self.suggestions))}'
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.message!r})'
+
+    def __reduce__(self) -> tuple:
+        # candidates may reference the whole interface definition, so only the formatted message is sent to other
+        # processes
+        return type(self), (str(self), self.token, self.position, self.command), {'details': self.details}
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class ConflictingElement(ComlintError):
+    error_code: ErrorCode = ErrorCode.CONFLICTING_ELEMENT
+    template: str = '{token} cannot be used together with {conflicts_with} in command {command}!'
@@ -1,2 +1,7 @@
-class DuplicatedCommand(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class DuplicatedCommand(ComlintError):
+    error_code: ErrorCode = ErrorCode.DUPLICATED_COMMAND
+    template: str = 'Unable to add {token} command! Command with the same name is already added.'
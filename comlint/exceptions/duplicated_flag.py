@@ -1,2 +1,7 @@
-class DuplicatedFlag(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class DuplicatedFlag(ComlintError):
+    error_code: ErrorCode = ErrorCode.DUPLICATED_FLAG
+    template: str = 'Unable to add {token} flag! Flag with the same name is already added.'
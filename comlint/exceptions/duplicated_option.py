@@ -1,2 +1,7 @@
-class DuplicatedOption(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class DuplicatedOption(ComlintError):
+    error_code: ErrorCode = ErrorCode.DUPLICATED_OPTION
+    template: str = 'Unable to add {token} option! Option with the same name is already added.'
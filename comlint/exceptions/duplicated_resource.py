@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class DuplicatedResource(ComlintError):
+    error_code: ErrorCode = ErrorCode.DUPLICATED_RESOURCE
+    template: str = 'Unable to register {token} resource! Resource with the same name is already registered.'
@@ -1,2 +1,7 @@
-class ForbiddenFlag(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class ForbiddenFlag(ComlintError):
+    error_code: ErrorCode = ErrorCode.FORBIDDEN_FLAG
+    template: str = 'Flag {token} is not allowed for {command} command!'
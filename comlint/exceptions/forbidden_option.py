@@ -1,2 +1,7 @@
-class ForbiddenOption(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class ForbiddenOption(ComlintError):
+    error_code: ErrorCode = ErrorCode.FORBIDDEN_OPTION
+    template: str = 'Option {token} is not allowed for {command} command!'
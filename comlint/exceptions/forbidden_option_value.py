@@ -1,2 +1,7 @@
-class ForbiddenOptionValue(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class ForbiddenOptionValue(ComlintError):
+    error_code: ErrorCode = ErrorCode.FORBIDDEN_OPTION_VALUE
+    template: str = 'Given value {token} for option {option_name} is not allowed!'
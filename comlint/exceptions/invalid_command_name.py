@@ -1,2 +1,7 @@
-class InvalidCommandName(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidCommandName(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_COMMAND_NAME
+    template: str = 'Unable to add {token} command! Name of the command is invalid.'
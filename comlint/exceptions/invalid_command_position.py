@@ -1,2 +1,7 @@
-class InvalidCommandPosition(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidCommandPosition(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_COMMAND_POSITION
+    template: str = 'Detected command {token} is not directly after program name!'
@@ -0,0 +1,6 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidConstraint(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_CONSTRAINT
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidDefinitionShard(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_DEFINITION_SHARD
+    template: str = 'Unable to load definition of command {token}! {reason}'
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidFanOutSettings(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_FAN_OUT_SETTINGS
+    template: str = 'Fan-out setting {token} must be positive, but {value} was given!'
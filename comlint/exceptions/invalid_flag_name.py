@@ -1,2 +1,7 @@
-class InvalidFlagName(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidFlagName(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_FLAG_NAME
+    template: str = 'Unable to add {token} flag! Name of the flag is invalid.'
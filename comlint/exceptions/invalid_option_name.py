@@ -1,2 +1,7 @@
-class InvalidOptionName(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidOptionName(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_OPTION_NAME
+    template: str = 'Unable to add {token} option! Name of the option is invalid.'
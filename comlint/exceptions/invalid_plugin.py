@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidPlugin(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_PLUGIN
+    template: str = 'Unable to load plugin {token}! {reason}'
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class InvalidValueType(ComlintError):
+    error_code: ErrorCode = ErrorCode.INVALID_VALUE_TYPE
+    template: str = 'Unable to add {token}! Value type {value_type} is not one of: {value_types}.'
@@ -1,2 +1,8 @@
-class MissingCommandHandler(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MissingCommandHandler(ComlintError):
+    error_code: ErrorCode = ErrorCode.MISSING_COMMAND_HANDLER
+    template: str = 'Unable to run command handler for {command} command! No command handler has been added for this ' \
+                    'command.'
@@ -1,2 +1,7 @@
-class MissingCommandValue(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MissingCommandValue(ComlintError):
+    error_code: ErrorCode = ErrorCode.MISSING_COMMAND_VALUE
+    template: str = 'Command {command} requires {num_of_required_values} value(s), but they were not provided!'
@@ -0,0 +1,8 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MissingFile(ComlintError):
+    error_code: ErrorCode = ErrorCode.MISSING_FILE
+    template: str = 'File {token} given for {element} does not exist! Found {num_of_missing_files} missing file(s) ' \
+                    'in total.'
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MissingOneOfElements(ComlintError):
+    error_code: ErrorCode = ErrorCode.MISSING_ONE_OF_ELEMENTS
+    template: str = 'Command {command} requires at least one of {names}, but none of them has been provided!'
@@ -1,2 +1,7 @@
-class MissingOptionValue(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MissingOptionValue(ComlintError):
+    error_code: ErrorCode = ErrorCode.MISSING_OPTION_VALUE
+    template: str = 'Option {token} requires value, but no value has been provided!'
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MissingRequiredElement(ComlintError):
+    error_code: ErrorCode = ErrorCode.MISSING_REQUIRED_ELEMENT
+    template: str = 'Using {required_by} with command {command} requires also {token}, but it has not been provided!'
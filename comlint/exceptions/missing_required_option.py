@@ -1,2 +1,7 @@
-class MissingRequiredOption(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MissingRequiredOption(ComlintError):
+    error_code: ErrorCode = ErrorCode.MISSING_REQUIRED_OPTION
+    template: str = 'Command {command} requires option {token}, but such option has not been provided!'
@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class MutuallyExclusiveElements(ComlintError):
+    error_code: ErrorCode = ErrorCode.MUTUALLY_EXCLUSIVE_ELEMENTS
+    template: str = 'Only one of {names} may be used with command {command}, but {used_names} were used!'
@@ -0,0 +1,8 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class UndefinedReference(ComlintError):
+    error_code: ErrorCode = ErrorCode.UNDEFINED_REFERENCE
+    template: str = 'Command {command} refers to {token}, which is not added to command line interface definition! ' \
+                    'Found {num_of_undefined_references} undefined reference(s) in total.'
@@ -1,2 +1,7 @@
-class UnsupportedCommand(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class UnsupportedCommand(ComlintError):
+    error_code: ErrorCode = ErrorCode.UNSUPPORTED_COMMAND
+    template: str = 'Command {token} is not supported!'
@@ -1,2 +1,7 @@
-class UnsupportedCommandValue(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class UnsupportedCommandValue(ComlintError):
+    error_code: ErrorCode = ErrorCode.UNSUPPORTED_COMMAND_VALUE
+    template: str = 'Unsupported value {token} for {command} command!'
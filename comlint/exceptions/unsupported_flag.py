@@ -1,2 +1,7 @@
-class UnsupportedFlag(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class UnsupportedFlag(ComlintError):
+    error_code: ErrorCode = ErrorCode.UNSUPPORTED_FLAG
+    template: str = 'Flag {token} is not supported!'
@@ -1,2 +1,7 @@
-class UnsupportedOption(Exception):
-    pass
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class UnsupportedOption(ComlintError):
+    error_code: ErrorCode = ErrorCode.UNSUPPORTED_OPTION
+    template: str = 'Option {token} is not supported!'
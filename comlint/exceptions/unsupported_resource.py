@@ -0,0 +1,7 @@
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+
+
+class UnsupportedResource(ComlintError):
+    error_code: ErrorCode = ErrorCode.UNSUPPORTED_RESOURCE
+    template: str = 'Resource {token} is not registered!'
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExecutorType(Enum):
+    THREAD = 0
+    PROCESS = 1
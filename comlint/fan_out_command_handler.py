@@ -0,0 +1,138 @@
+import os
+from abc import abstractmethod
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Optional, Tuple, Dict
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.error_policy import ErrorPolicy
+from comlint.exceptions.invalid_fan_out_settings import InvalidFanOutSettings
+from comlint.executor_type import ExecutorType
+from comlint.parsed_command import ParsedCommand
+from comlint.result_order import ResultOrder
+from comlint.types import CommandValue, CommandValues, ExitStatus, SUCCESS, FAILURE
+
+ValueResult = Tuple[CommandValue, ExitStatus, Optional[BaseException]]
+ValueFailure = Tuple[CommandValue, BaseException]
+
+IN_FLIGHT_CHUNKS_PER_WORKER: int = 2
+
+
+def run_chunk(handler: 'FanOutCommandHandler', command: ParsedCommand, chunk: CommandValues,
+              stop_on_error: bool) -> List[ValueResult]:
+    results: List[ValueResult] = []
+
+    for value in chunk:
+        try:
+            status: Optional[ExitStatus] = handler.run_value(command, value)
+            results.append((value, SUCCESS if status is None else status, None))
+        except Exception as e:
+            results.append((value, FAILURE, e))
+
+            if stop_on_error:
+                break
+
+    return results
+
+
+class FanOutCommandHandler(CommandHandlerInterface):
+    """
+    Command handler which maps run_value over all values of the parsed command using a pool of threads or processes,
+    instead of requiring every handler to manage its own pool:
+        - executor_type - whether values are processed by a thread pool or by a process pool. In case of a process
+                          pool, the handler instance must be picklable (e.g. defined on the module level).
+        - max_workers - size of the pool, number of CPUs by default.
+        - chunk_size - number of values handed over to a worker at once.
+        - result_order - whether on_result is called in the order of command values or in the order of completion.
+        - error_policy - whether the first failing value stops the whole execution (its exception is re-raised) or all
+                         failures of the run are collected, passed to on_errors and reported as a failed exit
+                         status.
+        - max_in_flight - maximal number of chunks submitted to the pool (or completed, but not collected yet) at
+                          once, which bounds the memory used for pending work. Twice the number of workers by default.
+    Exit status of the run is the highest exit status returned for any of the values.
+    """
+    def __init__(self, executor_type: ExecutorType = ExecutorType.THREAD, max_workers: Optional[int] = None,
+                 chunk_size: int = 1, result_order: ResultOrder = ResultOrder.ORDERED,
+                 error_policy: ErrorPolicy = ErrorPolicy.FAIL_FAST, max_in_flight: Optional[int] = None):
+        if max_workers is not None and max_workers < 1:
+            raise InvalidFanOutSettings(token='max_workers', value=max_workers)
+        if chunk_size < 1:
+            raise InvalidFanOutSettings(token='chunk_size', value=chunk_size)
+        if max_in_flight is not None and max_in_flight < 1:
+            raise InvalidFanOutSettings(token='max_in_flight', value=max_in_flight)
+
+        self.executor_type: ExecutorType = executor_type
+        self.max_workers: int = max_workers if max_workers else (os.cpu_count() or 1)
+        self.chunk_size: int = chunk_size
+        self.result_order: ResultOrder = result_order
+        self.error_policy: ErrorPolicy = error_policy
+        self.max_in_flight: int = max_in_flight if max_in_flight else IN_FLIGHT_CHUNKS_PER_WORKER * self.max_workers
+
+    @abstractmethod
+    def run_value(self, command: ParsedCommand, value: CommandValue) -> Optional[ExitStatus]:
+        pass
+
+    def on_result(self, value: CommandValue, status: ExitStatus) -> None:
+        pass
+
+    def on_errors(self, errors: List[ValueFailure]) -> None:
+        pass
+
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        errors: List[ValueFailure] = []
+        chunks: List[CommandValues] = [command.values[i:i + self.chunk_size]
+                                       for i in range(0, len(command.values), self.chunk_size)]
+        stop_on_error: bool = self.error_policy == ErrorPolicy.FAIL_FAST
+        statuses: List[ExitStatus] = []
+        pending: Dict[Future, int] = {}
+        completed: Dict[int, List[ValueResult]] = {}
+        next_chunk_index: int = 0
+        next_collected_index: int = 0
+        executor: Executor = self.__create_executor()
+
+        try:
+            while next_chunk_index < len(chunks) or pending or completed:
+                while next_chunk_index < len(chunks) and len(pending) + len(completed) < self.max_in_flight:
+                    future: Future = executor.submit(run_chunk, self, command, chunks[next_chunk_index], stop_on_error)
+                    pending[future] = next_chunk_index
+                    next_chunk_index += 1
+
+                if pending:
+                    done, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        completed[pending.pop(future)] = future.result()
+
+                if self.result_order == ResultOrder.ORDERED:
+                    while next_collected_index in completed:
+                        statuses += self.__collect(completed.pop(next_collected_index), errors)
+                        next_collected_index += 1
+                else:
+                    for chunk_index in list(completed.keys()):
+                        statuses += self.__collect(completed.pop(chunk_index), errors)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if errors:
+            self.on_errors(errors)
+
+        return max(statuses, default=SUCCESS)
+
+    def __create_executor(self) -> Executor:
+        if self.executor_type == ExecutorType.PROCESS:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def __collect(self, chunk_results: List[ValueResult], errors: List[ValueFailure]) -> List[ExitStatus]:
+        statuses: List[ExitStatus] = []
+
+        for value, status, error in chunk_results:
+            if error is not None:
+                if self.error_policy == ErrorPolicy.FAIL_FAST:
+                    raise error
+
+                errors.append((value, error))
+
+            self.on_result(value, status)
+            statuses.append(status)
+
+        return statuses
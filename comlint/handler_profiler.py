@@ -0,0 +1,108 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional
+from comlint.types import CommandName
+
+PROFILE_ENVIRONMENT_VARIABLE: str = 'COMLINT_PROFILE'
+PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE: str = 'COMLINT_PROFILE_DIR'
+ALL_COMMANDS: str = '*'
+COMMAND_NAMES_SEPARATOR: str = ','
+DEFAULT_NUM_OF_TOP_ENTRIES: int = 25
+UNSAFE_FILE_NAME_CHARACTERS: re.Pattern = re.compile(r'[^\w.-]')
+
+
+class HandlerProfiler:
+    """
+    Profiler of command handlers, enabled by setting COMLINT_PROFILE environment variable to comma separated names of
+    commands to profile (or "*" to profile all of them) before the command line interface is created. Handler of the
+    profiled command (together with writing its records, because generators run only when they are written) is run
+    under cProfile and tracemalloc. Afterwards, two files named after the command are written to the directory given
+    in COMLINT_PROFILE_DIR (current directory by default):
+        - [command_name].prof - raw cProfile statistics, which may be loaded with pstats or any compatible viewer
+        - [command_name].profile.txt - report with durations of parsing, dispatching the command and running the
+                                       handler, peak traced memory, top allocations and top functions by cumulative
+                                       time
+    When the environment variable is not set, no profiler is created at all.
+    """
+    def __init__(self, command_names: List[CommandName], directory: str = '.',
+                 num_of_top_entries: int = DEFAULT_NUM_OF_TOP_ENTRIES):
+        self.command_names: List[CommandName] = command_names
+        self.directory: str = directory
+        self.num_of_top_entries: int = num_of_top_entries
+
+    @staticmethod
+    def from_environment() -> Optional['HandlerProfiler']:
+        command_names: List[CommandName] = [command_name.strip() for command_name in
+                                            os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, '').split(
+                                                COMMAND_NAMES_SEPARATOR) if command_name.strip()]
+
+        if not command_names:
+            return None
+
+        return HandlerProfiler(command_names, os.environ.get(PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE, '.'))
+
+    def is_profiled(self, command_name: CommandName) -> bool:
+        return ALL_COMMANDS in self.command_names or command_name in self.command_names
+
+    def get_report_paths(self, command_name: CommandName) -> (str, str):
+        base_path: str = os.path.join(self.directory, UNSAFE_FILE_NAME_CHARACTERS.sub('_', command_name))
+
+        return f'{base_path}.prof', f'{base_path}.profile.txt'
+
+    def profile(self, command_name: CommandName, parse_duration: float, dispatch_start_time: float,
+                function: Callable[..., Any], *args: Any) -> Any:
+        dispatch_duration: float = time.perf_counter() - dispatch_start_time
+        profiler: cProfile.Profile = cProfile.Profile()
+        was_tracing: bool = tracemalloc.is_tracing()
+
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+        start_time: float = time.perf_counter()
+
+        try:
+            profiler.enable()
+
+            try:
+                return function(*args)
+            finally:
+                profiler.disable()
+        finally:
+            handler_duration: float = time.perf_counter() - start_time
+            _, peak_memory = tracemalloc.get_traced_memory()
+            snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),))
+
+            if not was_tracing:
+                tracemalloc.stop()
+
+            self.__write_reports(command_name, profiler, snapshot, peak_memory, parse_duration, dispatch_duration,
+                                 handler_duration)
+
+    def __write_reports(self, command_name: CommandName, profiler: cProfile.Profile, snapshot: tracemalloc.Snapshot,
+                        peak_memory: int, parse_duration: float, dispatch_duration: float,
+                        handler_duration: float) -> None:
+        statistics_path, report_path = self.get_report_paths(command_name)
+        profile_stream: io.StringIO = io.StringIO()
+        pstats.Stats(profiler, stream=profile_stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            self.num_of_top_entries)
+
+        os.makedirs(self.directory, exist_ok=True)
+        profiler.dump_stats(statistics_path)
+
+        with open(report_path, 'w', encoding='utf-8') as report_file:
+            report_file.write(f'Command: {command_name}\n'
+                              f'Parse duration: {parse_duration * 1000:.3f} ms\n'
+                              f'Dispatch overhead: {dispatch_duration * 1000:.3f} ms\n'
+                              f'Handler duration: {handler_duration * 1000:.3f} ms\n'
+                              f'Peak traced memory: {peak_memory / 1024:.1f} KiB\n\n'
+                              f'Top allocations:\n')
+            for statistic in snapshot.statistics('lineno')[:self.num_of_top_entries]:
+                report_file.write(f'{statistic}\n')
+            report_file.write(f'\nCPU profile:\n{profile_stream.getvalue()}')
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from comlint.command_handler_interface import CommandHandlerInterface
+
+RouteBits = Dict[str, int]
+CompiledRoutes = Tuple[RouteBits, Tuple[Optional[CommandHandlerInterface], ...]]
+
+
+@dataclass(slots=True)
+class HandlerRoute:
+    command_handler: CommandHandlerInterface
+    present_names: Tuple[str, ...]
+    absent_names: Tuple[str, ...]
+
+    def get_specificity(self) -> int:
+        return len(self.present_names) + len(self.absent_names)
@@ -0,0 +1,67 @@
+from typing import List, Optional, Tuple
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.exceptions.invalid_handler_route import InvalidHandlerRoute
+from comlint.handler_route import HandlerRoute, RouteBits, CompiledRoutes
+from comlint.types import CommandName, OptionsMap, FlagsMap
+
+MAX_NUM_OF_ROUTING_NAMES: int = 16
+
+
+class HandlerRouter:
+    """
+    Selects one of many handlers registered for a command by the options and flags which are used or not used on the
+    command line. Routes of a command are compiled once into a bit assigned to every option and flag they mention and
+    a decision table with a handler for every combination of these bits, where the most specific matching route (the
+    one mentioning the most names, and the earliest registered one among equally specific routes) is chosen in
+    advance. Dispatching builds the mask of used options and flags and looks the handler up in the table, so it does
+    not depend on the number of routes. Table grows exponentially with the number of names, so at most
+    MAX_NUM_OF_ROUTING_NAMES distinct names may be used by routes of a single command.
+    """
+    @staticmethod
+    def compile(command_name: CommandName, routes: Tuple[HandlerRoute, ...]) -> CompiledRoutes:
+        bits: RouteBits = {}
+
+        for route in routes:
+            for name in route.present_names + route.absent_names:
+                bits.setdefault(name, 1 << len(bits))
+
+        if len(bits) > MAX_NUM_OF_ROUTING_NAMES:
+            raise InvalidHandlerRoute(command=command_name, num_of_names=len(bits),
+                                      max_num_of_names=MAX_NUM_OF_ROUTING_NAMES,
+                                      template='Unable to route handlers of command {command}! Routes use '
+                                               '{num_of_names} options and flags, but at most {max_num_of_names} are '
+                                               'supported.')
+
+        # sorting is stable, so equally specific routes stay in the order of registration
+        masks: List[Tuple[int, int, CommandHandlerInterface]] = [
+            (HandlerRouter.__get_mask(bits, route.present_names), HandlerRouter.__get_mask(bits, route.absent_names),
+             route.command_handler)
+            for route in sorted(routes, key=HandlerRoute.get_specificity, reverse=True)]
+        table: List[Optional[CommandHandlerInterface]] = []
+
+        for used_mask in range(1 << len(bits)):
+            table.append(next((command_handler for present_mask, absent_mask, command_handler in masks
+                               if used_mask & present_mask == present_mask and not used_mask & absent_mask), None))
+
+        return bits, tuple(table)
+
+    @staticmethod
+    def route(options: OptionsMap, flags: FlagsMap,
+              compiled_routes: CompiledRoutes) -> Optional[CommandHandlerInterface]:
+        bits, table = compiled_routes
+        used_mask: int = 0
+
+        for name, bit in bits.items():
+            if name in options or flags.get(name):
+                used_mask |= bit
+
+        return table[used_mask]
+
+    @staticmethod
+    def __get_mask(bits: RouteBits, names: Tuple[str, ...]) -> int:
+        mask: int = 0
+
+        for name in names:
+            mask |= bits[name]
+
+        return mask
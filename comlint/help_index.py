@@ -0,0 +1,221 @@
+import bisect
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.interface_helper import Commands, Options, Flags
+
+HelpEntry = Tuple[CommandLineElementType, str]
+Postings = Dict[str, Dict[str, int]]
+ShardLocations = Dict[str, List[int]]
+
+NAME_TOKEN_WEIGHT: int = 3
+DESCRIPTION_TOKEN_WEIGHT: int = 1
+ENTRY_KEY_SEPARATOR: str = ' '
+INDEX_FORMAT_VERSION: int = 2
+SHARD_KEY_LENGTH: int = 2
+TOKEN_PATTERN: re.Pattern = re.compile(r'[a-z0-9]+')
+
+
+class HelpIndex:
+    """
+    Inverted index over names and descriptions of commands, options and flags, which allows to search the help without
+    rendering it. Index is built on the first search and, if index_path is given, stored on disk, so that subsequent
+    processes load it instead of building it again. Stored index is split into shards by the first two characters of
+    words, so that a search loads only postings of the words which may match its terms. Stored index is rebuilt whenever
+    hash of names and descriptions of the definition or format of the index changes. Search terms are matched as
+    prefixes of words, so "inst" matches "install" and "installation". Results are ranked by number of matched terms
+    and then by score, where words from names weigh more than words from descriptions.
+    """
+    def __init__(self, commands: Commands, options: Options, flags: Flags, index_path: str = ''):
+        self.__commands: Commands = commands
+        self.__options: Options = options
+        self.__flags: Flags = flags
+        self.__index_path: str = index_path
+        self.__postings: Optional[Postings] = None
+        self.__tokens: List[str] = []
+        self.__stored_postings: Postings = {}
+        self.__loaded_shard_keys: Set[str] = set()
+        self.__fingerprint: Optional[str] = None
+        self.__lock: threading.Lock = threading.Lock()
+
+    def search(self, terms: List[str]) -> List[HelpEntry]:
+        term_tokens: List[str] = [token for term in terms for token in TOKEN_PATTERN.findall(term.lower())]
+
+        with self.__lock:
+            if self.__postings is None and not self.__load_shards(term_tokens):
+                self.__set_postings(self.__build())
+                self.__store()
+            if self.__postings is not None:
+                postings: Postings = self.__postings
+                tokens: List[str] = self.__tokens
+            else:
+                postings = dict(self.__stored_postings)
+                tokens = sorted(postings.keys())
+
+        return HelpIndex.rank(postings, terms, tokens)
+
+    def get_postings(self) -> Postings:
+        with self.__lock:
+            if self.__postings is None:
+                self.__set_postings(self.__build())
+                self.__store()
+
+            return self.__postings
+
+    @staticmethod
+    def rank(postings: Postings, terms: List[str], tokens: Optional[List[str]] = None) -> List[HelpEntry]:
+        """
+        Ranks entries of given postings matching given search terms. Tokens are sorted keys of postings and they are
+        sorted on every call when not given.
+        """
+        tokens = sorted(postings.keys()) if tokens is None else tokens
+        matched_terms: Dict[str, int] = {}
+        scores: Dict[str, int] = {}
+
+        for term in terms:
+            term_scores: Dict[str, int] = {}
+
+            for token in HelpIndex.__get_matching_tokens(tokens, term):
+                for entry_key, weight in postings[token].items():
+                    term_scores[entry_key] = term_scores.get(entry_key, 0) + weight
+
+            for entry_key, score in term_scores.items():
+                matched_terms[entry_key] = matched_terms.get(entry_key, 0) + 1
+                scores[entry_key] = scores.get(entry_key, 0) + score
+
+        ranked_keys: List[str] = sorted(scores.keys(), key=lambda key: (-matched_terms[key], -scores[key], key))
+
+        return [HelpIndex.__get_entry(entry_key) for entry_key in ranked_keys]
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__postings = None
+            self.__tokens = []
+            self.__stored_postings = {}
+            self.__loaded_shard_keys = set()
+            self.__fingerprint = None
+
+    @staticmethod
+    def __get_matching_tokens(tokens: List[str], term: str) -> List[str]:
+        matching_tokens: List[str] = []
+
+        for term_token in TOKEN_PATTERN.findall(term.lower()):
+            i: int = bisect.bisect_left(tokens, term_token)
+
+            while i < len(tokens) and tokens[i].startswith(term_token):
+                matching_tokens.append(tokens[i])
+                i += 1
+
+        return matching_tokens
+
+    def __load_shards(self, term_tokens: List[str]) -> bool:
+        if not self.__index_path:
+            return False
+
+        try:
+            with open(self.__index_path, 'rb') as index_file:
+                header: dict = json.loads(index_file.readline())
+
+                if header.get('fingerprint') != self.__get_fingerprint():
+                    return False
+
+                shards_offset: int = index_file.tell()
+                shard_locations: ShardLocations = header['shards']
+
+                # tokens matching a term token start with its shard key, one character long term tokens need all
+                # shards starting with that character
+                for shard_key, (offset, length) in shard_locations.items():
+                    if shard_key not in self.__loaded_shard_keys and \
+                            any(shard_key.startswith(token[:SHARD_KEY_LENGTH]) for token in term_tokens):
+                        index_file.seek(shards_offset + offset)
+                        self.__stored_postings.update(json.loads(index_file.read(length)))
+                        self.__loaded_shard_keys.add(shard_key)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        return True
+
+    def __store(self) -> None:
+        if not self.__index_path:
+            return
+
+        shards: Dict[str, Postings] = {}
+
+        for token, entry_postings in self.__postings.items():
+            shards.setdefault(token[:SHARD_KEY_LENGTH], {})[token] = entry_postings
+
+        shard_locations: ShardLocations = {}
+        data: List[bytes] = []
+        offset: int = 0
+
+        for shard_key, shard in shards.items():
+            data.append(json.dumps(shard).encode('utf-8'))
+            shard_locations[shard_key] = [offset, len(data[-1])]
+            offset += len(data[-1])
+
+        header: bytes = json.dumps({'fingerprint': self.__get_fingerprint(), 'shards': shard_locations}).encode('utf-8')
+
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.__index_path)))
+
+            try:
+                with os.fdopen(file_descriptor, 'wb') as index_file:
+                    index_file.write(header + b'\n' + b''.join(data))
+                # index is replaced atomically, so that other processes never load a partially written one
+                os.replace(temporary_path, self.__index_path)
+            except OSError:
+                os.remove(temporary_path)
+        except OSError:
+            pass
+
+    def __set_postings(self, postings: Postings) -> None:
+        self.__postings = postings
+        self.__tokens = sorted(postings.keys())
+
+    def __build(self) -> Postings:
+        postings: Postings = {}
+
+        for element_type, name, description in self.__get_documents():
+            entry_key: str = f'{element_type.value}{ENTRY_KEY_SEPARATOR}{name}'
+
+            for token in TOKEN_PATTERN.findall(name.lower()):
+                entry_postings: Dict[str, int] = postings.setdefault(token, {})
+                entry_postings[entry_key] = entry_postings.get(entry_key, 0) + NAME_TOKEN_WEIGHT
+            for token in TOKEN_PATTERN.findall(description.lower()):
+                entry_postings: Dict[str, int] = postings.setdefault(token, {})
+                entry_postings[entry_key] = entry_postings.get(entry_key, 0) + DESCRIPTION_TOKEN_WEIGHT
+
+        return postings
+
+    def __get_fingerprint(self) -> str:
+        if self.__fingerprint is None:
+            fingerprint: hashlib.sha1 = hashlib.sha1(f'{INDEX_FORMAT_VERSION}'.encode('utf-8'))
+
+            # names and descriptions are joined first, because hashing them one by one is several times slower
+            for elements in (self.__commands, self.__options, self.__flags):
+                fingerprint.update('\0'.join(elements.keys()).encode('utf-8', 'surrogateescape') + b'\1')
+                fingerprint.update('\0'.join([properties.description for properties in elements.values()])
+                                   .encode('utf-8', 'surrogateescape') + b'\2')
+
+            self.__fingerprint = fingerprint.hexdigest()
+
+        return self.__fingerprint
+
+    def __get_documents(self) -> List[Tuple[CommandLineElementType, str, str]]:
+        return [(CommandLineElementType.COMMAND, name, properties.description)
+                for name, properties in self.__commands.items()] + \
+               [(CommandLineElementType.OPTION, name, properties.description)
+                for name, properties in self.__options.items()] + \
+               [(CommandLineElementType.FLAG, name, properties.description)
+                for name, properties in self.__flags.items()]
+
+    @staticmethod
+    def __get_entry(entry_key: str) -> HelpEntry:
+        element_type, name = entry_key.split(ENTRY_KEY_SEPARATOR, 1)
+
+        return CommandLineElementType(int(element_type)), name
@@ -0,0 +1,148 @@
+import io
+import itertools
+import os
+import pickle
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Callable, Dict, Iterable, List, Optional
+from comlint.command_line_interface import CommandLineInterface
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError
+from comlint.run_result import RunResult
+from comlint.types import ExitStatus, SUCCESS, FAILURE
+
+InterfaceFactory = Callable[[], CommandLineInterface]
+# variables set to None are removed from the environment of the run
+Environment = Dict[str, Optional[str]]
+ExitStatuses = Dict[ErrorCode, ExitStatus]
+
+USAGE_ERROR: ExitStatus = 2
+CHUNKS_PER_WORKER: int = 4
+
+worker_runner: Optional['InProcessRunner'] = None
+
+
+def initialize_worker(interface_factory: InterfaceFactory, exit_statuses: ExitStatuses,
+                      reuse_interface: bool) -> None:
+    global worker_runner
+    worker_runner = InProcessRunner(interface_factory, exit_statuses, reuse_interface=reuse_interface)
+
+
+def run_in_worker(argv: List[str], env: Optional[Environment]) -> RunResult:
+    result: RunResult = worker_runner.run(argv, env)
+
+    # exceptions raised by handlers are not always picklable, so such ones are sent back only as their representation
+    try:
+        pickle.dumps(result.exception)
+    except Exception:
+        result.exception = RuntimeError(repr(result.exception))
+
+    return result
+
+
+class InProcessRunner:
+    """
+    Runs a command line interface against given command lines in the current process, as a much faster replacement of
+    spawning a subprocess per test case. Every run returns RunResult with:
+        - exit_status - status returned by run(), or status mapped from the exception which was raised: comlint errors
+                        are mapped by their error codes with exit_statuses (USAGE_ERROR by default), SystemExit gives
+                        its code and any other exception gives FAILURE
+        - stdout, stderr - everything written to sys.stdout and sys.stderr during the run, including the help and the
+                           message (or traceback) of the raised exception
+        - exception - the exception which was raised, if any
+    Changes of environment variables and of the working directory made during the run are reverted after it, and the
+    variables given in env are set only for the run. Interface is created by interface_factory and, unless
+    reuse_interface is False, reused by all runs, so that it is defined only once. run_all runs many command lines at
+    once in a pool of max_workers processes (number of CPUs by default), each of them creating its own interface, since
+    the environment and standard streams are shared by all threads of a process. Factory must be picklable (e.g.
+    defined on the module level) where processes are spawned instead of forked.
+    """
+    def __init__(self, interface_factory: InterfaceFactory, exit_statuses: Optional[ExitStatuses] = None,
+                 max_workers: Optional[int] = None, reuse_interface: bool = True):
+        self.interface_factory: InterfaceFactory = interface_factory
+        self.exit_statuses: ExitStatuses = exit_statuses if exit_statuses is not None else {}
+        self.max_workers: int = max_workers if max_workers else (os.cpu_count() or 1)
+        self.reuse_interface: bool = reuse_interface
+        self.__cli: Optional[CommandLineInterface] = None
+
+    def run(self, argv: List[str], env: Optional[Environment] = None) -> RunResult:
+        argv = list(argv)
+        cli: CommandLineInterface = self.__get_interface()
+        stdout: io.StringIO = io.StringIO()
+        stderr: io.StringIO = io.StringIO()
+        exception: Optional[BaseException] = None
+        environment: Dict[str, str] = dict(os.environ)
+        working_directory: str = os.getcwd()
+        start_time: float = time.perf_counter()
+
+        try:
+            InProcessRunner.__update_environment(env or {})
+
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    exit_status: ExitStatus = cli.run(argv)
+                except (Exception, SystemExit) as e:
+                    exception = e
+                    exit_status = self.__handle_exception(e)
+        finally:
+            InProcessRunner.__restore_environment(environment)
+            os.chdir(working_directory)
+
+        return RunResult(argv, exit_status, stdout.getvalue(), stderr.getvalue(), exception,
+                         time.perf_counter() - start_time)
+
+    def run_all(self, cases: Iterable[List[str]], env: Optional[Environment] = None) -> List[RunResult]:
+        cases = [list(argv) for argv in cases]
+
+        if self.max_workers == 1 or len(cases) <= 1:
+            return [self.run(argv, env) for argv in cases]
+
+        # cases are handed over in chunks, so that workers do not wait for the parent process after every case
+        chunk_size: int = max(1, len(cases) // (self.max_workers * CHUNKS_PER_WORKER))
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=initialize_worker,
+                                 initargs=(self.interface_factory, self.exit_statuses,
+                                           self.reuse_interface)) as executor:
+            return list(executor.map(run_in_worker, cases, itertools.repeat(env, len(cases)), chunksize=chunk_size))
+
+    def __get_interface(self) -> CommandLineInterface:
+        if not self.reuse_interface:
+            return self.interface_factory()
+        if self.__cli is None:
+            self.__cli = self.interface_factory()
+
+        return self.__cli
+
+    def __handle_exception(self, exception: BaseException) -> ExitStatus:
+        # exceptions are reported the same way as by the interpreter of a program which does not catch them
+        if isinstance(exception, SystemExit):
+            if exception.code is None or isinstance(exception.code, int):
+                return exception.code or SUCCESS
+
+            print(exception.code, file=sys.stderr)
+            return FAILURE
+        if isinstance(exception, ComlintError):
+            print(exception, file=sys.stderr)
+            return self.exit_statuses.get(exception.error_code, USAGE_ERROR)
+
+        traceback.print_exception(exception)
+        return FAILURE
+
+    @staticmethod
+    def __update_environment(env: Environment) -> None:
+        for name, value in env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    @staticmethod
+    def __restore_environment(environment: Dict[str, str]) -> None:
+        for name in [name for name in os.environ.keys() if name not in environment]:
+            del os.environ[name]
+        for name, value in environment.items():
+            if os.environ.get(name) != value:
+                os.environ[name] = value
@@ -0,0 +1,242 @@
+import os
+from typing import List, Optional, Set, Tuple
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.command_line_interface import CommandLineInterface
+from comlint.command_properties import CommandProperties
+from comlint.constraint_checker import ConstraintChecker
+from comlint.exceptions.ambiguous_abbreviation import AmbiguousAbbreviation
+from comlint.exceptions.comlint_error import ComlintError
+from comlint.exceptions.forbidden_flag import ForbiddenFlag
+from comlint.exceptions.forbidden_option import ForbiddenOption
+from comlint.exceptions.forbidden_option_value import ForbiddenOptionValue
+from comlint.exceptions.missing_command_value import MissingCommandValue
+from comlint.exceptions.missing_file import MissingFile
+from comlint.exceptions.missing_option_value import MissingOptionValue
+from comlint.exceptions.missing_required_option import MissingRequiredOption
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.exceptions.unsupported_command_value import UnsupportedCommandValue
+from comlint.exceptions.unsupported_flag import UnsupportedFlag
+from comlint.exceptions.unsupported_option import UnsupportedOption
+from comlint.incremental_parser_state import IncrementalParserState, FileValue
+from comlint.interface_helper import InterfaceHelper
+from comlint.tokenizer import Tokenizer
+from comlint.value_type import ValueType
+
+INITIAL_STATE: IncrementalParserState = IncrementalParserState()
+PROGRAM_NAME_PLACEHOLDER: str = ''
+
+ParsingResult = Tuple[IncrementalParserState, List[ComlintError]]
+
+
+class IncrementalParser:
+    """
+    Parser for interactive front ends, which validate the command line while the user is typing it. Parser remembers
+    its state after every token, so when the command line is updated, only tokens starting from the first changed one
+    are validated again. Instead of raising the first error, parser collects diagnostics - exceptions which parse()
+    would raise - for all tokens, and adds diagnostics which depend on the whole command line (missing values, missing
+    required options, violated constraints and missing files) when they are requested. Existence of files is checked
+    whenever diagnostics are requested, so files created while the user is typing are taken into account. It uses the
+    definition of the given command line interface directly, so reset() must be called when the definition changes.
+    """
+    def __init__(self, cli: CommandLineInterface):
+        self.__cli: CommandLineInterface = cli
+        self.__argv: List[str] = [PROGRAM_NAME_PLACEHOLDER]
+        self.__states: List[IncrementalParserState] = []
+        self.num_of_parsed_tokens: int = 0
+
+    def update(self, argv: List[str]) -> List[ComlintError]:
+        num_of_unchanged_tokens: int = 0
+
+        while num_of_unchanged_tokens < min(len(self.__states), len(argv) - 1) and \
+                self.__argv[num_of_unchanged_tokens + 1] == argv[num_of_unchanged_tokens + 1]:
+            num_of_unchanged_tokens += 1
+
+        del self.__states[num_of_unchanged_tokens:]
+        self.__argv = list(argv)
+
+        for position in range(num_of_unchanged_tokens + 1, len(argv)):
+            self.__states.append(self.__parse_token(self.__get_state(), argv, position))
+            self.num_of_parsed_tokens += 1
+
+        return self.get_diagnostics()
+
+    def append(self, element: str) -> List[ComlintError]:
+        return self.update(self.__argv + [element])
+
+    def reset(self) -> None:
+        self.__argv = [PROGRAM_NAME_PLACEHOLDER]
+        self.__states = []
+        self.num_of_parsed_tokens = 0
+
+    def get_diagnostics(self) -> List[ComlintError]:
+        state: IncrementalParserState = self.__get_state()
+
+        if state.is_help:
+            return []
+
+        diagnostics: List[ComlintError] = list(state.diagnostics)
+        command_properties: Optional[CommandProperties] = self.__cli.get_commands().get(state.command_name)
+
+        if state.num_of_missing_values > 0:
+            diagnostics.append(MissingCommandValue(token=state.command_name, position=1, command=state.command_name,
+                                                   num_of_required_values=state.num_of_values))
+        if state.pending_option:
+            diagnostics.append(MissingOptionValue(token=state.pending_option, position=len(self.__argv) - 1,
+                                                  command=state.command_name))
+        if command_properties is not None:
+            for required_option in command_properties.required_options:
+                if required_option not in state.options:
+                    diagnostics.append(MissingRequiredOption(token=required_option, command=state.command_name))
+
+            if command_properties.compiled_constraints is not None:
+                try:
+                    ConstraintChecker.check(state.command_name, dict.fromkeys(state.options),
+                                            dict.fromkeys(state.flags, True), command_properties.compiled_constraints)
+                except ComlintError as e:
+                    diagnostics.append(e)
+
+        missing_files: List[FileValue] = [file_value for file_value in state.file_values
+                                          if not os.path.isfile(file_value[0])]
+
+        if missing_files:
+            path, element, position = missing_files[0]
+            diagnostics.append(MissingFile(token=path, position=position, command=state.command_name, element=element,
+                                           missing_files=missing_files, num_of_missing_files=len(missing_files)))
+
+        return diagnostics
+
+    def get_expected_element_types(self) -> Set[CommandLineElementType]:
+        state: IncrementalParserState = self.__get_state()
+
+        if state.is_help:
+            return set()
+        if state.pending_option or state.num_of_missing_values > 0:
+            return {CommandLineElementType.CUSTOM_VALUE}
+        if not self.__states and self.__cli.get_commands():
+            return {CommandLineElementType.COMMAND, CommandLineElementType.OPTION, CommandLineElementType.FLAG}
+
+        return {CommandLineElementType.OPTION, CommandLineElementType.FLAG}
+
+    def __get_state(self) -> IncrementalParserState:
+        return self.__states[-1] if self.__states else INITIAL_STATE
+
+    def __parse_token(self, state: IncrementalParserState, argv: List[str], position: int) -> IncrementalParserState:
+        element: str = argv[position]
+        element_type: CommandLineElementType = Tokenizer.get_element_type(element, position)
+        diagnostics: List[ComlintError] = []
+
+        if state.is_help:
+            return state
+        if position == 1 and InterfaceHelper.is_help_required(argv[:2], True):
+            return state._replace(is_help=True)
+
+        # names are resolved the same way as by parse(), so aliases and abbreviations are validated as their targets
+        if element_type != CommandLineElementType.CUSTOM_VALUE:
+            try:
+                element = self.__cli.resolve_name(element, position, state.command_name)
+            except AmbiguousAbbreviation as e:
+                diagnostics.append(e)
+                element_type = CommandLineElementType.CUSTOM_VALUE
+
+        if state.pending_option:
+            diagnostics += self.__get_option_value_diagnostics(state, element, position)
+            state = self.__add_file_value(state, self.__is_file_option(state.pending_option), element,
+                                          state.pending_option, position)
+            state = state._replace(pending_option='')
+        if state.num_of_missing_values > 0:
+            if state.num_of_missing_values == state.num_of_values and \
+                    element_type in (CommandLineElementType.OPTION, CommandLineElementType.FLAG):
+                diagnostics.append(MissingCommandValue(token=state.command_name, position=1,
+                                                       command=state.command_name,
+                                                       num_of_required_values=state.num_of_values))
+                state = state._replace(num_of_missing_values=0)
+            else:
+                diagnostics += self.__get_command_value_diagnostics(state, element, position)
+                state = self.__add_file_value(state, self.__cli.get_commands()[state.command_name].value_type ==
+                                              ValueType.FILE, element, state.command_name, position)
+                state = state._replace(num_of_missing_values=state.num_of_missing_values - 1)
+
+        if element_type == CommandLineElementType.COMMAND:
+            state, element_diagnostics = self.__parse_command(state, element, position)
+        elif element_type == CommandLineElementType.OPTION:
+            state, element_diagnostics = self.__parse_option(state, element, position)
+        elif element_type == CommandLineElementType.FLAG:
+            state, element_diagnostics = self.__parse_flag(state, element, position)
+        else:
+            element_diagnostics = []
+
+        diagnostics += element_diagnostics
+
+        return state._replace(diagnostics=state.diagnostics + tuple(diagnostics)) if diagnostics else state
+
+    def __parse_command(self, state: IncrementalParserState, command_name: str, position: int) -> ParsingResult:
+        self.__cli.load_command(command_name)
+        command_properties: Optional[CommandProperties] = self.__cli.get_commands().get(command_name)
+
+        if command_properties is None:
+            return state, [UnsupportedCommand(token=command_name, position=position,
+                                              candidates=self.__cli.get_commands())]
+
+        return state._replace(command_name=command_name, num_of_values=command_properties.num_of_required_values,
+                              num_of_missing_values=command_properties.num_of_required_values), []
+
+    def __parse_option(self, state: IncrementalParserState, option_name: str, position: int) -> ParsingResult:
+        command_properties: Optional[CommandProperties] = self.__cli.get_commands().get(state.command_name)
+
+        if option_name not in self.__cli.get_options():
+            return state._replace(pending_option=option_name), [
+                UnsupportedOption(token=option_name, position=position, command=state.command_name,
+                                  candidates=self.__cli.get_options())]
+
+        state = state._replace(pending_option=option_name, options=state.options + (option_name,))
+
+        if command_properties is not None and option_name not in command_properties.allowed_options:
+            return state, [ForbiddenOption(token=option_name, position=position, command=state.command_name)]
+
+        return state, []
+
+    def __parse_flag(self, state: IncrementalParserState, flag_name: str, position: int) -> ParsingResult:
+        command_properties: Optional[CommandProperties] = self.__cli.get_commands().get(state.command_name)
+
+        if flag_name not in self.__cli.get_flags():
+            return state, [UnsupportedFlag(token=flag_name, position=position, command=state.command_name,
+                                           candidates=self.__cli.get_flags())]
+
+        state = state._replace(flags=state.flags + (flag_name,))
+
+        if command_properties is not None and flag_name not in command_properties.allowed_flags:
+            return state, [ForbiddenFlag(token=flag_name, position=position, command=state.command_name)]
+
+        return state, []
+
+    def __is_file_option(self, option_name: str) -> bool:
+        option_properties = self.__cli.get_options().get(option_name)
+
+        return option_properties is not None and option_properties.value_type == ValueType.FILE
+
+    @staticmethod
+    def __add_file_value(state: IncrementalParserState, is_file: bool, path: str, element: str,
+                         position: int) -> IncrementalParserState:
+        return state._replace(file_values=state.file_values + ((path, element, position),)) if is_file else state
+
+    def __get_option_value_diagnostics(self, state: IncrementalParserState, value: str,
+                                       position: int) -> List[ComlintError]:
+        option_properties = self.__cli.get_options().get(state.pending_option)
+
+        if option_properties is None or not option_properties.allowed_values or \
+                value in option_properties.allowed_value_set:
+            return []
+
+        return [ForbiddenOptionValue(token=value, position=position, command=state.command_name,
+                                     candidates=option_properties.allowed_values, option_name=state.pending_option)]
+
+    def __get_command_value_diagnostics(self, state: IncrementalParserState, value: str,
+                                        position: int) -> List[ComlintError]:
+        command_properties: CommandProperties = self.__cli.get_commands()[state.command_name]
+
+        if not command_properties.allowed_values or value in command_properties.allowed_value_set:
+            return []
+
+        return [UnsupportedCommandValue(token=value, position=position, command=state.command_name,
+                                        candidates=command_properties.allowed_values,
+                                        unsupported_values=[(value, position)])]
@@ -0,0 +1,18 @@
+from typing import NamedTuple, Tuple
+from comlint.exceptions.comlint_error import ComlintError
+from comlint.types import CommandName, OptionName, FlagName
+
+# path, name of the command or option taking it and its position
+FileValue = Tuple[str, str, int]
+
+
+class IncrementalParserState(NamedTuple):
+    command_name: CommandName = ''
+    num_of_values: int = 0
+    num_of_missing_values: int = 0
+    pending_option: OptionName = ''
+    options: Tuple[OptionName, ...] = ()
+    flags: Tuple[FlagName, ...] = ()
+    diagnostics: Tuple[ComlintError, ...] = ()
+    file_values: Tuple[FileValue, ...] = ()
+    is_help: bool = False
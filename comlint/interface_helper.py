@@ -1,4 +1,5 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from comlint.command_line_element_type import CommandLineElementType
 from comlint.command_properties import CommandProperties
 from comlint.flag_properties import FlagProperties
 from comlint.option_properties import OptionProperties
@@ -11,6 +12,7 @@ Flags = Dict[FlagName, FlagProperties]
 HELP_COMMAND_NAME: str = 'help'
 HELP_OPTION_NAME: str = '-h'
 HELP_FLAG_NAME: str = '--help'
+SEARCH_FLAG_NAME: str = '--search'
 
 
 class InterfaceHelper:
@@ -34,6 +36,84 @@ class InterfaceHelper:
 
         return help_text
 
+    @staticmethod
+    def get_search_terms(argv: List[str]) -> List[str]:
+        return argv[3:] if len(argv) > 2 and argv[2] == SEARCH_FLAG_NAME else []
+
+    @staticmethod
+    def get_help_command_name(argv: List[str]) -> str:
+        return argv[2] if len(argv) == 3 else ''
+
+    @staticmethod
+    def get_command_help(program_name: str, command_name: str, commands: Commands, options: Options,
+                         flags: Flags) -> str:
+        command_properties: CommandProperties = commands[command_name]
+
+        return InterfaceHelper.render_command_help(
+            program_name, command_name,
+            InterfaceHelper.get_entry_help(CommandLineElementType.COMMAND, command_name, commands, options, flags),
+            [InterfaceHelper.get_entry_help(CommandLineElementType.OPTION, name, commands, options, flags)
+             for name in command_properties.allowed_options if name in options],
+            [InterfaceHelper.get_entry_help(CommandLineElementType.FLAG, name, commands, options, flags)
+             for name in command_properties.allowed_flags if name in flags])
+
+    @staticmethod
+    def render_command_help(program_name: str, command_name: str, command_help: str, options_help: List[str],
+                            flags_help: List[str]) -> str:
+        help_text: str = f'Usage of {program_name} {command_name}\n\n'
+
+        help_text += InterfaceHelper.__get_commands_section([command_help])
+        help_text += InterfaceHelper.__get_options_section(options_help)
+        help_text += InterfaceHelper.__get_flags_section(flags_help)
+
+        return help_text
+
+    @staticmethod
+    def get_search_help(program_name: str, terms: List[str], commands: Commands, options: Options, flags: Flags,
+                        results: List[Tuple[CommandLineElementType, str]]) -> str:
+        elements: Dict[CommandLineElementType, dict] = {CommandLineElementType.COMMAND: commands,
+                                                        CommandLineElementType.OPTION: options,
+                                                        CommandLineElementType.FLAG: flags}
+
+        # results of an index built for another definition may refer to elements which no longer exist
+        return InterfaceHelper.render_search_help(program_name, terms, [
+            (element_type, InterfaceHelper.get_entry_help(element_type, name, commands, options, flags))
+            for element_type, name in results if name in elements[element_type]])
+
+    @staticmethod
+    def render_search_help(program_name: str, terms: List[str],
+                           results_help: List[Tuple[CommandLineElementType, str]]) -> str:
+        help_text: str = f'Usage of {program_name} matching "{" ".join(terms)}"\n\n'
+
+        if not results_help:
+            return help_text + 'No matching commands, options or flags found.\n'
+
+        commands_help: List[str] = [entry_help for element_type, entry_help in results_help
+                                    if element_type == CommandLineElementType.COMMAND]
+        options_help: List[str] = [entry_help for element_type, entry_help in results_help
+                                   if element_type == CommandLineElementType.OPTION]
+        flags_help: List[str] = [entry_help for element_type, entry_help in results_help
+                                 if element_type == CommandLineElementType.FLAG]
+
+        if commands_help:
+            help_text += InterfaceHelper.__get_commands_section(commands_help)
+        if options_help:
+            help_text += InterfaceHelper.__get_options_section(options_help)
+        if flags_help:
+            help_text += InterfaceHelper.__get_flags_section(flags_help)
+
+        return help_text
+
+    @staticmethod
+    def get_entry_help(element_type: CommandLineElementType, name: str, commands: Commands, options: Options,
+                       flags: Flags) -> str:
+        if element_type == CommandLineElementType.COMMAND:
+            return InterfaceHelper.__get_command_entry_help(name, commands[name])
+        if element_type == CommandLineElementType.OPTION:
+            return InterfaceHelper.__get_option_entry_help(name, options[name])
+
+        return InterfaceHelper.__get_flag_entry_help(name, flags[name])
+
     @staticmethod
     def get_hint(similar_values: str) -> str:
         return "" if not similar_values else f' Did you mean:\n{similar_values}'
@@ -45,43 +125,57 @@ class InterfaceHelper:
 
     @staticmethod
     def __get_commands_help(commands: Commands) -> str:
-        help_text: str = 'COMMANDS:\n'
+        return InterfaceHelper.__get_commands_section([InterfaceHelper.__get_command_entry_help(command_name,
+                                                                                                command_properties)
+                                                       for command_name, command_properties in commands.items()])
 
-        for command_name, command_properties in commands.items():
-            help_text += f'{"{0: <25}".format(command_name)}{command_properties.description}\n'
-
-            if command_properties.allowed_values:
-                help_text += f'{"{0: <25}".format("  allowed values")}{command_properties.allowed_values}\n'
-            if command_properties.allowed_options:
-                help_text += f'{"{0: <25}".format("  allowed options")}{command_properties.allowed_options}\n'
-            if command_properties.allowed_flags:
-                help_text += f'{"{0: <25}".format("  allowed flags")}{command_properties.allowed_flags}\n'
-            if command_properties.required_options:
-                help_text += f'{"{0: <25}".format("  required options")}{command_properties.required_options}\n'
+    @staticmethod
+    def __get_options_help(options: Options) -> str:
+        return InterfaceHelper.__get_options_section([InterfaceHelper.__get_option_entry_help(option_name,
+                                                                                              option_properties)
+                                                      for option_name, option_properties in options.items()])
 
-            help_text += '\n'
+    @staticmethod
+    def __get_flags_help(flags: Flags) -> str:
+        return InterfaceHelper.__get_flags_section([InterfaceHelper.__get_flag_entry_help(flag_name, flag_properties)
+                                                    for flag_name, flag_properties in flags.items()])
 
-        return help_text
+    @staticmethod
+    def __get_commands_section(commands_help: List[str]) -> str:
+        return 'COMMANDS:\n' + ''.join(commands_help)
 
     @staticmethod
-    def __get_options_help(options: Options) -> str:
-        help_text: str = 'OPTIONS:\n'
+    def __get_options_section(options_help: List[str]) -> str:
+        return 'OPTIONS:\n' + ''.join(options_help) + '\n'
 
-        for option_name, option_properties in options.items():
-            help_text += f'{"{0: <25}".format(option_name)}{option_properties.description}\n'
+    @staticmethod
+    def __get_flags_section(flags_help: List[str]) -> str:
+        return 'FLAGS:\n' + ''.join(flags_help)
 
-            if option_properties.allowed_values:
-                help_text += f'{"{0: <25}".format("  allowed values")}{option_properties.allowed_values}\n'
+    @staticmethod
+    def __get_command_entry_help(command_name: CommandName, command_properties: CommandProperties) -> str:
+        help_text: str = f'{"{0: <25}".format(command_name)}{command_properties.description}\n'
 
-        help_text += '\n'
+        if command_properties.allowed_values:
+            help_text += f'{"{0: <25}".format("  allowed values")}{list(command_properties.allowed_values)}\n'
+        if command_properties.allowed_options:
+            help_text += f'{"{0: <25}".format("  allowed options")}{list(command_properties.allowed_options)}\n'
+        if command_properties.allowed_flags:
+            help_text += f'{"{0: <25}".format("  allowed flags")}{list(command_properties.allowed_flags)}\n'
+        if command_properties.required_options:
+            help_text += f'{"{0: <25}".format("  required options")}{list(command_properties.required_options)}\n'
 
-        return help_text
+        return help_text + '\n'
 
     @staticmethod
-    def __get_flags_help(flags: Flags) -> str:
-        help_text: str = 'FLAGS:\n'
+    def __get_option_entry_help(option_name: OptionName, option_properties: OptionProperties) -> str:
+        help_text: str = f'{"{0: <25}".format(option_name)}{option_properties.description}\n'
 
-        for flag_name, flag_properties in flags.items():
-            help_text += f'{"{0: <25}".format(flag_name)}{flag_properties.description}\n'
+        if option_properties.allowed_values:
+            help_text += f'{"{0: <25}".format("  allowed values")}{list(option_properties.allowed_values)}\n'
 
         return help_text
+
+    @staticmethod
+    def __get_flag_entry_help(flag_name: FlagName, flag_properties: FlagProperties) -> str:
+        return f'{"{0: <25}".format(flag_name)}{flag_properties.description}\n'
@@ -0,0 +1,25 @@
+from typing import List
+from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus
+
+
+class InterfaceSnapshot:
+    """
+    Immutable copy of a command line interface definition, created with CommandLineInterface.snapshot(). Snapshot has
+    no methods changing the definition and all lists of names and values are stored as tuples, so any number of threads
+    may call parse and run on the same snapshot at once. It does not rely on the global interpreter lock, so it is safe
+    also on free-threaded builds of CPython. Parse cache, help index and invocation journal of the snapshot are guarded
+    by locks. Changes made to the original interface after the snapshot was taken are not visible in the snapshot.
+    Command handlers are shared with the original interface and must be thread-safe themselves when run concurrently.
+    """
+    def __init__(self, cli):
+        self.__cli = cli
+
+    def parse(self, argv: List[str]) -> ParsedCommand:
+        return self.__cli.parse(argv)
+
+    def run(self, argv: List[str]) -> ExitStatus:
+        return self.__cli.run(argv)
+
+    def get_help(self, search_terms: List[str] = None) -> str:
+        return self.__cli.get_help(search_terms)
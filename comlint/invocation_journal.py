@@ -0,0 +1,84 @@
+import os
+import struct
+import threading
+from typing import BinaryIO, Iterator, List
+from comlint.journal_record import JournalRecord
+
+JOURNAL_MAGIC: bytes = b'CLJ1'
+RECORD_HEADER: struct.Struct = struct.Struct('<Idddi')
+FIELD_SEPARATOR: str = '\0'
+DEFAULT_MAX_FILE_SIZE: int = 16 * 1024 * 1024
+DEFAULT_MAX_NUM_OF_FILES: int = 4
+
+
+class InvocationJournal:
+    """
+    Append-only binary log of command line interface invocations. Every record consists of a fixed size header (length
+    of the payload, timestamp, parse duration, handler duration and exit status) followed by the payload, which is the
+    outcome (name of the exception type or empty string on success) and command line arguments joined with NUL
+    characters. When the journal file would exceed max_file_size, it is rotated: journal.log becomes journal.log.1,
+    journal.log.1 becomes journal.log.2 and so on, keeping at most max_num_of_files files. Records may be appended by
+    many threads at once.
+    """
+    def __init__(self, path: str, max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+                 max_num_of_files: int = DEFAULT_MAX_NUM_OF_FILES):
+        self.path: str = path
+        self.max_file_size: int = max_file_size
+        self.max_num_of_files: int = max_num_of_files
+        self.__lock: threading.Lock = threading.Lock()
+
+    def record(self, record: JournalRecord) -> None:
+        payload: bytes = FIELD_SEPARATOR.join([record.outcome] + list(record.argv)).encode('utf-8', 'surrogateescape')
+        data: bytes = RECORD_HEADER.pack(len(payload), record.timestamp, record.parse_duration, record.handler_duration,
+                                         record.exit_status) + payload
+
+        with self.__lock:
+            if os.path.isfile(self.path) and os.path.getsize(self.path) + len(data) > self.max_file_size:
+                self.__rotate()
+
+            with open(self.path, 'ab') as journal_file:
+                if journal_file.tell() == 0:
+                    journal_file.write(JOURNAL_MAGIC)
+                journal_file.write(data)
+
+    def get_files(self) -> List[str]:
+        rotated_files: List[str] = [f'{self.path}.{i}' for i in range(self.max_num_of_files - 1, 0, -1)]
+
+        return [path for path in rotated_files + [self.path] if os.path.isfile(path)]
+
+    def read(self) -> Iterator[JournalRecord]:
+        for path in self.get_files():
+            with open(path, 'rb') as journal_file:
+                yield from InvocationJournal.__read_records(journal_file)
+
+    def __rotate(self) -> None:
+        for i in range(self.max_num_of_files - 1, 0, -1):
+            source_path: str = self.path if i == 1 else f'{self.path}.{i - 1}'
+
+            if os.path.isfile(source_path):
+                os.replace(source_path, f'{self.path}.{i}')
+
+        if self.max_num_of_files <= 1 and os.path.isfile(self.path):
+            os.remove(self.path)
+
+    @staticmethod
+    def __read_records(journal_file: BinaryIO) -> Iterator[JournalRecord]:
+        if journal_file.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+            return
+
+        while True:
+            header: bytes = journal_file.read(RECORD_HEADER.size)
+
+            if len(header) < RECORD_HEADER.size:
+                return
+
+            payload_length, timestamp, parse_duration, handler_duration, exit_status = RECORD_HEADER.unpack(header)
+            payload: bytes = journal_file.read(payload_length)
+
+            # a record which was not written completely (e.g. the process was killed) ends the file
+            if len(payload) < payload_length:
+                return
+
+            outcome, *argv = payload.decode('utf-8', 'surrogateescape').split(FIELD_SEPARATOR)
+
+            yield JournalRecord(argv, timestamp, parse_duration, handler_duration, exit_status, outcome)
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import List
+from comlint.types import ExitStatus
+
+
+@dataclass
+class JournalRecord:
+    argv: List[str]
+    timestamp: float
+    parse_duration: float
+    handler_duration: float
+    exit_status: ExitStatus
+    outcome: str
+
+    def is_successful(self) -> bool:
+        return not self.outcome
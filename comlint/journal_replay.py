@@ -0,0 +1,35 @@
+import time
+from typing import Iterable, List
+from comlint.command_line_interface import CommandLineInterface
+from comlint.journal_record import JournalRecord
+from comlint.replay_report import ReplayReport
+
+
+class JournalReplay:
+    """
+    Re-drives invocations recorded in an InvocationJournal against a command line interface, in order to benchmark it
+    with a production-shaped workload. By default only parse() is called for every recorded command line, with
+    full_run set, run() is called instead, so command handlers are executed as well. Exceptions raised by the interface
+    are counted as failures and do not stop the replay.
+    """
+    @staticmethod
+    def replay(cli: CommandLineInterface, records: Iterable[JournalRecord], full_run: bool = False,
+               num_of_repetitions: int = 1) -> ReplayReport:
+        command_lines: List[List[str]] = [record.argv for record in records]
+        report: ReplayReport = ReplayReport()
+
+        for _ in range(num_of_repetitions):
+            for argv in command_lines:
+                start_time: float = time.perf_counter()
+
+                try:
+                    if full_run:
+                        cli.run(argv)
+                    else:
+                        cli.parse(argv)
+                except Exception:
+                    report.num_of_failures += 1
+
+                report.latencies.append(time.perf_counter() - start_time)
+
+        return report
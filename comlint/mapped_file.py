@@ -0,0 +1,75 @@
+import mmap
+import os
+from typing import BinaryIO, Iterator, Optional
+
+LINE_SEPARATOR: bytes = b'\n'
+
+
+class MappedFile:
+    """
+    Lazy handle of a file given as a value of a command or an option of FILE type. File is opened and memory-mapped
+    read-only only when it is accessed for the first time, so files which are not used by the handler cost nothing.
+    Views and lines are memoryview slices of the mapping, so no data is copied until the handler converts them to
+    bytes or str. Handles are closed by the command line interface when the handler returns; views must not be used
+    afterwards, and if any of them is still referenced, the mapping itself is released only together with the last view.
+    """
+    def __init__(self, path: str):
+        self.path: str = path
+        self.__file: Optional[BinaryIO] = None
+        self.__mapping: Optional[mmap.mmap] = None
+        self.__view: Optional[memoryview] = None
+
+    def __len__(self) -> int:
+        return len(self.__get_view())
+
+    def __enter__(self) -> 'MappedFile':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def is_open(self) -> bool:
+        return self.__view is not None
+
+    def view(self, start: int = 0, end: Optional[int] = None) -> memoryview:
+        return self.__get_view()[start:end]
+
+    def lines(self) -> Iterator[memoryview]:
+        view: memoryview = self.__get_view()
+        start: int = 0
+        size: int = len(view)
+
+        # empty file has no mapping, but it has no lines either
+        while start < size:
+            end: int = self.__mapping.find(LINE_SEPARATOR, start)
+            end = size if end < 0 else end + 1
+
+            yield view[start:end]
+            start = end
+
+    def close(self) -> None:
+        if self.__view is not None:
+            self.__view.release()
+            self.__view = None
+        if self.__mapping is not None:
+            try:
+                self.__mapping.close()
+            except BufferError:
+                pass
+            self.__mapping = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def __get_view(self) -> memoryview:
+        if self.__view is None:
+            self.__file = open(self.path, 'rb')
+
+            # empty files cannot be memory-mapped
+            if os.fstat(self.__file.fileno()).st_size > 0:
+                self.__mapping = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.__view = memoryview(self.__mapping)
+            else:
+                self.__view = memoryview(b'')
+
+        return self.__view
@@ -0,0 +1,54 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+from comlint.result_cache_interface import ResultCacheInterface, ResultCacheKey, ResultCacheEntry
+from comlint.types import CommandName
+
+
+class MemoryResultCache(ResultCacheInterface):
+    """
+    In-memory cache of command handler results. When the cache is full, the least recently used result is evicted.
+    Cache may be shared by many commands and used by many threads at once.
+    """
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: ResultCacheKey) -> Optional[ResultCacheEntry]:
+        with self.__lock:
+            entry: Optional[ResultCacheEntry] = self.__entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__entries.move_to_end(key)
+
+            return entry
+
+    def put(self, key: ResultCacheKey, entry: ResultCacheEntry) -> None:
+        if self.max_size <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            if len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, command_name: Optional[CommandName] = None) -> None:
+        with self.__lock:
+            if command_name is None:
+                self.__entries.clear()
+                return
+
+            for key in [key for key in self.__entries.keys() if key[0] == command_name]:
+                del self.__entries[key]
@@ -1,9 +1,16 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import FrozenSet
 from comlint.types import OptionValues, OptionValue
+from comlint.value_type import ValueType
 
+DEFAULT_OPTION_VALUE: OptionValue = ''
 
-@dataclass
+
+@dataclass(slots=True)
 class OptionProperties:
     description: str
     allowed_values: OptionValues
     default_value: OptionValue
+    value_type: ValueType = ValueType.TEXT
+    # derived from allowed_values for fast membership tests
+    allowed_value_set: FrozenSet[str] = field(default=frozenset(), compare=False, repr=False)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class OutputFormat(Enum):
+    TEXT = 0
+    JSON_LINES = 1
+    CSV = 2
@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from comlint.parsed_command import ParsedCommand
+from comlint.types import CommandName, CommandValue, OptionName, OptionValue, FlagName
+
+ParseCacheKey = Tuple[str, ...]
+ParseCacheEntry = Tuple[CommandName, Tuple[CommandValue, ...], Tuple[Tuple[OptionName, OptionValue], ...],
+                        Tuple[Tuple[FlagName, bool], ...]]
+
+
+class ParseCache:
+    """
+    Bounded cache of parse results keyed by the command line arguments. When the cache is full, the least recently used
+    entry is evicted. Entries are stored as immutable tuples and every lookup returns a new ParsedCommand, so changes
+    made by command handlers to the returned object never affect the cached entry. Cache may be used by many threads
+    at once.
+    """
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: ParseCacheKey) -> Optional[ParsedCommand]:
+        with self.__lock:
+            entry: Optional[ParseCacheEntry] = self.__entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__entries.move_to_end(key)
+
+        name, values, options, flags = entry
+
+        return ParsedCommand(name, list(values), dict(options), dict(flags))
+
+    def put(self, key: ParseCacheKey, parsed_command: ParsedCommand) -> None:
+        if self.max_size <= 0:
+            return
+
+        entry: ParseCacheEntry = (parsed_command.name, tuple(parsed_command.values),
+                                  tuple(parsed_command.options.items()), tuple(parsed_command.flags.items()))
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            if len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
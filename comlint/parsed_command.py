@@ -1,6 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Optional, TYPE_CHECKING
+from comlint.mapped_file import MappedFile
 from comlint.types import CommandName, CommandValues, OptionsMap, FlagsMap, OptionName
 
+# resource context raises comlint errors, which depend on command properties and thus on parsed command
+if TYPE_CHECKING:
+    from comlint.resource_context import ResourceContext
+
 
 @dataclass
 class ParsedCommand:
@@ -8,6 +14,13 @@ class ParsedCommand:
     values: CommandValues
     options: OptionsMap
     flags: FlagsMap
+    files: Dict[str, MappedFile] = field(default_factory=dict, compare=False, repr=False)
+    resources: Optional['ResourceContext'] = field(default=None, compare=False, repr=False)
+
+    def __getstate__(self) -> dict:
+        # resource context holds locks and live resources of this process, so handlers run in other processes (e.g. by
+        # a process fan-out) get the parsed command without it
+        return {**self.__dict__, 'resources': None}
 
     def is_option_used(self, option_name: OptionName) -> bool:
         return option_name in self.options.keys()
@@ -0,0 +1,330 @@
+from typing import Dict, List, Tuple
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.command_properties import CommandProperties
+from comlint.command_line_interface import CommandLineInterface, HELP_COMMAND_INDICATOR
+from comlint.help_index import HelpIndex, Postings
+from comlint.interface_helper import HELP_COMMAND_NAME, HELP_OPTION_NAME, HELP_FLAG_NAME, SEARCH_FLAG_NAME, \
+    InterfaceHelper
+from comlint.prefix_trie import PrefixTrie
+from comlint.value_type import ValueType
+
+SharedConstants = Dict[str, str]
+
+GENERATED_MODULE_HEADER: str = '# Generated by comlint.parser_generator - do not edit.\n'
+GENERATED_MODULE_IMPORTS: str = '''from os.path import isfile as _isfile
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.constraint_checker import ConstraintChecker
+from comlint.exceptions.ambiguous_abbreviation import AmbiguousAbbreviation
+from comlint.exceptions.forbidden_flag import ForbiddenFlag
+from comlint.exceptions.forbidden_option import ForbiddenOption
+from comlint.exceptions.forbidden_option_value import ForbiddenOptionValue
+from comlint.exceptions.missing_command_value import MissingCommandValue
+from comlint.exceptions.missing_file import MissingFile
+from comlint.exceptions.missing_option_value import MissingOptionValue
+from comlint.exceptions.missing_required_option import MissingRequiredOption
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.exceptions.unsupported_command_value import UnsupportedCommandValue
+from comlint.exceptions.unsupported_flag import UnsupportedFlag
+from comlint.exceptions.unsupported_option import UnsupportedOption
+from comlint.help_index import HelpIndex
+from comlint.interface_helper import InterfaceHelper
+from comlint.parsed_command import ParsedCommand
+'''
+GENERATED_ELEMENTS_PARSER: str = '''
+
+def _parse_elements(argv, length, start, command_name, allowed_options, allowed_flags, missing_files):
+    options = {}
+    flags = dict(_DEFAULT_FLAGS)
+
+    for i in range(start, length):
+        element = argv[i]
+
+        if len(element) < 2 or element[0] != '-':
+            continue
+        if element[1] != '-':
+            if element not in _OPTIONS:
+                raise UnsupportedOption(token=element, position=i, command=command_name, candidates=_OPTION_NAMES)
+            if i + 1 >= length:
+                raise MissingOptionValue(token=element, position=i, command=command_name)
+            if allowed_options is not None and element not in allowed_options:
+                raise ForbiddenOption(token=element, position=i, command=command_name)
+
+            value = argv[i + 1]
+            allowed_values = _OPTIONS[element]
+
+            if allowed_values and value not in allowed_values:
+                raise ForbiddenOptionValue(token=value, position=i + 1, command=command_name,
+                                           candidates=_OPTION_VALUE_LISTS[element], option_name=element)
+
+            options[element] = value
+
+            if element in _FILE_OPTIONS and not _isfile(value):
+                missing_files.append((value, element, i + 1))
+        elif len(element) > 2:
+            if element not in _DEFAULT_FLAGS:
+                raise UnsupportedFlag(token=element, position=i, command=command_name, candidates=_FLAG_NAMES)
+            if allowed_flags is not None and element not in allowed_flags:
+                raise ForbiddenFlag(token=element, position=i, command=command_name)
+
+            flags[element] = True
+
+    return options, flags
+
+
+def _is_option_or_flag(element):
+    return len(element) >= 2 and element[0] == '-' and element != '--'
+
+
+def _resolve_names(argv):
+    resolved_argv = list(argv)
+    command_name = ''
+
+    for i in range(1, len(argv)):
+        element = argv[i]
+
+        if element and (element[0] == '-' or i == 1) and element != '-' and element != '--':
+            name = _NAME_RESOLUTIONS.get(element)
+
+            if name == '':
+                matching_names = sorted({target for prefix, target in _NAME_TARGETS.items()
+                                         if prefix.startswith(element)})
+                raise AmbiguousAbbreviation(token=element, position=i, command=command_name,
+                                            matching_names=matching_names, num_of_matching_names=len(matching_names))
+            if name is not None:
+                resolved_argv[i] = name
+            if i == 1 and element[0] != '-':
+                command_name = resolved_argv[1]
+
+    return resolved_argv
+
+
+def _print_help(argv):
+    if len(argv) == 3 and argv[2] in _COMMAND_HELP_ELEMENTS:
+        option_names, flag_names = _COMMAND_HELP_ELEMENTS[argv[2]]
+        print(InterfaceHelper.render_command_help(
+            _PROGRAM_NAME, argv[2], _HELP_ENTRIES[(CommandLineElementType.COMMAND.value, argv[2])],
+            [_HELP_ENTRIES[(CommandLineElementType.OPTION.value, name)] for name in option_names],
+            [_HELP_ENTRIES[(CommandLineElementType.FLAG.value, name)] for name in flag_names]))
+    elif len(argv) > 3 and argv[2] == _SEARCH_FLAG_NAME:
+        terms = argv[3:]
+        print(InterfaceHelper.render_search_help(_PROGRAM_NAME, terms, [
+            (element_type, _HELP_ENTRIES[(element_type.value, name)])
+            for element_type, name in HelpIndex.rank(_HELP_POSTINGS, terms, _HELP_TOKENS)]))
+    else:
+        print(_HELP_TEXT)
+
+
+def _check_files(command_name, missing_files):
+    if missing_files:
+        path, element, position = missing_files[0]
+        raise MissingFile(token=path, position=position, command=command_name, element=element,
+                          missing_files=missing_files, num_of_missing_files=len(missing_files))
+'''
+GENERATED_PARSE_FUNCTION: str = '''
+
+def parse(argv):
+    length = len(argv)
+
+    if (length == 1 and not _ALLOW_NO_ARGUMENTS) or (length > 1 and argv[1] in _HELP_INDICATORS):
+        _print_help(argv)
+        return ParsedCommand(_HELP_COMMAND_INDICATOR, [], {}, {})
+    if _NAME_RESOLUTIONS:
+        argv = _resolve_names(argv)
+    if length > 1 and argv[1] and argv[1][0] != '-':
+        command_parser = _COMMAND_PARSERS.get(argv[1])
+
+        if command_parser is None:
+            raise UnsupportedCommand(token=argv[1], position=1, candidates=_COMMAND_NAMES)
+
+        return command_parser(argv, length)
+
+    missing_files = []
+    options, flags = _parse_elements(argv, length, 1, '', None, None, missing_files)
+    _check_files('', missing_files)
+
+    return ParsedCommand('', [], options, flags)
+'''
+
+
+class ParserGenerator:
+    """
+    Generator of standalone Python modules containing a parser specialized for exactly one command line interface
+    definition. Generated module exposes parse(argv) function which raises the same exceptions and returns the same
+    ParsedCommand as CommandLineInterface.parse(argv), but the whole definition is stored in literal dict, set and tuple
+    constants and every command has its own parsing function with inlined checks of its values, options, flags and
+    required options. Module has to be regenerated whenever the definition changes.
+    """
+    @staticmethod
+    def generate(cli: CommandLineInterface) -> str:
+        # generated parser contains the whole definition, so lazily defined commands are loaded first
+        cli.load_commands()
+        shared_constants: SharedConstants = {}
+        command_parsers: str = ''.join(ParserGenerator.__get_command_parser(cli, command_name, index, shared_constants)
+                                       for index, command_name in enumerate(cli.get_commands().keys()))
+        source: str = GENERATED_MODULE_HEADER + GENERATED_MODULE_IMPORTS
+        source += ParserGenerator.__get_constants(cli)
+        source += ''.join(f'{name} = {literal}\n' for literal, name in shared_constants.items())
+        source += GENERATED_ELEMENTS_PARSER
+        source += command_parsers
+        source += '\n\n_COMMAND_PARSERS = {\n'
+        for index, command_name in enumerate(cli.get_commands().keys()):
+            source += f'    {command_name!r}: _parse_command_{index},\n'
+        source += '}\n'
+        source += GENERATED_PARSE_FUNCTION
+
+        return source
+
+    @staticmethod
+    def write(cli: CommandLineInterface, module_path: str) -> None:
+        with open(module_path, 'w', encoding='utf-8') as module_file:
+            module_file.write(ParserGenerator.generate(cli))
+
+    @staticmethod
+    def __get_constants(cli: CommandLineInterface) -> str:
+        constants: str = '\n'
+        constants += f'_HELP_TEXT = {cli.get_help()!r}\n'
+        constants += f'_HELP_INDICATORS = ' \
+                     f'{ParserGenerator.__get_set_literal([HELP_COMMAND_NAME, HELP_OPTION_NAME, HELP_FLAG_NAME])}\n'
+        constants += f'_HELP_COMMAND_INDICATOR = {HELP_COMMAND_INDICATOR!r}\n'
+        constants += ParserGenerator.__get_help_constants(cli)
+        constants += f'_ALLOW_NO_ARGUMENTS = {cli.is_no_arguments_allowed()!r}\n'
+        constants += f'_COMMAND_NAMES = {tuple(cli.get_commands().keys())!r}\n'
+        constants += f'_OPTION_NAMES = {tuple(cli.get_options().keys())!r}\n'
+        constants += f'_FLAG_NAMES = {tuple(cli.get_flags().keys())!r}\n'
+        constants += '_OPTIONS = {\n'
+        for option_name, option_properties in cli.get_options().items():
+            allowed_values: str = ParserGenerator.__get_set_literal(option_properties.allowed_values)
+            constants += f'    {option_name!r}: {allowed_values},\n'
+        constants += '}\n'
+        constants += '_OPTION_VALUE_LISTS = {\n'
+        for option_name, option_properties in cli.get_options().items():
+            constants += f'    {option_name!r}: {tuple(option_properties.allowed_values)!r},\n'
+        constants += '}\n'
+        constants += f'_DEFAULT_FLAGS = {dict.fromkeys(cli.get_flags().keys(), False)!r}\n'
+        constants += f'_FILE_OPTIONS = ' \
+                     f'{ParserGenerator.__get_set_literal(ParserGenerator.__get_file_option_names(cli))}\n'
+        constants += ParserGenerator.__get_name_resolution_constants(cli)
+
+        return constants
+
+    @staticmethod
+    def __get_help_constants(cli: CommandLineInterface) -> str:
+        # help of a single command and search results are rendered from help of their entries, so that the generated
+        # module prints the same help as CommandLineInterface.parse(argv) without the definition
+        commands, options, flags = cli.get_commands(), cli.get_options(), cli.get_flags()
+        help_postings: Postings = HelpIndex(commands, options, flags).get_postings()
+        elements: Tuple[Tuple[CommandLineElementType, dict], ...] = ((CommandLineElementType.COMMAND, commands),
+                                                                     (CommandLineElementType.OPTION, options),
+                                                                     (CommandLineElementType.FLAG, flags))
+        help_entries: Dict[Tuple[int, str], str] = {
+            (element_type.value, name): InterfaceHelper.get_entry_help(element_type, name, commands, options, flags)
+            for element_type, names in elements for name in names.keys()}
+        command_help_elements: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+            command_name: (tuple(name for name in command_properties.allowed_options if name in options),
+                           tuple(name for name in command_properties.allowed_flags if name in flags))
+            for command_name, command_properties in commands.items()}
+        constants: str = f'_PROGRAM_NAME = {cli.get_program_name()!r}\n'
+        constants += f'_SEARCH_FLAG_NAME = {SEARCH_FLAG_NAME!r}\n'
+        constants += f'_HELP_ENTRIES = {help_entries!r}\n'
+        constants += f'_COMMAND_HELP_ELEMENTS = {command_help_elements!r}\n'
+        constants += f'_HELP_POSTINGS = {help_postings!r}\n'
+        constants += f'_HELP_TOKENS = {sorted(help_postings.keys())!r}\n'
+
+        return constants
+
+    @staticmethod
+    def __get_command_parser(cli: CommandLineInterface, command_name: str, index: int,
+                             shared_constants: SharedConstants) -> str:
+        command_properties: CommandProperties = cli.get_commands()[command_name]
+        num_of_values: int = command_properties.num_of_required_values
+        allowed_options: str = ParserGenerator.__get_shared_constant(
+            ParserGenerator.__get_set_literal(command_properties.allowed_options), shared_constants)
+        allowed_flags: str = ParserGenerator.__get_shared_constant(
+            ParserGenerator.__get_set_literal(command_properties.allowed_flags), shared_constants)
+        lines: List[str] = ['', '', f'def _parse_command_{index}(argv, length):']
+
+        if num_of_values > 0:
+            lines += [f'    if length <= {1 + num_of_values} or _is_option_or_flag(argv[2]):',
+                      f'        raise MissingCommandValue(token={command_name!r}, position=1, '
+                      f'command={command_name!r}, num_of_required_values={num_of_values})',
+                      '',
+                      f'    values = argv[2:{2 + num_of_values}]']
+
+            if command_properties.allowed_values:
+                allowed_values: str = ParserGenerator.__get_shared_constant(
+                    ParserGenerator.__get_set_literal(command_properties.allowed_values), shared_constants)
+                allowed_values_list: str = ParserGenerator.__get_shared_constant(
+                    repr(tuple(command_properties.allowed_values)), shared_constants)
+                lines += ['',
+                          f'    if not {allowed_values}.issuperset(values):',
+                          f'        unsupported_values = [(value, 2 + i) for i, value in enumerate(values) '
+                          f'if value not in {allowed_values}]',
+                          f'        raise UnsupportedCommandValue(token=unsupported_values[0][0], '
+                          f'position=unsupported_values[0][1], command={command_name!r}, '
+                          f'candidates={allowed_values_list}, unsupported_values=unsupported_values)']
+        else:
+            lines.append('    values = []')
+
+        lines += ['', '    missing_files = []']
+
+        if num_of_values > 0 and command_properties.value_type == ValueType.FILE:
+            lines += [f'    missing_files += [(value, {command_name!r}, 2 + i) for i, value in enumerate(values) '
+                      f'if not _isfile(value)]']
+
+        lines += [f'    options, flags = _parse_elements(argv, length, 2, {command_name!r}, {allowed_options}, '
+                  f'{allowed_flags}, missing_files)']
+
+        if command_properties.required_options:
+            lines.append('')
+
+        for required_option in command_properties.required_options:
+            lines += [f'    if {required_option!r} not in options:',
+                      f'        raise MissingRequiredOption(token={required_option!r}, command={command_name!r})']
+
+        if command_properties.compiled_constraints is not None:
+            compiled_constraints: str = ParserGenerator.__get_shared_constant(
+                repr(command_properties.compiled_constraints), shared_constants)
+            lines += ['', f'    ConstraintChecker.check({command_name!r}, options, flags, {compiled_constraints})']
+
+        lines += ['', f'    _check_files({command_name!r}, missing_files)',
+                  '', f'    return ParsedCommand({command_name!r}, values, options, flags)']
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def __get_name_resolution_constants(cli: CommandLineInterface) -> str:
+        name_targets: Dict[str, str] = {**{name: name for names in (cli.get_commands(), cli.get_options(),
+                                                                    cli.get_flags()) for name in names.keys()},
+                                        **cli.get_aliases()}
+
+        if cli.are_abbreviations_enabled():
+            name_trie: PrefixTrie = PrefixTrie()
+
+            for name, target in name_targets.items():
+                name_trie.add(name, target)
+
+            # every prefix (including ambiguous ones) is resolved with a single lookup, names resolve to themselves
+            name_resolutions: Dict[str, str] = {prefix: target for prefix, target in sorted(name_trie.items())
+                                                if prefix not in name_targets or prefix in cli.get_aliases()}
+        else:
+            name_resolutions = dict(cli.get_aliases())
+
+        return f'_NAME_TARGETS = {name_targets!r}\n_NAME_RESOLUTIONS = {name_resolutions!r}\n'
+
+    @staticmethod
+    def __get_file_option_names(cli: CommandLineInterface) -> List[str]:
+        return [option_name for option_name, option_properties in cli.get_options().items()
+                if option_properties.value_type == ValueType.FILE]
+
+    @staticmethod
+    def __get_shared_constant(literal: str, shared_constants: SharedConstants) -> str:
+        # commands usually share the same sets of options, flags and values, so every distinct literal is emitted once
+        if literal not in shared_constants:
+            shared_constants[literal] = f'_CONSTANT_{len(shared_constants)}'
+
+        return shared_constants[literal]
+
+    @staticmethod
+    def __get_set_literal(values: List[str]) -> str:
+        # elements are sorted, so that generated module does not depend on hash randomization
+        return f'frozenset({{{", ".join(repr(value) for value in sorted(set(values)))}}})' if values else 'frozenset()'
@@ -0,0 +1,25 @@
+from importlib.metadata import EntryPoint
+from typing import Any, Callable, Iterable, Optional, Union
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.parsed_command import ParsedCommand
+from comlint.types import CommandName, ExitStatus
+
+CommandHandlerGetter = Callable[[EntryPoint, CommandName], CommandHandlerInterface]
+
+
+class PluginCommandHandler(CommandHandlerInterface):
+    """
+    Placeholder registered for commands contributed by plugins. The plugin module is imported only when one of its
+    commands is run for the first time, and then every run is delegated to the handler provided by the plugin.
+    """
+    def __init__(self, get_command_handler: CommandHandlerGetter, entry_point: EntryPoint, command_name: CommandName):
+        self.entry_point: EntryPoint = entry_point
+        self.command_name: CommandName = command_name
+        self.__get_command_handler: CommandHandlerGetter = get_command_handler
+        self.__command_handler: Optional[CommandHandlerInterface] = None
+
+    def run(self, command: ParsedCommand) -> Optional[Union[ExitStatus, Iterable[Any]]]:
+        if self.__command_handler is None:
+            self.__command_handler = self.__get_command_handler(self.entry_point, self.command_name)
+
+        return self.__command_handler.run(command)
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import threading
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Dict, List, Optional, Tuple
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.command_plugin_interface import CommandPluginInterface
+from comlint.definition_row_parser import DefinitionRow, COMMAND_COLUMNS, OPTION_COLUMNS, FLAG_COLUMNS
+from comlint.exceptions.invalid_plugin import InvalidPlugin
+from comlint.plugin_command_handler import PluginCommandHandler
+from comlint.types import CommandName
+from comlint.value_type import ValueType
+
+PluginManifest = Dict[str, Any]
+PluginEntry = Dict[str, Any]
+
+DEFAULT_PLUGIN_GROUP: str = 'comlint.plugins'
+NAME_COLUMN_INDEX: int = 0
+METADATA_FILE_NAME: str = 'METADATA'
+MISSING_HANDLER_TEMPLATE: str = 'Unable to load plugin {token}! It provides no handler for command {command_name}.'
+IMPORT_ERROR_TEMPLATE: str = 'Unable to load plugin {token}! {error_type}: {error}'
+INVALID_INTERFACE_TEMPLATE: str = 'Unable to load plugin {token}! {value} does not implement CommandPluginInterface.'
+
+
+class PluginLoader:
+    """
+    Loader of commands contributed by installed packages through entry points. Descriptions of the commands, options
+    and flags of all plugins are stored in a manifest file together with a fingerprint built from names and versions
+    of the distributions providing the plugins. As long as the fingerprint does not change, the interface is defined
+    from the manifest only, and the plugin module is imported only when one of its commands is run. Whenever any
+    plugin is installed, removed or upgraded, all plugins are imported once again and the manifest is rewritten. Without
+    manifest_path, plugins are imported on every load.
+    """
+    def __init__(self, manifest_path: str = '', group: str = DEFAULT_PLUGIN_GROUP):
+        self.manifest_path: str = manifest_path
+        self.group: str = group
+        self.__plugins: Dict[str, CommandPluginInterface] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def load(self, cli: CommandLineInterface) -> None:
+        plugin_entry_points: List[EntryPoint] = sorted(entry_points(group=self.group), key=lambda ep: ep.name)
+        fingerprint: str = PluginLoader.__get_fingerprint(plugin_entry_points)
+        manifest: Optional[PluginManifest] = self.__read_manifest()
+
+        if manifest is None or manifest.get('fingerprint') != fingerprint:
+            manifest = {'fingerprint': fingerprint,
+                        'plugins': [self.__get_plugin_entry(entry_point) for entry_point in plugin_entry_points]}
+            self.__write_manifest(manifest)
+
+        command_rows: List[list] = []
+        option_rows: Dict[str, list] = {}
+        flag_rows: Dict[str, list] = {}
+
+        # definitions of all plugins are added at once, and options and flags commonly shared by plugins are added
+        # only if they are not added yet
+        for plugin_entry in manifest['plugins']:
+            command_rows += plugin_entry['commands']
+
+            for row in plugin_entry['options']:
+                option_rows.setdefault(row[NAME_COLUMN_INDEX], row)
+            for row in plugin_entry['flags']:
+                flag_rows.setdefault(row[NAME_COLUMN_INDEX], row)
+
+        cli.add_options([row for name, row in option_rows.items() if name not in cli.get_options()])
+        cli.add_flags([row for name, row in flag_rows.items() if name not in cli.get_flags()])
+        cli.add_commands(command_rows)
+
+        for plugin_entry in manifest['plugins']:
+            entry_point: EntryPoint = EntryPoint(plugin_entry['name'], plugin_entry['value'], self.group)
+
+            for row in plugin_entry['commands']:
+                cli.add_command_handler(row[NAME_COLUMN_INDEX], PluginCommandHandler(self.get_command_handler,
+                                                                                     entry_point,
+                                                                                     row[NAME_COLUMN_INDEX]))
+
+    def get_command_handler(self, entry_point: EntryPoint, command_name: CommandName) -> CommandHandlerInterface:
+        command_handler: Optional[CommandHandlerInterface] = self.get_plugin(entry_point).get_command_handler(
+            command_name)
+
+        if command_handler is None:
+            raise InvalidPlugin(token=entry_point.name, template=MISSING_HANDLER_TEMPLATE, command_name=command_name)
+
+        return command_handler
+
+    def get_plugin(self, entry_point: EntryPoint) -> CommandPluginInterface:
+        with self.__lock:
+            if entry_point.value not in self.__plugins:
+                self.__plugins[entry_point.value] = PluginLoader.__import_plugin(entry_point)
+
+            return self.__plugins[entry_point.value]
+
+    def __get_plugin_entry(self, entry_point: EntryPoint) -> PluginEntry:
+        plugin: CommandPluginInterface = self.get_plugin(entry_point)
+
+        return {'name': entry_point.name, 'value': entry_point.value,
+                'commands': [PluginLoader.__get_manifest_row(row, COMMAND_COLUMNS) for row in plugin.get_commands()],
+                'options': [PluginLoader.__get_manifest_row(row, OPTION_COLUMNS) for row in plugin.get_options()],
+                'flags': [PluginLoader.__get_manifest_row(row, FLAG_COLUMNS) for row in plugin.get_flags()]}
+
+    @staticmethod
+    def __import_plugin(entry_point: EntryPoint) -> CommandPluginInterface:
+        try:
+            plugin: Any = entry_point.load()
+        except (ImportError, AttributeError) as e:
+            raise InvalidPlugin(token=entry_point.name, template=IMPORT_ERROR_TEMPLATE, error_type=type(e).__name__,
+                                error=e) from e
+
+        if isinstance(plugin, type) and issubclass(plugin, CommandPluginInterface):
+            plugin = plugin()
+        if not isinstance(plugin, CommandPluginInterface):
+            raise InvalidPlugin(token=entry_point.name, template=INVALID_INTERFACE_TEMPLATE, value=entry_point.value)
+
+        return plugin
+
+    @staticmethod
+    def __get_manifest_row(row: DefinitionRow, columns: Tuple[str, ...]) -> List[Any]:
+        values: List[Any] = [row.get(column) for column in columns] if isinstance(row, dict) else \
+            list(row) + [None] * (len(columns) - len(row))
+
+        # rows are stored as JSON, so value types are stored by names and tuples become lists
+        return [value.name if isinstance(value, ValueType) else list(value) if isinstance(value, tuple) else value
+                for value in values]
+
+    @staticmethod
+    def __get_fingerprint(plugin_entry_points: List[EntryPoint]) -> str:
+        fingerprint: hashlib.sha1 = hashlib.sha1()
+
+        # raw metadata contains name and version of the distribution and reading it is much cheaper than parsing it
+        for entry_point in plugin_entry_points:
+            metadata: str = ''
+
+            if entry_point.dist is not None:
+                metadata = entry_point.dist.read_text(METADATA_FILE_NAME) or ''
+
+            fingerprint.update(f'{entry_point.name}\0{entry_point.value}\0{metadata}\0'.encode('utf-8'))
+
+        return fingerprint.hexdigest()
+
+    def __read_manifest(self) -> Optional[PluginManifest]:
+        if not self.manifest_path or not os.path.isfile(self.manifest_path):
+            return None
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+
+    def __write_manifest(self, manifest: PluginManifest) -> None:
+        if not self.manifest_path:
+            return
+
+        try:
+            with open(self.manifest_path, 'w', encoding='utf-8') as manifest_file:
+                json.dump(manifest, manifest_file)
+        except OSError:
+            pass
@@ -0,0 +1,74 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from comlint.prefix_trie_node import PrefixTrieNode
+
+AMBIGUOUS_TARGET: str = ''
+
+
+class PrefixTrie:
+    """
+    Prefix tree of names (e.g. names of commands and their aliases) mapped to target names. Every node knows the target
+    which all names below it are mapped to, or that there are different ones, so a token is resolved in time
+    proportional to its length, no matter how many names are stored:
+        - name stored in the trie is resolved to its target, even if it is a prefix of other names
+        - prefix of names mapped to exactly one target is resolved to that target
+        - prefix of names mapped to different targets is resolved to AMBIGUOUS_TARGET
+        - any other token is not resolved at all
+    """
+    def __init__(self):
+        self.__root: PrefixTrieNode = PrefixTrieNode()
+
+    def add(self, name: str, target: str) -> None:
+        node: PrefixTrieNode = self.__root
+
+        for character in name:
+            node = node.children.setdefault(character, PrefixTrieNode(unique_target=target))
+
+            if node.unique_target != target:
+                node.unique_target = AMBIGUOUS_TARGET
+
+        node.target = target
+
+    def resolve(self, token: str) -> Optional[str]:
+        node: Optional[PrefixTrieNode] = self.__root
+
+        for character in token:
+            node = node.children.get(character)
+
+            if node is None:
+                return None
+
+        return node.target if node.target is not None else node.unique_target
+
+    def get_targets(self, prefix: str) -> List[str]:
+        node: Optional[PrefixTrieNode] = self.__root
+
+        for character in prefix:
+            node = node.children.get(character)
+
+            if node is None:
+                return []
+
+        # ambiguous prefixes are rare, so the subtree is searched only when the targets are really needed
+        targets: Dict[str, None] = {}
+        nodes: List[PrefixTrieNode] = [node]
+
+        while nodes:
+            node = nodes.pop()
+
+            if node.target is not None:
+                targets[node.target] = None
+
+            nodes += node.children.values()
+
+        return sorted(targets)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        nodes: List[Tuple[str, PrefixTrieNode]] = [('', self.__root)]
+
+        while nodes:
+            prefix, node = nodes.pop()
+
+            if prefix:
+                yield prefix, node.target if node.target is not None else node.unique_target
+
+            nodes += ((prefix + character, child) for character, child in node.children.items())
@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass(slots=True)
+class PrefixTrieNode:
+    children: Dict[str, 'PrefixTrieNode'] = field(default_factory=dict)
+    target: Optional[str] = None
+    unique_target: Optional[str] = None
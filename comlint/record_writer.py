@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+import os
+import sys
+from typing import Any, Iterable, Optional, TextIO
+from comlint.output_format import OutputFormat
+
+DEFAULT_BUFFER_SIZE: int = 64 * 1024
+
+
+class RecordWriter:
+    """
+    Output stage serializing records returned (or yielded) by command handlers. Serialized records are accumulated in
+    memory and written to the stream in chunks of at least buffer_size characters, so emitting millions of records
+    results in a small number of large writes. Records are consumed lazily, one chunk at a time, so a generator never
+    runs further ahead than a single buffer when the consumer of the stream is slow. Supported output formats:
+        - TEXT - each record is written in its own line as str(record)
+        - JSON_LINES - each record is written in its own line as JSON document
+        - CSV - each record is written as CSV row; dictionaries are written with a header built from the keys of the
+                first record, sequences are written as they are and any other value as a single column row
+    If the reader of the stream goes away (e.g. output is piped to head), writing stops silently. If the records raise
+    an exception, records produced before it are written before the exception is propagated.
+    """
+    def __init__(self, stream: Optional[TextIO] = None, output_format: OutputFormat = OutputFormat.TEXT,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.stream: Optional[TextIO] = stream
+        self.output_format: OutputFormat = output_format
+        self.buffer_size: int = buffer_size
+        self.broken_pipe: bool = False
+
+    def write_records(self, records: Iterable[Any]) -> int:
+        stream: TextIO = self.stream if self.stream is not None else sys.stdout
+        buffer: io.StringIO = io.StringIO()
+        csv_writer: Any = None
+        num_of_records: int = 0
+        self.broken_pipe = False
+
+        try:
+            for record in records:
+                if self.output_format == OutputFormat.TEXT:
+                    buffer.write(f'{record}\n')
+                elif self.output_format == OutputFormat.JSON_LINES:
+                    buffer.write(json.dumps(record, default=str))
+                    buffer.write('\n')
+                else:
+                    if csv_writer is None:
+                        csv_writer = RecordWriter.__create_csv_writer(buffer, record)
+                    RecordWriter.__write_csv_row(csv_writer, record)
+
+                num_of_records += 1
+
+                if buffer.tell() >= self.buffer_size:
+                    RecordWriter.__flush(buffer, stream)
+
+            RecordWriter.__flush(buffer, stream)
+            stream.flush()
+        except BrokenPipeError:
+            self.broken_pipe = True
+            RecordWriter.__silence(stream)
+        except Exception:
+            # records produced before the handler failed are still written, so that the output ends at the failure
+            try:
+                RecordWriter.__flush(buffer, stream)
+                stream.flush()
+            except BrokenPipeError:
+                self.broken_pipe = True
+                RecordWriter.__silence(stream)
+            raise
+        finally:
+            if hasattr(records, 'close'):
+                records.close()
+
+        return num_of_records
+
+    @staticmethod
+    def __flush(buffer: io.StringIO, stream: TextIO) -> None:
+        stream.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+
+    @staticmethod
+    def __create_csv_writer(buffer: io.StringIO, first_record: Any) -> Any:
+        if isinstance(first_record, dict):
+            writer: csv.DictWriter = csv.DictWriter(buffer, fieldnames=list(first_record.keys()), lineterminator='\n')
+            writer.writeheader()
+            return writer
+
+        return csv.writer(buffer, lineterminator='\n')
+
+    @staticmethod
+    def __write_csv_row(writer: Any, record: Any) -> None:
+        if isinstance(record, (dict, list, tuple)):
+            writer.writerow(record)
+        else:
+            writer.writerow([record])
+
+    @staticmethod
+    def __silence(stream: TextIO) -> None:
+        # Python flushes stdout at exit, which would raise BrokenPipeError once again, so remaining output is
+        # redirected to devnull instead
+        if stream is sys.stdout:
+            try:
+                devnull: int = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull, sys.stdout.fileno())
+            except (OSError, ValueError, io.UnsupportedOperation):
+                pass
@@ -0,0 +1,30 @@
+import math
+from dataclasses import dataclass, field
+from typing import List
+
+REPORTED_PERCENTILES: List[float] = [50.0, 90.0, 99.0, 99.9]
+
+
+@dataclass
+class ReplayReport:
+    latencies: List[float] = field(default_factory=list)
+    num_of_failures: int = 0
+
+    def get_percentile(self, percentile: float) -> float:
+        if not self.latencies:
+            return 0.0
+
+        sorted_latencies: List[float] = sorted(self.latencies)
+        rank: int = max(math.ceil(percentile / 100.0 * len(sorted_latencies)), 1)
+
+        return sorted_latencies[min(rank, len(sorted_latencies)) - 1]
+
+    def get_summary(self) -> str:
+        summary: str = f'{len(self.latencies)} invocations, {self.num_of_failures} failed\n'
+
+        for percentile in REPORTED_PERCENTILES:
+            summary += f'{"{0: <10}".format(f"p{percentile:g}")}{self.get_percentile(percentile) * 1e6:.1f} us\n'
+
+        summary += f'{"{0: <10}".format("max")}{max(self.latencies, default=0.0) * 1e6:.1f} us\n'
+
+        return summary
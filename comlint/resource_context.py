@@ -0,0 +1,168 @@
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from comlint.exceptions.duplicated_resource import DuplicatedResource
+from comlint.exceptions.unsupported_resource import UnsupportedResource
+from comlint.resource_definition import ResourceDefinition, ResourceFactory, ResourceCloser
+
+CLOSING_METHOD_NAMES: Tuple[str, ...] = ('close', 'shutdown')
+
+
+class ResourceContext:
+    """
+    Registry of resources shared by command handlers (e.g. database connections, thread pools or caches), available
+    to handlers as resources attribute of the parsed command. Resource is created by its factory, which gets the
+    context (so that it may get other resources it depends on), only when it is requested for the first time, and then
+    it is reused by all handlers run in the same process. Resources are either:
+        - shared - single instance returned by get() to every caller, which has to be thread-safe if handlers run
+                   concurrently
+        - pooled - up to pool_size instances, each of them lent to one caller at a time with acquire(), which waits
+                   when all of them are in use
+    Factories run without holding the lock of the context, so a slow factory delays only callers waiting for the same
+    resource. Resources are torn down by close() in the reverse order of their creation, so resources are closed before
+    the ones they depend on. Callers waiting for a pooled resource are woken up by close(), and new instances are
+    created for them. Closer of the resource is called if given, otherwise its close() or shutdown() method (if any).
+    Context closes itself at the interpreter exit, if it was not closed before.
+    """
+    def __init__(self):
+        self.__definitions: Dict[str, ResourceDefinition] = {}
+        self.__creation_order: List[Tuple[ResourceDefinition, Any]] = []
+        self.__lock: threading.Lock = threading.Lock()
+        self.__changed: threading.Condition = threading.Condition(self.__lock)
+        self.__is_exit_handler_registered: bool = False
+
+    def __enter__(self) -> 'ResourceContext':
+        return self
+
+    def __exit__(self, exception_type: Any, exception: Any, traceback: Any) -> None:
+        self.close()
+
+    def register(self, name: str, factory: ResourceFactory, pool_size: int = 0,
+                 closer: Optional[ResourceCloser] = None) -> None:
+        with self.__lock:
+            if name in self.__definitions:
+                raise DuplicatedResource(token=name)
+
+            self.__definitions[name] = ResourceDefinition(factory, pool_size, closer)
+
+    def is_created(self, name: str) -> bool:
+        with self.__lock:
+            return bool(self.__get_definition(name).instances)
+
+    def get(self, name: str) -> Any:
+        with self.__lock:
+            definition: ResourceDefinition = self.__get_definition(name)
+
+            if definition.is_pooled():
+                raise UnsupportedResource(token=name, template='Resource {token} is pooled, so it has to be acquired!')
+
+            # only one caller creates the shared instance, the others wait for it
+            while not definition.instances and definition.num_of_reserved_instances > 0:
+                self.__changed.wait()
+
+            if definition.instances:
+                return definition.instances[0]
+
+            definition.num_of_reserved_instances += 1
+
+        return self.__create(definition)
+
+    @contextmanager
+    def acquire(self, name: str) -> Iterator[Any]:
+        with self.__lock:
+            definition: ResourceDefinition = self.__get_definition(name)
+
+        if not definition.is_pooled():
+            yield self.get(name)
+            return
+
+        with self.__lock:
+            while not definition.idle_instances and \
+                    len(definition.instances) + definition.num_of_reserved_instances >= definition.pool_size:
+                self.__changed.wait()
+
+            instance: Any = definition.idle_instances.pop() if definition.idle_instances else None
+
+            if instance is None:
+                definition.num_of_reserved_instances += 1
+
+        if instance is None:
+            instance = self.__create(definition)
+
+        try:
+            yield instance
+        finally:
+            with self.__lock:
+                # instances created before the context was closed are not returned to the pool
+                if definition.is_instance(instance):
+                    definition.idle_instances.append(instance)
+
+                self.__changed.notify_all()
+
+    def close(self) -> None:
+        with self.__lock:
+            creation_order: List[Tuple[ResourceDefinition, Any]] = self.__creation_order
+            self.__creation_order = []
+
+            for definition in self.__definitions.values():
+                definition.instances.clear()
+                definition.idle_instances.clear()
+
+            if self.__is_exit_handler_registered:
+                atexit.unregister(self.close)
+                self.__is_exit_handler_registered = False
+
+            self.__changed.notify_all()
+
+        # every resource is closed, even if closing some of them fails, and the first failure is re-raised at the end
+        first_error: Optional[BaseException] = None
+
+        for definition, instance in reversed(creation_order):
+            try:
+                ResourceContext.__close_instance(definition, instance)
+            except Exception as e:
+                first_error = first_error or e
+
+        if first_error is not None:
+            raise first_error
+
+    def __get_definition(self, name: str) -> ResourceDefinition:
+        if name not in self.__definitions:
+            raise UnsupportedResource(token=name)
+
+        return self.__definitions[name]
+
+    def __create(self, definition: ResourceDefinition) -> Any:
+        # instance has been reserved by the caller, so the factory runs without the lock and may get other resources
+        try:
+            instance: Any = definition.factory(self)
+        except BaseException:
+            with self.__lock:
+                definition.num_of_reserved_instances -= 1
+                self.__changed.notify_all()
+            raise
+
+        with self.__lock:
+            definition.num_of_reserved_instances -= 1
+            definition.instances.append(instance)
+            self.__creation_order.append((definition, instance))
+
+            if not self.__is_exit_handler_registered:
+                atexit.register(self.close)
+                self.__is_exit_handler_registered = True
+
+            self.__changed.notify_all()
+
+        return instance
+
+    @staticmethod
+    def __close_instance(definition: ResourceDefinition, instance: Any) -> None:
+        if definition.closer is not None:
+            definition.closer(instance)
+            return
+
+        for method_name in CLOSING_METHOD_NAMES:
+            if callable(getattr(instance, method_name, None)):
+                getattr(instance, method_name)()
+                return
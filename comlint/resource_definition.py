@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+ResourceFactory = Callable[[Any], Any]
+ResourceCloser = Callable[[Any], None]
+
+
+@dataclass(slots=True)
+class ResourceDefinition:
+    factory: ResourceFactory
+    pool_size: int = 0
+    closer: Optional[ResourceCloser] = None
+    # instances created so far, instances of the pool which are not acquired at the moment and number of instances
+    # being created by factories, which run without the lock of the context
+    instances: List[Any] = field(default_factory=list)
+    idle_instances: List[Any] = field(default_factory=list)
+    num_of_reserved_instances: int = 0
+
+    def is_pooled(self) -> bool:
+        return self.pool_size > 0
+
+    def is_instance(self, instance: Any) -> bool:
+        return any(created_instance is instance for created_instance in self.instances)
@@ -0,0 +1,24 @@
+from abc import abstractmethod
+from typing import Any, Optional, Tuple, Union
+from comlint.types import CommandName, CommandValue, OptionName, OptionValue, FlagName, ExitStatus
+
+ResultCacheKey = Tuple[CommandName, Tuple[CommandValue, ...], Tuple[Tuple[OptionName, OptionValue], ...],
+                       Tuple[FlagName, ...]]
+ResultCacheEntry = Union[ExitStatus, Tuple[Any, ...]]
+
+
+class ResultCacheInterface:
+    hits: int = 0
+    misses: int = 0
+
+    @abstractmethod
+    def get(self, key: ResultCacheKey) -> Optional[ResultCacheEntry]:
+        pass
+
+    @abstractmethod
+    def put(self, key: ResultCacheKey, entry: ResultCacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self, command_name: Optional[CommandName] = None) -> None:
+        pass
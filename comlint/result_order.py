@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ResultOrder(Enum):
+    ORDERED = 0
+    AS_COMPLETED = 1
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from comlint.types import ExitStatus
+
+
+@dataclass(slots=True)
+class RunResult:
+    argv: List[str]
+    exit_status: ExitStatus
+    stdout: str
+    stderr: str
+    exception: Optional[BaseException] = None
+    duration: float = 0.0
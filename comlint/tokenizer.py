@@ -0,0 +1,39 @@
+import sys
+from typing import List
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.command_line_token import CommandLineToken
+from comlint.interface_validator import OPTION_PREFIX, FLAG_PREFIX, MIN_OPTION_NAME_LENGTH, MIN_FLAG_NAME_LENGTH
+
+COMMAND_POSITION: int = 1
+
+
+class Tokenizer:
+    """
+    Lexer stage of parsing, which classifies every command line argument (except the program name) exactly once. Each
+    argument becomes a token holding its type, its interned text and its position in the command line arguments.
+    Classification depends only on the form of the argument and its position, not on the interface definition, so
+    tokens may be used by tools (e.g. linters or completion) without paying for full validation:
+        - COMMAND - argument directly after the program name which does not start with a dash
+        - OPTION - argument starting with a single dash, at least 2 characters long
+        - FLAG - argument starting with a double dash, at least 3 characters long
+        - CUSTOM_VALUE - any other argument (e.g. value of a command or of an option)
+    """
+    @staticmethod
+    def tokenize(argv: List[str]) -> List[CommandLineToken]:
+        return [CommandLineToken(Tokenizer.get_element_type(argv[position], position), sys.intern(argv[position]),
+                                 position)
+                for position in range(1, len(argv))]
+
+    @staticmethod
+    def get_element_type(element: str, position: int) -> CommandLineElementType:
+        if not element:
+            return CommandLineElementType.CUSTOM_VALUE
+        if element[0] != OPTION_PREFIX:
+            return CommandLineElementType.COMMAND if position == COMMAND_POSITION else \
+                CommandLineElementType.CUSTOM_VALUE
+        if element[:2] != FLAG_PREFIX:
+            return CommandLineElementType.OPTION if len(element) >= MIN_OPTION_NAME_LENGTH else \
+                CommandLineElementType.CUSTOM_VALUE
+
+        return CommandLineElementType.FLAG if len(element) >= MIN_FLAG_NAME_LENGTH else \
+            CommandLineElementType.CUSTOM_VALUE
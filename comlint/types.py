@@ -4,6 +4,7 @@ CommandName = str
 OptionName = str
 FlagName = str
 
+CommandNames = List[CommandName]
 OptionNames = List[OptionName]
 FlagNames = List[FlagName]
 
@@ -16,3 +17,8 @@ FlagsMap = Dict[FlagName, bool]
 
 ANY: List[str] = []
 NONE: List[str] = []
+
+ExitStatus = int
+
+SUCCESS: ExitStatus = 0
+FAILURE: ExitStatus = 1
@@ -16,3 +16,7 @@ def get_similar_values(list_of_values: list, value: str, delimiter: str = ''):
             similar_values += list_value + delimiter
 
     return similar_values if not similar_values else similar_values[:-len(delimiter)]
+
+
+def find_similar(values, value: str) -> list:
+    return [other_value for other_value in values if value in other_value or other_value in value]
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ValueType(Enum):
+    TEXT = 0
+    FILE = 1
@@ -0,0 +1,121 @@
+import argparse
+import unittest
+
+from comlint.argparse_converter import ArgparseConverter
+from comlint.command_line_interface import CommandLineInterface
+from comlint.constraint_type import ConstraintType
+from comlint.exceptions.forbidden_option_value import ForbiddenOptionValue
+from comlint.exceptions.missing_one_of_elements import MissingOneOfElements
+from comlint.exceptions.missing_required_option import MissingRequiredOption
+from comlint.exceptions.mutually_exclusive_elements import MutuallyExclusiveElements
+from comlint.exceptions.unsupported_command_value import UnsupportedCommandValue
+from comlint.parsed_command import ParsedCommand
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog='pkg', description='Package manager')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--color', choices=['auto', 'never'], help='Coloring of output')
+    parser.add_argument('--version', action='version', version='1.0')
+    subparsers = parser.add_subparsers(dest='command')
+
+    install_parser: argparse.ArgumentParser = subparsers.add_parser('install', aliases=['i'], help='Installs package')
+    install_parser.add_argument('package')
+    install_parser.add_argument('-t', '--target', required=True, help='Target directory')
+    install_parser.add_argument('--jobs', type=int, help='Number of jobs')
+    group = install_parser.add_mutually_exclusive_group()
+    group.add_argument('--user', action='store_true', help='Install for user')
+    group.add_argument('--system', action='store_true', help='Install for system')
+
+    mode_parser: argparse.ArgumentParser = subparsers.add_parser('mode', description='Switches mode')
+    mode_parser.add_argument('mode', choices=['fast', 'slow'])
+    mode_parser.add_argument('-q', action='count', help='Quietness')
+    required_group = mode_parser.add_mutually_exclusive_group(required=True)
+    required_group.add_argument('--now', action='store_true')
+    required_group.add_argument('--later', action='store_true')
+
+    subparsers.add_parser('list', help='Lists packages').add_argument('patterns', nargs='*')
+
+    return parser
+
+
+class TestArgparseConverter(unittest.TestCase):
+    def test_definition_is_converted(self):
+        cli: CommandLineInterface = ArgparseConverter.convert(create_parser())
+
+        self.assertEqual(list(cli.get_commands().keys()), ['install', 'mode', 'list'])
+        self.assertEqual(sorted(cli.get_options().keys()), ['-color', '-jobs', '-t'])
+        self.assertEqual(sorted(cli.get_flags().keys()), ['--later', '--now', '--q', '--system', '--user',
+                                                          '--verbose'])
+        self.assertEqual(cli.get_aliases(), {'i': 'install'})
+
+        install = cli.get_commands()['install']
+        self.assertEqual((install.description, install.num_of_required_values, install.required_options),
+                         ('Installs package', 1, ('-t',)))
+        self.assertEqual(install.allowed_options, ('-color', '-t', '-jobs'))
+        self.assertEqual(install.allowed_flags, ('--verbose', '--user', '--system'))
+        self.assertEqual([(constraint.constraint_type, constraint.names) for constraint in install.constraints],
+                         [(ConstraintType.MUTUALLY_EXCLUSIVE, ('--user', '--system'))])
+
+        self.assertEqual(cli.get_commands()['mode'].description, 'Switches mode')
+        self.assertEqual(cli.get_commands()['mode'].allowed_values, ('fast', 'slow'))
+        self.assertEqual(cli.get_commands()['list'].num_of_required_values, 0)
+        self.assertEqual(cli.get_options()['-color'].allowed_values, ('auto', 'never'))
+
+    def test_converted_interface_parses_equivalent_command_lines(self):
+        cli: CommandLineInterface = ArgparseConverter.convert(create_parser())
+
+        self.assertEqual(cli.parse(['pkg', 'i', 'numpy', '-t', '/opt', '--user', '-color', 'auto']),
+                         ParsedCommand('install', ['numpy'], {'-t': '/opt', '-color': 'auto'},
+                                       {'--verbose': False, '--user': True, '--system': False, '--q': False,
+                                        '--now': False, '--later': False}))
+
+    def test_converted_interface_rejects_what_argparse_rejects(self):
+        cli: CommandLineInterface = ArgparseConverter.convert(create_parser())
+
+        with self.assertRaises(MissingRequiredOption):
+            cli.parse(['pkg', 'install', 'numpy'])
+        with self.assertRaises(MutuallyExclusiveElements):
+            cli.parse(['pkg', 'install', 'numpy', '-t', '/opt', '--user', '--system'])
+        with self.assertRaises(UnsupportedCommandValue):
+            cli.parse(['pkg', 'mode', 'medium', '--now'])
+        with self.assertRaises(MissingOneOfElements):
+            cli.parse(['pkg', 'mode', 'fast'])
+        with self.assertRaises(ForbiddenOptionValue):
+            cli.parse(['pkg', 'list', '-color', 'always'])
+
+    def test_mutually_exclusive_groups_of_main_parser_are_checked_for_every_command(self):
+        parser: argparse.ArgumentParser = create_parser()
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument('--quiet', action='store_true')
+        group.add_argument('--level', type=int)
+        cli: CommandLineInterface = ArgparseConverter.convert(parser)
+
+        for command_name in cli.get_commands().keys():
+            self.assertIn((ConstraintType.MUTUALLY_EXCLUSIVE, ('--quiet', '-level')),
+                          [(constraint.constraint_type, constraint.names)
+                           for constraint in cli.get_commands()[command_name].constraints])
+        with self.assertRaises(MutuallyExclusiveElements):
+            cli.parse(['pkg', 'list', '--quiet', '-level', '3'])
+        with self.assertRaises(MutuallyExclusiveElements):
+            cli.parse(['pkg', 'install', 'numpy', '-t', '/opt', '-level', '3', '--quiet'])
+
+    def test_choices_of_positional_arguments_are_converted_to_strings(self):
+        parser: argparse.ArgumentParser = argparse.ArgumentParser(prog='pkg')
+        parser.add_subparsers(dest='command').add_parser('level').add_argument('n', type=int, choices=[1, 2, 3])
+        cli: CommandLineInterface = ArgparseConverter.convert(parser)
+
+        self.assertEqual(cli.get_commands()['level'].allowed_values, ('1', '2', '3'))
+        self.assertEqual(cli.parse(['pkg', 'level', '2']).values, ['2'])
+        with self.assertRaises(UnsupportedCommandValue):
+            cli.parse(['pkg', 'level', '4'])
+
+    def test_program_name_and_description_are_taken_from_parser(self):
+        cli: CommandLineInterface = ArgparseConverter.convert(create_parser(), argv=['pkg', 'list'])
+
+        self.assertIn('Package manager', cli.get_help())
+        self.assertEqual(cli.parse().name, 'list')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import pickle
+import unittest
+from typing import Iterator, List
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.error_code import ErrorCode
+from comlint.exceptions.comlint_error import ComlintError, NO_POSITION
+from comlint.exceptions.forbidden_option_value import ForbiddenOptionValue
+from comlint.exceptions.missing_required_option import MissingRequiredOption
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.exceptions.unsupported_flag import UnsupportedFlag
+
+
+class CountingCandidates:
+    def __init__(self, candidates: List[str]):
+        self.candidates: List[str] = candidates
+        self.num_of_iterations: int = 0
+
+    def __iter__(self) -> Iterator[str]:
+        self.num_of_iterations += 1
+        return iter(self.candidates)
+
+
+class TestComlintError(unittest.TestCase):
+    def test_message_is_formatted_from_template(self):
+        error: MissingRequiredOption = MissingRequiredOption(token='-s', command='merge')
+
+        self.assertEqual(str(error), 'Command merge requires option -s, but such option has not been provided!')
+        self.assertEqual(error.error_code, ErrorCode.MISSING_REQUIRED_OPTION)
+        self.assertEqual(error.position, NO_POSITION)
+
+    def test_ready_message_is_used_as_it_is(self):
+        error: UnsupportedCommand = UnsupportedCommand('Some {braced} message')
+
+        self.assertEqual(str(error), 'Some {braced} message')
+        self.assertEqual(error.error_code, ErrorCode.UNSUPPORTED_COMMAND)
+
+    def test_message_or_template_is_passed_to_exception(self):
+        self.assertEqual(UnsupportedCommand('Some message').args, ('Some message',))
+        self.assertEqual(MissingRequiredOption(token='-s').args, (MissingRequiredOption.template,))
+        self.assertEqual(UnsupportedCommand(token='x', template='Other {token}').args, ('Other {token}',))
+
+    def test_details_are_used_in_message(self):
+        error: ForbiddenOptionValue = ForbiddenOptionValue(token='x', option_name='-s')
+
+        self.assertEqual(str(error), 'Given value x for option -s is not allowed!')
+        self.assertEqual(error.details, {'option_name': '-s'})
+
+    def test_suggestions_are_computed_only_when_requested(self):
+        candidates: CountingCandidates = CountingCandidates(['open_file', 'open_folder', 'close_file'])
+        error: UnsupportedCommand = UnsupportedCommand(token='open', candidates=candidates)
+
+        self.assertEqual(candidates.num_of_iterations, 0)
+        self.assertEqual(str(error), 'Command open is not supported! Did you mean:\nopen_file\nopen_folder')
+        self.assertEqual(error.suggestions, ['open_file', 'open_folder'])
+        self.assertEqual(candidates.num_of_iterations, 1)
+
+    def test_error_survives_pickling(self):
+        error: UnsupportedFlag = UnsupportedFlag(token='--verb', position=3, command='add', candidates={'--verbose': 1})
+
+        unpickled_error: UnsupportedFlag = pickle.loads(pickle.dumps(error))
+
+        self.assertIsInstance(unpickled_error, UnsupportedFlag)
+        self.assertEqual(str(unpickled_error), str(error))
+        self.assertEqual((unpickled_error.token, unpickled_error.position, unpickled_error.command),
+                         ('--verb', 3, 'add'))
+
+    def test_parse_raises_structured_errors(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'add', 'file', '--verb'])
+        cli.add_command('add', 'Add file', num_of_required_values=1, allowed_flags=['--verbose'])
+        cli.add_flag('--verbose', 'Be verbose')
+
+        with self.assertRaises(ComlintError) as context:
+            cli.parse()
+
+        self.assertIsInstance(context.exception, UnsupportedFlag)
+        self.assertEqual(context.exception.error_code, ErrorCode.UNSUPPORTED_FLAG)
+        self.assertEqual((context.exception.token, context.exception.position, context.exception.command),
+                         ('--verb', 3, 'add'))
+        self.assertEqual(str(context.exception), 'Flag --verb is not supported! Did you mean:\n--verbose')
+
+    def test_suggestions_may_be_disabled(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'ad'], suggestions_enabled=False)
+        cli.add_command('add', 'Add file')
+
+        with self.assertRaises(UnsupportedCommand) as context:
+            cli.parse()
+
+        self.assertEqual(context.exception.suggestions, [])
+        self.assertEqual(str(context.exception), 'Command ad is not supported!')
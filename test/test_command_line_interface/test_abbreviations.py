@@ -0,0 +1,101 @@
+import unittest
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.error_code import ErrorCode
+from comlint.exceptions.ambiguous_abbreviation import AmbiguousAbbreviation
+from comlint.exceptions.duplicated_command import DuplicatedCommand
+from comlint.exceptions.invalid_flag_name import InvalidFlagName
+from comlint.exceptions.undefined_reference import UndefinedReference
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.parsed_command import ParsedCommand
+
+
+def create_cli(abbreviations_enabled: bool = True) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], abbreviations_enabled=abbreviations_enabled)
+    cli.add_command('install', 'Installs package', 1, allowed_options=['-target'], allowed_flags=['--verbose'])
+    cli.add_command('instance', 'Shows instance')
+    cli.add_command('status', 'Shows status', allowed_flags=['--verbose', '--version'])
+    cli.add_option('-target', 'Target directory')
+    cli.add_flag('--verbose', 'Verbose output')
+    cli.add_flag('--version', 'Shows version')
+
+    return cli
+
+
+class TestCommandLineInterfaceAbbreviations(unittest.TestCase):
+    def test_unique_prefixes_are_resolved_to_names(self):
+        cli: CommandLineInterface = create_cli()
+
+        self.assertEqual(cli.parse(['program.exe', 'instal', 'numpy', '-t', '/opt', '--verb']),
+                         ParsedCommand('install', ['numpy'], {'-target': '/opt'}, {'--verbose': True,
+                                                                                   '--version': False}))
+        self.assertEqual(cli.parse(['program.exe', 's']).name, 'status')
+
+    def test_command_values_are_not_resolved(self):
+        cli: CommandLineInterface = create_cli()
+
+        self.assertEqual(cli.parse(['program.exe', 'install', 'st']).values, ['st'])
+
+    def test_ambiguous_prefix_raises_error_listing_matching_names(self):
+        cli: CommandLineInterface = create_cli()
+
+        with self.assertRaises(AmbiguousAbbreviation) as context:
+            cli.parse(['program.exe', 'status', '--ver'])
+
+        self.assertEqual(context.exception.error_code, ErrorCode.AMBIGUOUS_ABBREVIATION)
+        self.assertEqual((context.exception.token, context.exception.position, context.exception.command),
+                         ('--ver', 2, 'status'))
+        self.assertEqual(context.exception.details['matching_names'], ['--verbose', '--version'])
+        self.assertEqual(str(context.exception),
+                         "Abbreviation --ver is ambiguous! It matches 2 names: ['--verbose', '--version'].")
+
+    def test_prefixes_are_not_resolved_when_abbreviations_are_disabled(self):
+        cli: CommandLineInterface = create_cli(abbreviations_enabled=False)
+
+        with self.assertRaises(UnsupportedCommand):
+            cli.parse(['program.exe', 'stat'])
+
+    def test_aliases_are_resolved_with_and_without_abbreviations(self):
+        for abbreviations_enabled in [True, False]:
+            cli: CommandLineInterface = create_cli(abbreviations_enabled)
+            cli.add_alias('i', 'install')
+            cli.add_alias('--vv', '--verbose')
+
+            self.assertEqual(cli.parse(['program.exe', 'i', 'numpy', '--vv']),
+                             ParsedCommand('install', ['numpy'], {}, {'--verbose': True, '--version': False}))
+
+    def test_alias_resolves_prefix_which_would_be_ambiguous(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_alias('inst', 'install')
+
+        self.assertEqual(cli.parse(['program.exe', 'inst', 'numpy']).name, 'install')
+        self.assertEqual(cli.parse(['program.exe', 'instan']).name, 'instance')
+
+    def test_names_added_after_parsing_are_resolved(self):
+        cli: CommandLineInterface = create_cli()
+        self.assertEqual(cli.parse(['program.exe', 'st']).name, 'status')
+
+        cli.add_command('stop', 'Stops')
+
+        with self.assertRaises(AmbiguousAbbreviation):
+            cli.parse(['program.exe', 'st'])
+
+    def test_invalid_aliases_raise_errors(self):
+        cli: CommandLineInterface = create_cli()
+
+        with self.assertRaises(UndefinedReference):
+            cli.add_alias('u', 'uninstall')
+        with self.assertRaises(InvalidFlagName):
+            cli.add_alias('-v', '--verbose')
+        with self.assertRaises(DuplicatedCommand):
+            cli.add_alias('status', 'install')
+
+    def test_snapshot_keeps_aliases_and_abbreviations(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_alias('i', 'install')
+
+        self.assertEqual(cli.snapshot().parse(['program.exe', 'i', 'numpy', '--verb']).name, 'install')
+
+
+if __name__ == '__main__':
+    unittest.main()
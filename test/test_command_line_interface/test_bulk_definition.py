@@ -0,0 +1,124 @@
+import csv
+import io
+import unittest
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.command_properties import CommandProperties
+from comlint.error_code import ErrorCode
+from comlint.exceptions.duplicated_command import DuplicatedCommand
+from comlint.exceptions.duplicated_flag import DuplicatedFlag
+from comlint.exceptions.invalid_command_name import InvalidCommandName
+from comlint.exceptions.invalid_option_name import InvalidOptionName
+from comlint.exceptions.invalid_value_type import InvalidValueType
+from comlint.exceptions.undefined_reference import UndefinedReference
+from comlint.option_properties import OptionProperties
+from comlint.parsed_command import ParsedCommand
+
+
+class TestCommandLineInterfaceBulkDefinition(unittest.TestCase):
+    def test_bulk_definition_is_equal_to_one_by_one_definition(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        bulk_cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        cli.add_command('command_1', 'Some command 1')
+        cli.add_command('command_2', 'Some command 2', 1, ['a', 'b'], ['-option'], ['--flag'], ['-option'])
+        cli.add_option('-option', 'Some option', ['x', 'y'])
+        cli.add_flag('--flag', 'Some flag')
+        bulk_cli.add_commands([('command_1', 'Some command 1'),
+                               {'command_name': 'command_2', 'description': 'Some command 2',
+                                'num_of_required_values': 1, 'allowed_values': ['a', 'b'],
+                                'allowed_options': ['-option'], 'allowed_flags': ['--flag'],
+                                'required_options': ['-option']}])
+        bulk_cli.add_options([('-option', 'Some option', ['x', 'y'])])
+        bulk_cli.add_flags([('--flag', 'Some flag')])
+
+        self.assertEqual(bulk_cli.get_commands(), cli.get_commands())
+        self.assertEqual(bulk_cli.get_options(), cli.get_options())
+        self.assertEqual(bulk_cli.get_flags(), cli.get_flags())
+
+    def test_commands_are_read_from_csv(self):
+        csv_text: str = 'command_name,description,num_of_required_values,allowed_options,required_options\n' \
+                        'command,Some command,1,-a -b,-a\n'
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        cli.add_commands(csv.DictReader(io.StringIO(csv_text)))
+        cli.add_options([('-a', 'Option a'), ('-b', 'Option b', 'x y')])
+
+        self.assertEqual(cli.get_commands()['command'], CommandProperties((), ('-a', '-b'), (), 'Some command', 1,
+                                                                          ('-a',)))
+        self.assertEqual(cli.get_options()['-b'], OptionProperties('Option b', ('x', 'y'), ''))
+        self.assertEqual(cli.parse(['program.exe', 'command', 'value', '-a', '1']),
+                         ParsedCommand('command', ['value'], {'-a': '1'}, {}))
+
+    def test_invalid_name_is_reported_and_nothing_is_added(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        with self.assertRaises(InvalidCommandName) as context:
+            cli.add_commands([('command_1', ''), ('-command_2', '')])
+        with self.assertRaises(InvalidOptionName):
+            cli.add_options([('--option', '')])
+
+        self.assertEqual(context.exception.token, '-command_2')
+        self.assertEqual(cli.get_commands(), {})
+
+    def test_malformed_rows_are_reported_with_definition_errors(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        with self.assertRaises(InvalidCommandName) as context:
+            cli.add_commands([{'command_name': 'command_1'}, {'description': 'Command without name'}])
+        with self.assertRaises(InvalidValueType) as value_type_context:
+            cli.add_options([('-option', 'Some option', None, 'NUMBER')])
+
+        self.assertEqual(context.exception.token, 'None')
+        self.assertEqual(str(value_type_context.exception),
+                         'Unable to add -option! Value type NUMBER is not one of: TEXT, FILE.')
+        self.assertEqual((cli.get_commands(), cli.get_options()), ({}, {}))
+
+    def test_duplicates_within_batch_and_with_existing_definition_are_reported(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        cli.add_command('command_1', '')
+        cli.add_flag('--flag_1', '')
+
+        with self.assertRaises(DuplicatedCommand) as context:
+            cli.add_commands([('command_2', ''), ('command_1', '')])
+        with self.assertRaises(DuplicatedFlag) as flag_context:
+            cli.add_flags([('--flag_2', ''), ('--flag_3', ''), ('--flag_2', '')])
+
+        self.assertEqual(context.exception.token, 'command_1')
+        self.assertEqual(flag_context.exception.token, '--flag_2')
+        self.assertEqual(list(cli.get_commands().keys()), ['command_1'])
+
+    def test_check_references_reports_all_undefined_names(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        cli.add_commands([('command_1', '', 0, [], ['-a', '-b'], ['--x']),
+                          ('command_2', '', 0, [], ['-a'], ['--y'], ['-c'])])
+        cli.add_options([('-a', '')])
+        cli.add_flags([('--x', '')])
+
+        with self.assertRaises(UndefinedReference) as context:
+            cli.check_references()
+
+        self.assertEqual(context.exception.error_code, ErrorCode.UNDEFINED_REFERENCE)
+        self.assertEqual((context.exception.command, context.exception.token), ('command_1', '-b'))
+        self.assertEqual(context.exception.details['undefined_references'],
+                         [('command_1', '-b'), ('command_2', '--y'), ('command_2', '-c')])
+        self.assertIn('3 undefined reference(s)', str(context.exception))
+
+    def test_check_references_checks_shared_list_against_every_kind_of_names(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        cli.add_command('a', '', allowed_flags=['--x'])
+        cli.add_command('b', '', allowed_options=['--x'])
+        cli.add_flag('--x', '')
+
+        with self.assertRaises(UndefinedReference) as context:
+            cli.check_references()
+
+        self.assertEqual(context.exception.details['undefined_references'], [('b', '--x')])
+
+    def test_check_references_passes_for_complete_definition(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        cli.add_command('command', '', allowed_options=['-a'], allowed_flags=['--x'], required_options=['-a'])
+        cli.add_option('-a', '')
+        cli.add_flag('--x', '')
+
+        cli.check_references()
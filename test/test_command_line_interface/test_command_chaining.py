@@ -0,0 +1,134 @@
+import os
+import tempfile
+import threading
+import unittest
+from typing import List, Optional
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.invocation_journal import InvocationJournal
+from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus, SUCCESS
+
+
+class RecordingCommandHandler(CommandHandlerInterface):
+    def __init__(self, calls: List[tuple], exit_status: ExitStatus = SUCCESS,
+                 barrier: Optional[threading.Barrier] = None):
+        self.calls: List[tuple] = calls
+        self.exit_status: ExitStatus = exit_status
+        self.barrier: Optional[threading.Barrier] = barrier
+
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+
+        self.calls.append((command.name, command.values, command.options))
+
+        return self.exit_status
+
+
+class FailingCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        raise ValueError('Handler failed!')
+
+
+def create_cli(calls: List[tuple], barrier: Optional[threading.Barrier] = None) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    cli.add_command('build', 'Builds target', 1, allowed_options=['-j'])
+    cli.add_command('test', 'Runs tests')
+    cli.add_command('lint', 'Runs linter')
+    cli.add_command('fail', 'Fails')
+    cli.add_command('raise', 'Raises')
+    cli.add_option('-j', 'Number of jobs')
+    cli.add_command_handler('build', RecordingCommandHandler(calls, barrier=barrier))
+    cli.add_command_handler('test', RecordingCommandHandler(calls, barrier=barrier))
+    cli.add_command_handler('lint', RecordingCommandHandler(calls))
+    cli.add_command_handler('fail', RecordingCommandHandler(calls, exit_status=3))
+    cli.add_command_handler('raise', FailingCommandHandler())
+
+    return cli
+
+
+class TestCommandLineInterfaceCommandChaining(unittest.TestCase):
+    def test_segments_are_run_in_order(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls)
+
+        self.assertEqual(cli.run_chain(['program.exe', 'build', 'app', '-j', '4', '+', 'test', '+', 'lint']), SUCCESS)
+        self.assertEqual(calls, [('build', ['app'], {'-j': '4'}), ('test', [], {}), ('lint', [], {})])
+
+    def test_command_line_without_delimiter_is_run_as_single_command(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls)
+
+        self.assertEqual(cli.run_chain(['program.exe', 'build', 'app']), SUCCESS)
+        self.assertEqual(calls, [('build', ['app'], {})])
+
+    def test_empty_segments_are_skipped(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls)
+
+        cli.run_chain(['program.exe', '+', 'test', '+', '+', 'lint', '+'])
+
+        self.assertEqual(calls, [('test', [], {}), ('lint', [], {})])
+
+    def test_custom_delimiter(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls)
+
+        cli.run_chain(['program.exe', 'build', '+', 'then', 'test'], delimiter='then')
+
+        self.assertEqual(calls, [('build', ['+'], {}), ('test', [], {})])
+
+    def test_nothing_is_run_when_any_segment_is_invalid(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls)
+
+        with self.assertRaises(UnsupportedCommand) as context:
+            cli.run_chain(['program.exe', 'test', '+', 'tset'])
+
+        self.assertEqual((context.exception.token, context.exception.position), ('tset', 1))
+        self.assertEqual(calls, [])
+
+    def test_chain_stops_on_first_failed_segment(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls)
+
+        self.assertEqual(cli.run_chain(['program.exe', 'test', '+', 'fail', '+', 'lint']), 3)
+        self.assertEqual(calls, [('test', [], {}), ('fail', [], {})])
+
+    def test_concurrent_segments_are_run_at_once(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls, barrier=threading.Barrier(2))
+
+        self.assertEqual(cli.run_chain(['program.exe', 'build', 'app', '+', 'test'], concurrent=True), SUCCESS)
+        self.assertCountEqual(calls, [('build', ['app'], {}), ('test', [], {})])
+
+    def test_concurrent_chain_returns_highest_exit_status_after_all_segments(self):
+        calls: List[tuple] = []
+        cli: CommandLineInterface = create_cli(calls)
+
+        self.assertEqual(cli.run_chain(['program.exe', 'fail', '+', 'lint'], concurrent=True, max_workers=1), 3)
+        self.assertEqual(calls, [('fail', [], {}), ('lint', [], {})])
+
+        with self.assertRaises(ValueError):
+            cli.run_chain(['program.exe', 'raise', '+', 'lint'], concurrent=True)
+
+    def test_every_segment_is_recorded_in_journal(self):
+        with tempfile.TemporaryDirectory() as directory:
+            journal: InvocationJournal = InvocationJournal(os.path.join(directory, 'journal.log'))
+            cli: CommandLineInterface = CommandLineInterface(['program.exe'], journal=journal)
+            cli.add_command('test', 'Runs tests')
+            cli.add_command('fail', 'Fails')
+            cli.add_command_handler('test', RecordingCommandHandler([]))
+            cli.add_command_handler('fail', RecordingCommandHandler([], exit_status=3))
+
+            cli.run_chain(['program.exe', 'test', '+', 'fail'])
+
+            self.assertEqual([(record.argv, record.exit_status) for record in journal.read()],
+                             [(['program.exe', 'test'], SUCCESS), (['program.exe', 'fail'], 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
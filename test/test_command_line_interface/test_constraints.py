@@ -0,0 +1,104 @@
+import unittest
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.constraint_type import ConstraintType
+from comlint.error_code import ErrorCode
+from comlint.exceptions.conflicting_element import ConflictingElement
+from comlint.exceptions.invalid_constraint import InvalidConstraint
+from comlint.exceptions.missing_one_of_elements import MissingOneOfElements
+from comlint.exceptions.missing_required_element import MissingRequiredElement
+from comlint.exceptions.mutually_exclusive_elements import MutuallyExclusiveElements
+from comlint.exceptions.undefined_reference import UndefinedReference
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.parsed_command import ParsedCommand
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    cli.add_command('command', 'Some command', allowed_options=['-a', '-b', '-c'], allowed_flags=['--x', '--y'])
+    cli.add_option('-a', 'Option a')
+    cli.add_option('-b', 'Option b')
+    cli.add_option('-c', 'Option c')
+    cli.add_flag('--x', 'Flag x')
+    cli.add_flag('--y', 'Flag y')
+
+    return cli
+
+
+class TestCommandLineInterfaceConstraints(unittest.TestCase):
+    def test_mutually_exclusive_elements(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_constraint('command', ConstraintType.MUTUALLY_EXCLUSIVE, ['-a', '-b', '--x'])
+
+        self.assertEqual(cli.parse(['program.exe', 'command', '-a', '1', '--y']),
+                         ParsedCommand('command', [], {'-a': '1'}, {'--x': False, '--y': True}))
+        with self.assertRaises(MutuallyExclusiveElements) as context:
+            cli.parse(['program.exe', 'command', '--x', '-b', '1'])
+
+        self.assertEqual(context.exception.error_code, ErrorCode.MUTUALLY_EXCLUSIVE_ELEMENTS)
+        self.assertEqual((context.exception.token, context.exception.command), ('--x', 'command'))
+        self.assertEqual(str(context.exception),
+                         'Only one of -a, -b, --x may be used with command command, but -b, --x were used!')
+
+    def test_requires(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_constraint('command', ConstraintType.REQUIRES, ['--x', '-a', '-b'])
+
+        cli.parse(['program.exe', 'command', '-a', '1'])
+        cli.parse(['program.exe', 'command', '--x', '-a', '1', '-b', '2'])
+        with self.assertRaises(MissingRequiredElement) as context:
+            cli.parse(['program.exe', 'command', '--x', '-a', '1'])
+
+        self.assertEqual(context.exception.token, '-b')
+        self.assertEqual(context.exception.details['required_by'], '--x')
+
+    def test_conflicts_with(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_constraint('command', ConstraintType.CONFLICTS_WITH, ['-a', '--x', '--y'])
+
+        cli.parse(['program.exe', 'command', '--x', '--y'])
+        with self.assertRaises(ConflictingElement) as context:
+            cli.parse(['program.exe', 'command', '-a', '1', '--y'])
+
+        self.assertEqual(context.exception.token, '--y')
+        self.assertEqual(context.exception.details['conflicts_with'], '-a')
+
+    def test_at_least_one(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_constraint('command', ConstraintType.AT_LEAST_ONE, ['-c', '--y'])
+
+        cli.parse(['program.exe', 'command', '--y'])
+        with self.assertRaises(MissingOneOfElements) as context:
+            cli.parse(['program.exe', 'command', '-a', '1'])
+
+        self.assertEqual(context.exception.details['names'], '-c, --y')
+
+    def test_constraints_of_other_commands_are_not_checked(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_command('other', 'Other command', allowed_options=['-a', '-b'])
+        cli.add_constraint('command', ConstraintType.MUTUALLY_EXCLUSIVE, ['-a', '-b'])
+
+        self.assertEqual(cli.parse(['program.exe', 'other', '-a', '1', '-b', '2']).options, {'-a': '1', '-b': '2'})
+
+    def test_invalid_constraints_are_rejected(self):
+        cli: CommandLineInterface = create_cli()
+
+        with self.assertRaises(UnsupportedCommand):
+            cli.add_constraint('unknown', ConstraintType.AT_LEAST_ONE, ['-a'])
+        with self.assertRaises(InvalidConstraint):
+            cli.add_constraint('command', ConstraintType.REQUIRES, ['-a'])
+        with self.assertRaises(InvalidConstraint):
+            cli.add_constraint('command', ConstraintType.MUTUALLY_EXCLUSIVE, ['-a', '-a'])
+        with self.assertRaises(InvalidConstraint):
+            cli.add_constraint('command', ConstraintType.AT_LEAST_ONE, ['value'])
+        with self.assertRaises(InvalidConstraint):
+            cli.add_constraint('command', ConstraintType.AT_LEAST_ONE, [])
+
+    def test_check_references_reports_undefined_constraint_names(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_constraint('command', ConstraintType.CONFLICTS_WITH, ['-a', '--z'])
+
+        with self.assertRaises(UndefinedReference) as context:
+            cli.check_references()
+
+        self.assertEqual(context.exception.token, '--z')
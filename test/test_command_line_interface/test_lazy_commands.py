@@ -0,0 +1,144 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from typing import List
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.duplicated_command import DuplicatedCommand
+from comlint.exceptions.forbidden_option import ForbiddenOption
+from comlint.exceptions.invalid_command_name import InvalidCommandName
+from comlint.exceptions.invalid_definition_shard import InvalidDefinitionShard
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus, SUCCESS
+
+loaded_shards: List[str] = []
+
+
+class ArchiveCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        return SUCCESS
+
+
+def define_archive_commands(cli: CommandLineInterface) -> None:
+    loaded_shards.append('archive')
+    cli.add_command('pack', 'Packs files into archive', 1, allowed_options=['-l'], allowed_flags=['--verbose'])
+    cli.add_command('unpack', 'Unpacks files from archive', 1, allowed_flags=['--verbose'])
+    cli.add_option('-l', 'Compression level', ['1', '9'])
+    cli.add_command_handler('pack', ArchiveCommandHandler())
+
+
+def define_remote_commands(cli: CommandLineInterface) -> None:
+    loaded_shards.append('remote')
+    cli.add_commands([('push', 'Pushes files to remote', 0, [], ['-r'])])
+    cli.add_option('-r', 'Remote name')
+
+
+def create_cli() -> CommandLineInterface:
+    loaded_shards.clear()
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    cli.add_flag('--verbose', 'Verbose output')
+    cli.add_lazy_commands([('pack', 'Packs files into archive'), ('unpack', 'Unpacks files from archive')],
+                          define_archive_commands)
+    cli.add_lazy_commands([('push', 'Pushes files to remote')], f'{__name__}:define_remote_commands')
+
+    return cli
+
+
+class TestCommandLineInterfaceLazyCommands(unittest.TestCase):
+    def test_only_shard_of_invoked_command_is_loaded(self):
+        cli: CommandLineInterface = create_cli()
+
+        self.assertEqual(cli.parse(['program.exe', 'unpack', 'files.tar', '--verbose']),
+                         ParsedCommand('unpack', ['files.tar'], {}, {'--verbose': True}))
+        self.assertEqual(loaded_shards, ['archive'])
+        self.assertTrue(cli.is_command_loaded('pack'))
+        self.assertFalse(cli.is_command_loaded('push'))
+        self.assertEqual(cli.parse(['program.exe', 'pack', 'files.tar', '-l', '9']),
+                         ParsedCommand('pack', ['files.tar'], {'-l': '9'}, {'--verbose': False}))
+        self.assertEqual(cli.run(['program.exe', 'pack', 'files.tar']), SUCCESS)
+        self.assertEqual(loaded_shards, ['archive'])
+        self.assertRaises(ForbiddenOption, cli.parse, ['program.exe', 'unpack', 'files.tar', '-l', '9'])
+
+    def test_shard_loader_may_be_given_as_path(self):
+        cli: CommandLineInterface = create_cli()
+
+        self.assertEqual(cli.parse(['program.exe', 'push', '-r', 'origin']),
+                         ParsedCommand('push', [], {'-r': 'origin'}, {'--verbose': False}))
+        self.assertEqual(loaded_shards, ['remote'])
+
+    def test_help_lists_lazy_commands_without_loading_them(self):
+        cli: CommandLineInterface = create_cli()
+        help_text: str = cli.get_help()
+
+        self.assertIn('Packs files into archive', help_text)
+        self.assertIn('Pushes files to remote', help_text)
+        self.assertEqual(loaded_shards, [])
+
+    def test_detailed_help_of_command_loads_its_shard(self):
+        cli: CommandLineInterface = create_cli()
+        help_text: str = cli.get_command_help('pack')
+
+        self.assertIn('Usage of program.exe pack', help_text)
+        self.assertIn('Compression level', help_text)
+        self.assertIn('Verbose output', help_text)
+        self.assertNotIn('Unpacks files from archive', help_text)
+        self.assertEqual(loaded_shards, ['archive'])
+
+    def test_help_command_followed_by_command_name_prints_detailed_help(self):
+        cli: CommandLineInterface = create_cli()
+        output: io.StringIO = io.StringIO()
+
+        with redirect_stdout(output):
+            cli.parse(['program.exe', 'help', 'push'])
+
+        self.assertIn('Usage of program.exe push', output.getvalue())
+        self.assertIn('Remote name', output.getvalue())
+        self.assertEqual(loaded_shards, ['remote'])
+
+    def test_abbreviated_lazy_command_is_loaded(self):
+        loaded_shards.clear()
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'], abbreviations_enabled=True)
+        cli.add_lazy_commands([('push', 'Pushes files to remote')], define_remote_commands)
+
+        self.assertEqual(cli.parse(['program.exe', 'pu', '-r', 'origin']),
+                         ParsedCommand('push', [], {'-r': 'origin'}, {}))
+
+    def test_snapshot_and_reference_check_load_all_shards(self):
+        cli: CommandLineInterface = create_cli()
+        cli.check_references()
+
+        self.assertEqual(sorted(loaded_shards), ['archive', 'remote'])
+        self.assertTrue(cli.is_command_loaded('push'))
+
+        cli = create_cli()
+        cli.snapshot()
+
+        self.assertEqual(sorted(loaded_shards), ['archive', 'remote'])
+
+    def test_loading_keeps_order_of_commands(self):
+        cli: CommandLineInterface = create_cli()
+        cli.load_commands()
+
+        self.assertEqual(list(cli.get_commands().keys()), ['pack', 'unpack', 'push'])
+
+    def test_negative_cases(self):
+        cli: CommandLineInterface = create_cli()
+
+        self.assertRaises(DuplicatedCommand, cli.add_lazy_commands, [('pack', 'Packs')], define_archive_commands)
+        self.assertRaises(InvalidCommandName, cli.add_lazy_commands, [('-pack', 'Packs')], define_archive_commands)
+        self.assertRaises(UnsupportedCommand, cli.get_command_help, 'status')
+
+        cli.add_lazy_commands([('status', 'Shows status')], lambda loaded_cli: None)
+
+        self.assertRaises(InvalidDefinitionShard, cli.parse, ['program.exe', 'status'])
+        self.assertRaises(UnsupportedCommand, cli.parse, ['program.exe', 'status'])
+
+        cli.add_lazy_commands([('log', 'Shows log')], 'missing_module:define')
+
+        self.assertRaises(InvalidDefinitionShard, cli.parse, ['program.exe', 'log'])
+
+
+if __name__ == '__main__':
+    unittest.main()
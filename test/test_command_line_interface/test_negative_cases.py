@@ -80,6 +80,18 @@ class TestCommandLineInterfaceNegativeCases(unittest.TestCase):
         with self.assertRaises(UnsupportedCommandValue):
             cli.parse()
 
+    def test_parse_reports_all_unsupported_command_values(self):
+        argv: List[str] = ['program.exe', 'supported_command', 'value_1', 'bad_1', 'value_2', 'bad_2']
+        cli: CommandLineInterface = CommandLineInterface(argv)
+
+        cli.add_command('supported_command', 'Some supported_command', 4, ['value_1', 'value_2'])
+
+        with self.assertRaises(UnsupportedCommandValue) as context:
+            cli.parse()
+
+        self.assertEqual((context.exception.token, context.exception.position), ('bad_1', 3))
+        self.assertEqual(context.exception.details['unsupported_values'], [('bad_1', 3), ('bad_2', 5)])
+
     def test_parse_throws_unsupported_option(self):
         argv: List[str] = ['program.exe', 'supported_command', '-unsupported_option', 'option_value']
         cli: CommandLineInterface = CommandLineInterface(argv)
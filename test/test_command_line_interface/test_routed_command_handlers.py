@@ -0,0 +1,112 @@
+import unittest
+from typing import List
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.invalid_handler_route import InvalidHandlerRoute
+from comlint.exceptions.missing_command_handler import MissingCommandHandler
+from comlint.exceptions.undefined_reference import UndefinedReference
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.handler_router import MAX_NUM_OF_ROUTING_NAMES
+from comlint.parsed_command import ParsedCommand
+from comlint.types import ExitStatus, SUCCESS
+
+
+class NamedCommandHandler(CommandHandlerInterface):
+    def __init__(self, name: str, calls: List[str]):
+        self.name: str = name
+        self.calls: List[str] = calls
+
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        self.calls.append(self.name)
+
+        return SUCCESS
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    cli.add_command('export', 'Exports data', allowed_options=['-o'], allowed_flags=['--json', '--compress'])
+    cli.add_option('-o', 'Output file')
+    cli.add_flag('--json', 'JSON format')
+    cli.add_flag('--compress', 'Compress output')
+
+    return cli
+
+
+class TestCommandLineInterfaceRoutedCommandHandlers(unittest.TestCase):
+    def test_handler_is_chosen_by_used_options_and_flags(self):
+        calls: List[str] = []
+        cli: CommandLineInterface = create_cli()
+        cli.add_command_handler('export', NamedCommandHandler('default', calls))
+        cli.add_routed_command_handler('export', NamedCommandHandler('json', calls), present_names=['--json'])
+        cli.add_routed_command_handler('export', NamedCommandHandler('json_to_stdout', calls),
+                                       present_names=['--json'], absent_names=['-o'])
+        cli.add_routed_command_handler('export', NamedCommandHandler('compressed_file', calls),
+                                       present_names=['-o', '--compress'])
+
+        cli.run(['program.exe', 'export', '--json'])
+        cli.run(['program.exe', 'export', '--json', '-o', 'out.json'])
+        cli.run(['program.exe', 'export', '-o', 'out.gz', '--compress'])
+        cli.run(['program.exe', 'export', '-o', 'out.txt'])
+
+        self.assertEqual(calls, ['json_to_stdout', 'json', 'compressed_file', 'default'])
+
+    def test_missing_handler_is_reported_when_no_route_matches(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_routed_command_handler('export', NamedCommandHandler('json', []), present_names=['--json'])
+
+        with self.assertRaises(MissingCommandHandler):
+            cli.run(['program.exe', 'export'])
+
+    def test_invalid_routes_raise_errors(self):
+        cli: CommandLineInterface = create_cli()
+        handler: CommandHandlerInterface = NamedCommandHandler('handler', [])
+
+        with self.assertRaises(UnsupportedCommand):
+            cli.add_routed_command_handler('import', handler, present_names=['--json'])
+        with self.assertRaises(InvalidHandlerRoute):
+            cli.add_routed_command_handler('export', handler, present_names=['json'])
+        with self.assertRaises(InvalidHandlerRoute):
+            cli.add_routed_command_handler('export', handler)
+        with self.assertRaises(InvalidHandlerRoute):
+            cli.add_routed_command_handler('export', handler, present_names=['--json'], absent_names=['--json'])
+
+    def test_rejected_route_is_not_kept(self):
+        calls: List[str] = []
+        cli: CommandLineInterface = create_cli()
+
+        with self.assertRaises(InvalidHandlerRoute):
+            cli.add_routed_command_handler('export', NamedCommandHandler('too_many', calls),
+                                           present_names=[f'--flag{i}' for i in range(MAX_NUM_OF_ROUTING_NAMES + 1)])
+        cli.add_routed_command_handler('export', NamedCommandHandler('json', calls), present_names=['--json'])
+        cli.run(['program.exe', 'export', '--json'])
+
+        self.assertEqual(len(cli.get_commands()['export'].handler_routes), 1)
+        self.assertEqual(calls, ['json'])
+
+    def test_references_of_routes_are_checked(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_routed_command_handler('export', NamedCommandHandler('handler', []), present_names=['--yaml'])
+
+        with self.assertRaises(UndefinedReference) as context:
+            cli.check_references()
+
+        self.assertEqual(context.exception.token, '--yaml')
+
+    def test_references_of_routes_of_many_commands_are_checked(self):
+        cli: CommandLineInterface = create_cli()
+
+        for i in range(20):
+            cli.add_command(f'export{i}', 'Exports data', allowed_flags=['--json', '--compress'])
+            cli.add_routed_command_handler(f'export{i}', NamedCommandHandler('handler', []), present_names=['--json'],
+                                           absent_names=['--undefined' if i == 19 else '--compress'])
+
+        with self.assertRaises(UndefinedReference) as context:
+            cli.check_references()
+
+        self.assertEqual(context.exception.token, '--undefined')
+        self.assertEqual(context.exception.command, 'export19')
+
+
+if __name__ == '__main__':
+    unittest.main()
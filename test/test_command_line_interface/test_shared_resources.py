@@ -0,0 +1,82 @@
+import unittest
+from typing import List
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.interface_snapshot import InterfaceSnapshot
+from comlint.parsed_command import ParsedCommand
+from comlint.resource_context import ResourceContext
+from comlint.types import ExitStatus, SUCCESS
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries: List[str] = []
+        self.is_closed: bool = False
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+class QueryCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        with command.resources.acquire('connection') as connection:
+            connection.queries.append(command.values[0])
+
+        return SUCCESS
+
+
+def create_cli(created: List[FakeConnection]) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    cli.add_command('query', 'Runs query', 1)
+    cli.add_command_handler('query', QueryCommandHandler())
+    cli.resources.register('connection', lambda context: created.append(FakeConnection()) or created[-1],
+                           pool_size=2)
+
+    return cli
+
+
+class TestCommandLineInterfaceSharedResources(unittest.TestCase):
+    def test_resources_are_reused_across_handler_runs(self):
+        created: List[FakeConnection] = []
+        cli: CommandLineInterface = create_cli(created)
+
+        cli.run(['program.exe', 'query', 'first'])
+        cli.run_chain(['program.exe', 'query', 'second', '+', 'query', 'third'])
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(created[0].queries, ['first', 'second', 'third'])
+
+        cli.resources.close()
+
+        self.assertTrue(created[0].is_closed)
+
+    def test_resources_are_created_only_when_handler_uses_them(self):
+        created: List[FakeConnection] = []
+        cli: CommandLineInterface = create_cli(created)
+        cli.parse(['program.exe', 'query', 'first'])
+
+        self.assertEqual(created, [])
+
+    def test_snapshot_shares_resources_with_original_interface(self):
+        created: List[FakeConnection] = []
+        cli: CommandLineInterface = create_cli(created)
+        snapshot: InterfaceSnapshot = cli.snapshot()
+
+        cli.run(['program.exe', 'query', 'first'])
+        snapshot.run(['program.exe', 'query', 'second'])
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(created[0].queries, ['first', 'second'])
+
+        cli.resources.close()
+
+    def test_resource_context_may_be_given_to_interface(self):
+        resources: ResourceContext = ResourceContext()
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'], resources=resources)
+
+        self.assertIs(cli.resources, resources)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from typing import List
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.definition_interner import DefinitionInterner, Names, EMPTY_NAMES
+
+
+class TestDefinitionInterner(unittest.TestCase):
+    def test_equal_names_are_interned_into_the_same_tuple(self):
+        interner: DefinitionInterner = DefinitionInterner()
+
+        names: Names = interner.intern(['-a', '-b'])
+
+        self.assertEqual(names, ('-a', '-b'))
+        self.assertIs(interner.intern(['-a', '-b']), names)
+        self.assertIs(interner.intern(('-a', '-b')), names)
+        self.assertIsNot(interner.intern(['-b', '-a']), names)
+        self.assertEqual(len(interner), 2)
+
+    def test_empty_names_are_shared(self):
+        interner: DefinitionInterner = DefinitionInterner()
+
+        self.assertIs(interner.intern([]), EMPTY_NAMES)
+        self.assertEqual(len(interner), 0)
+
+    def test_commands_share_interned_names(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        cli.add_command('command_1', '', allowed_options=['-a', '-b'], allowed_flags=['--x'])
+        cli.add_commands([('command_2', '', 0, [], ['-a', '-b'], ['--x'])])
+
+        self.assertIs(cli.get_commands()['command_1'].allowed_options, cli.get_commands()['command_2'].allowed_options)
+        self.assertIs(cli.get_commands()['command_1'].allowed_flags, cli.get_commands()['command_2'].allowed_flags)
+
+    def test_definition_is_not_affected_by_changes_of_given_lists(self):
+        allowed_options: List[str] = ['-a']
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+
+        cli.add_command('command', '', allowed_options=allowed_options)
+        allowed_options.append('-b')
+
+        self.assertEqual(cli.get_commands()['command'].allowed_options, ('-a',))
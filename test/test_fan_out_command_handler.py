@@ -0,0 +1,150 @@
+import threading
+import time
+import unittest
+from typing import List, Optional
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.error_policy import ErrorPolicy
+from comlint.exceptions.invalid_fan_out_settings import InvalidFanOutSettings
+from comlint.executor_type import ExecutorType
+from comlint.fan_out_command_handler import FanOutCommandHandler, ValueFailure
+from comlint.parsed_command import ParsedCommand
+from comlint.result_order import ResultOrder
+from comlint.types import CommandValue, ExitStatus, SUCCESS, FAILURE
+
+
+class RecordingHandler(FanOutCommandHandler):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.collected: List[CommandValue] = []
+        self.reported_errors: List[List[ValueFailure]] = []
+        self.running: int = 0
+        self.max_running: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def run_value(self, command: ParsedCommand, value: CommandValue) -> Optional[ExitStatus]:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        if value == 'slow':
+            time.sleep(0.05)
+
+        with self.lock:
+            self.running -= 1
+
+        if value.startswith('bad'):
+            raise RuntimeError(value)
+        if value.startswith('status_'):
+            return int(value[len('status_'):])
+
+        return None
+
+    def on_result(self, value: CommandValue, status: ExitStatus) -> None:
+        self.collected.append(value)
+
+    def on_errors(self, errors: List[ValueFailure]) -> None:
+        self.reported_errors.append(errors)
+
+
+class UpperCaseHandler(FanOutCommandHandler):
+    def run_value(self, command: ParsedCommand, value: CommandValue) -> Optional[ExitStatus]:
+        return SUCCESS if value.upper() != value else FAILURE
+
+
+class TestFanOutCommandHandler(unittest.TestCase):
+    def test_run_returns_success_if_all_values_succeed(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=4)
+        command: ParsedCommand = ParsedCommand('add', [f'file_{i}' for i in range(20)], {}, {})
+
+        self.assertEqual(handler.run(command), SUCCESS)
+        self.assertEqual(sorted(handler.collected), sorted(command.values))
+
+    def test_run_returns_highest_exit_status(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=2)
+        command: ParsedCommand = ParsedCommand('add', ['status_0', 'status_3', 'status_2'], {}, {})
+
+        self.assertEqual(handler.run(command), 3)
+
+    def test_ordered_results_follow_command_values_order(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=4, chunk_size=2, result_order=ResultOrder.ORDERED)
+        values: List[CommandValue] = ['slow', 'a', 'b', 'c', 'd', 'e', 'f']
+        command: ParsedCommand = ParsedCommand('add', values, {}, {})
+
+        handler.run(command)
+
+        self.assertEqual(handler.collected, values)
+
+    def test_as_completed_results_do_not_wait_for_slow_values(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=2, result_order=ResultOrder.AS_COMPLETED)
+        command: ParsedCommand = ParsedCommand('add', ['slow', 'a', 'b'], {}, {})
+
+        handler.run(command)
+
+        self.assertEqual(handler.collected[-1], 'slow')
+
+    def test_fail_fast_reraises_first_error(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=1, error_policy=ErrorPolicy.FAIL_FAST)
+        command: ParsedCommand = ParsedCommand('add', ['a', 'bad_1', 'b', 'bad_2'], {}, {})
+
+        with self.assertRaisesRegex(RuntimeError, 'bad_1'):
+            handler.run(command)
+
+    def test_collect_errors_runs_all_values_and_reports_failure(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=2, chunk_size=3,
+                                                     error_policy=ErrorPolicy.COLLECT_ERRORS)
+        command: ParsedCommand = ParsedCommand('add', ['a', 'bad_1', 'b', 'bad_2', 'c'], {}, {})
+
+        self.assertEqual(handler.run(command), FAILURE)
+        self.assertEqual(handler.collected, command.values)
+        self.assertEqual([[value for value, _ in errors] for errors in handler.reported_errors], [['bad_1', 'bad_2']])
+
+    def test_errors_are_kept_per_run(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=2, error_policy=ErrorPolicy.COLLECT_ERRORS)
+
+        handler.run(ParsedCommand('add', ['bad_1', 'a'], {}, {}))
+        handler.run(ParsedCommand('add', ['a', 'b'], {}, {}))
+        handler.run(ParsedCommand('add', ['bad_2'], {}, {}))
+
+        self.assertEqual([[value for value, _ in errors] for errors in handler.reported_errors], [['bad_1'], ['bad_2']])
+
+    def test_in_flight_work_is_bounded(self):
+        handler: RecordingHandler = RecordingHandler(max_workers=8, max_in_flight=2)
+        command: ParsedCommand = ParsedCommand('add', ['slow'] * 6, {}, {})
+
+        handler.run(command)
+
+        self.assertLessEqual(handler.max_running, 2)
+
+    def test_process_pool_runs_values(self):
+        handler: UpperCaseHandler = UpperCaseHandler(executor_type=ExecutorType.PROCESS, max_workers=2, chunk_size=2)
+
+        self.assertEqual(handler.run(ParsedCommand('add', ['a', 'b', 'c'], {}, {})), SUCCESS)
+        self.assertEqual(handler.run(ParsedCommand('add', ['a', 'B', 'c'], {}, {})), FAILURE)
+
+    def test_invalid_settings_are_rejected(self):
+        with self.assertRaises(InvalidFanOutSettings):
+            RecordingHandler(chunk_size=0)
+        with self.assertRaises(InvalidFanOutSettings):
+            RecordingHandler(max_workers=0)
+        with self.assertRaises(InvalidFanOutSettings) as context:
+            RecordingHandler(max_in_flight=0)
+
+        self.assertEqual(str(context.exception), 'Fan-out setting max_in_flight must be positive, but 0 was given!')
+
+    def test_command_line_interface_run_returns_fan_out_exit_status(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'add', 'status_0', 'status_2'])
+
+        cli.add_command('add', 'Add files', num_of_required_values=2)
+        cli.add_command_handler('add', RecordingHandler(max_workers=2))
+
+        self.assertEqual(cli.run(), 2)
+
+    def test_command_line_interface_run_with_process_pool(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'add', 'a', 'B'])
+
+        cli.add_command('add', 'Add files', num_of_required_values=2)
+        cli.add_command_handler('add', UpperCaseHandler(executor_type=ExecutorType.PROCESS, max_workers=2))
+
+        self.assertEqual(cli.run(), FAILURE)
+        self.assertEqual(cli.run(['program.exe', 'add', 'a', 'b']), SUCCESS)
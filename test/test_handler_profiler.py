@@ -0,0 +1,86 @@
+import io
+import os
+import pstats
+import tempfile
+import unittest
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.handler_profiler import HandlerProfiler, PROFILE_ENVIRONMENT_VARIABLE, \
+    PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE
+from comlint.record_writer import RecordWriter
+
+
+def allocate_records(command):
+    return [str(i) * 100 for i in range(1000)]
+
+
+class TestHandlerProfiler(unittest.TestCase):
+    def setUp(self):
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_cli(self) -> CommandLineInterface:
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        handler: CommandHandlerInterface = CommandHandlerInterface()
+        handler.run = MagicMock(side_effect=allocate_records)
+
+        cli.add_command('list', 'List records')
+        cli.add_command('other', 'Other command')
+        cli.add_command_handler('list', handler, RecordWriter(io.StringIO()))
+        cli.add_command_handler('other', handler, RecordWriter(io.StringIO()))
+
+        return cli
+
+    def test_profiler_is_not_created_without_environment_variable(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(HandlerProfiler.from_environment())
+
+    def test_profiler_is_created_from_environment_variables(self):
+        with patch.dict(os.environ, {PROFILE_ENVIRONMENT_VARIABLE: 'list, other',
+                                     PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE: self.directory.name}):
+            profiler: Optional[HandlerProfiler] = HandlerProfiler.from_environment()
+
+        self.assertEqual(profiler.command_names, ['list', 'other'])
+        self.assertEqual(profiler.directory, self.directory.name)
+        self.assertTrue(profiler.is_profiled('list'))
+        self.assertFalse(profiler.is_profiled('help'))
+        self.assertTrue(HandlerProfiler(['*']).is_profiled('help'))
+
+    def test_run_writes_reports_of_profiled_command_only(self):
+        with patch.dict(os.environ, {PROFILE_ENVIRONMENT_VARIABLE: 'list',
+                                     PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE: self.directory.name}):
+            cli: CommandLineInterface = self.create_cli()
+
+        cli.run(['program.exe', 'other'])
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+        cli.run(['program.exe', 'list'])
+        statistics_path, report_path = HandlerProfiler(['list'], self.directory.name).get_report_paths('list')
+
+        with open(report_path, 'r', encoding='utf-8') as report_file:
+            report: str = report_file.read()
+
+        for section in ('Command: list', 'Parse duration:', 'Dispatch overhead:', 'Handler duration:',
+                        'Peak traced memory:', 'Top allocations:', 'CPU profile:', 'allocate_records'):
+            self.assertIn(section, report)
+        self.assertGreater(pstats.Stats(statistics_path).total_calls, 0)
+
+    def test_reports_are_written_when_handler_fails(self):
+        handler: CommandHandlerInterface = CommandHandlerInterface()
+        handler.run = MagicMock(side_effect=RuntimeError('failure'))
+
+        with patch.dict(os.environ, {PROFILE_ENVIRONMENT_VARIABLE: '*',
+                                     PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE: self.directory.name}):
+            cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        cli.add_command('fail', 'Failing command')
+        cli.add_command_handler('fail', handler)
+
+        with self.assertRaises(RuntimeError):
+            cli.run(['program.exe', 'fail'])
+
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['fail.prof', 'fail.profile.txt'])
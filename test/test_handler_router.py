@@ -0,0 +1,51 @@
+import unittest
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.error_code import ErrorCode
+from comlint.exceptions.invalid_handler_route import InvalidHandlerRoute
+from comlint.handler_route import HandlerRoute, CompiledRoutes
+from comlint.handler_router import HandlerRouter, MAX_NUM_OF_ROUTING_NAMES
+
+JSON_HANDLER: CommandHandlerInterface = CommandHandlerInterface()
+PRETTY_JSON_HANDLER: CommandHandlerInterface = CommandHandlerInterface()
+QUIET_HANDLER: CommandHandlerInterface = CommandHandlerInterface()
+
+
+def compile_routes() -> CompiledRoutes:
+    return HandlerRouter.compile('show', (HandlerRoute(JSON_HANDLER, ('--json',), ()),
+                                          HandlerRoute(PRETTY_JSON_HANDLER, ('--json', '-indent'), ()),
+                                          HandlerRoute(QUIET_HANDLER, (), ('--verbose',))))
+
+
+class TestHandlerRouter(unittest.TestCase):
+    def test_most_specific_matching_route_is_chosen(self):
+        compiled_routes: CompiledRoutes = compile_routes()
+
+        self.assertIs(HandlerRouter.route({'-indent': '2'}, {'--json': True, '--verbose': True}, compiled_routes),
+                      PRETTY_JSON_HANDLER)
+        self.assertIs(HandlerRouter.route({}, {'--json': True, '--verbose': True}, compiled_routes), JSON_HANDLER)
+        self.assertIs(HandlerRouter.route({}, {'--json': False, '--verbose': False}, compiled_routes), QUIET_HANDLER)
+        self.assertIsNone(HandlerRouter.route({}, {'--json': False, '--verbose': True}, compiled_routes))
+
+    def test_earlier_route_wins_among_equally_specific_routes(self):
+        compiled_routes: CompiledRoutes = compile_routes()
+
+        self.assertIs(HandlerRouter.route({}, {'--json': True, '--verbose': False}, compiled_routes), JSON_HANDLER)
+
+    def test_decision_table_has_entry_for_every_combination_of_names(self):
+        bits, table = compile_routes()
+
+        self.assertEqual(sorted(bits.keys()), ['--json', '--verbose', '-indent'])
+        self.assertEqual(len(table), 8)
+
+    def test_too_many_names_raise_error(self):
+        routes = tuple(HandlerRoute(JSON_HANDLER, (f'--flag{i}',), ()) for i in range(MAX_NUM_OF_ROUTING_NAMES + 1))
+
+        with self.assertRaises(InvalidHandlerRoute) as context:
+            HandlerRouter.compile('show', routes)
+
+        self.assertEqual(context.exception.error_code, ErrorCode.INVALID_HANDLER_ROUTE)
+
+
+if __name__ == '__main__':
+    unittest.main()
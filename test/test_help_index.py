@@ -0,0 +1,124 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from typing import List
+
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.command_line_interface import CommandLineInterface
+from comlint.command_properties import CommandProperties
+from comlint.flag_properties import FlagProperties
+from comlint.help_index import HelpIndex, HelpEntry
+from comlint.interface_helper import Commands, Options, Flags, InterfaceHelper
+from comlint.option_properties import OptionProperties
+from comlint.types import ANY, NONE
+
+
+def create_definition() -> (Commands, Options, Flags):
+    commands: Commands = {'install': CommandProperties(ANY, ['-r'], NONE, 'Install packages', 1, NONE),
+                          'uninstall': CommandProperties(ANY, NONE, NONE, 'Remove installed packages', 1, NONE),
+                          'list': CommandProperties(ANY, NONE, NONE, 'List installed packages', 0, NONE)}
+    options: Options = {'-r': OptionProperties('Install from requirements file', ANY, '')}
+    flags: Flags = {'--verbose': FlagProperties('Show verbose output')}
+
+    return commands, options, flags
+
+
+class TestHelpIndex(unittest.TestCase):
+    def test_search_ranks_name_matches_before_description_matches(self):
+        help_index: HelpIndex = HelpIndex(*create_definition())
+
+        results: List[HelpEntry] = help_index.search(['install'])
+
+        self.assertEqual(results[0], (CommandLineElementType.COMMAND, 'install'))
+        self.assertEqual(set(results), {(CommandLineElementType.COMMAND, 'install'),
+                                        (CommandLineElementType.COMMAND, 'uninstall'),
+                                        (CommandLineElementType.COMMAND, 'list'),
+                                        (CommandLineElementType.OPTION, '-r')})
+
+    def test_search_ranks_entries_matching_more_terms_first(self):
+        help_index: HelpIndex = HelpIndex(*create_definition())
+
+        results: List[HelpEntry] = help_index.search(['install', 'requirements'])
+
+        self.assertEqual(results[0], (CommandLineElementType.OPTION, '-r'))
+
+    def test_search_matches_prefixes_of_words(self):
+        help_index: HelpIndex = HelpIndex(*create_definition())
+
+        self.assertEqual(help_index.search(['verb']), [(CommandLineElementType.FLAG, '--verbose')])
+        self.assertEqual(help_index.search(['nothing']), [])
+
+    def test_index_is_stored_on_disk_and_reused(self):
+        with tempfile.TemporaryDirectory() as directory:
+            index_path: str = os.path.join(directory, 'help_index.json')
+            HelpIndex(*create_definition(), index_path=index_path).search(['list'])
+
+            with open(index_path, 'rb') as index_file:
+                header: dict = json.loads(index_file.readline())
+            shard: bytes = json.dumps({'stored': {f'{CommandLineElementType.COMMAND.value} list': 1}}).encode('utf-8')
+            with open(index_path, 'wb') as index_file:
+                index_file.write(json.dumps({'fingerprint': header['fingerprint'],
+                                             'shards': {'st': [0, len(shard)]}}).encode('utf-8') + b'\n' + shard)
+
+            results: List[HelpEntry] = HelpIndex(*create_definition(), index_path=index_path).search(['stored'])
+
+        self.assertEqual(results, [(CommandLineElementType.COMMAND, 'list')])
+
+    def test_stored_index_is_searched_like_built_index(self):
+        with tempfile.TemporaryDirectory() as directory:
+            index_path: str = os.path.join(directory, 'help_index.json')
+            HelpIndex(*create_definition(), index_path=index_path).search(['list'])
+
+            for terms in (['install'], ['i'], ['in', 'req'], ['verb', 'list'], ['nothing'], ['']):
+                self.assertEqual(HelpIndex(*create_definition(), index_path=index_path).search(terms),
+                                 HelpIndex(*create_definition()).search(terms), msg=f'terms: {terms}')
+
+    def test_stored_index_is_rebuilt_when_command_is_renamed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            index_path: str = os.path.join(directory, 'help_index.json')
+            cli: CommandLineInterface = CommandLineInterface(['program.exe'], help_index_path=index_path)
+            cli.add_command('add', 'Install package')
+            cli.get_help(['install'])
+            renamed_cli: CommandLineInterface = CommandLineInterface(['program.exe'], help_index_path=index_path)
+            renamed_cli.add_command('get', 'Install package')
+
+            help_text: str = renamed_cli.get_help(['install'])
+
+        self.assertIn('get', help_text)
+        self.assertNotIn('add', help_text)
+
+    def test_stored_index_is_rebuilt_when_definition_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            index_path: str = os.path.join(directory, 'help_index.json')
+            HelpIndex(*create_definition(), index_path=index_path).search(['list'])
+            commands, options, flags = create_definition()
+            flags['--quiet'] = FlagProperties('Suppress output')
+
+            results: List[HelpEntry] = HelpIndex(commands, options, flags, index_path=index_path).search(['quiet'])
+
+        self.assertEqual(results, [(CommandLineElementType.FLAG, '--quiet')])
+
+    def test_search_help_skips_entries_missing_from_definition(self):
+        commands, options, flags = create_definition()
+
+        help_text: str = InterfaceHelper.get_search_help('program', ['install'], commands, options, flags,
+                                                         [(CommandLineElementType.COMMAND, 'add'),
+                                                          (CommandLineElementType.COMMAND, 'install')])
+
+        self.assertIn('Install packages', help_text)
+        self.assertNotIn('add', help_text)
+
+    def test_help_search_prints_only_matching_entries(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'help', '--search', 'remove'])
+        cli.add_command('install', 'Install packages')
+        cli.add_command('uninstall', 'Remove installed packages')
+        output: io.StringIO = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            cli.parse()
+
+        self.assertIn('uninstall', output.getvalue())
+        self.assertNotIn('Install packages', output.getvalue())
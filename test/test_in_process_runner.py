@@ -0,0 +1,122 @@
+import os
+import sys
+import unittest
+from typing import List
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.error_code import ErrorCode
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.in_process_runner import InProcessRunner, USAGE_ERROR
+from comlint.parsed_command import ParsedCommand
+from comlint.run_result import RunResult
+from comlint.types import ExitStatus, SUCCESS, FAILURE
+
+VARIABLE_NAME: str = 'COMLINT_TEST_VARIABLE'
+
+
+class GreetCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        print(f'Hello {command.values[0]}{os.environ.get(VARIABLE_NAME, "")}!')
+        print('Greeting sent', file=sys.stderr)
+
+        return SUCCESS
+
+
+class ExitCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        if command.values[0] == 'crash':
+            raise RuntimeError('Handler crashed')
+        if command.values[0] == 'message':
+            sys.exit('Exit message')
+
+        sys.exit(int(command.values[0]))
+
+
+class SetVariableCommandHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> ExitStatus:
+        os.environ[VARIABLE_NAME] = command.values[0]
+        os.chdir(os.path.dirname(os.getcwd()))
+
+        return 3
+
+
+def create_cli() -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+    cli.add_command('greet', 'Greets user', 1)
+    cli.add_command('exit', 'Exits', 1)
+    cli.add_command('set', 'Sets variable', 1)
+    cli.add_command_handler('greet', GreetCommandHandler())
+    cli.add_command_handler('exit', ExitCommandHandler())
+    cli.add_command_handler('set', SetVariableCommandHandler())
+
+    return cli
+
+
+class TestInProcessRunner(unittest.TestCase):
+    def test_output_and_exit_status_are_captured(self):
+        result: RunResult = InProcessRunner(create_cli).run(['program.exe', 'greet', 'John'])
+
+        self.assertEqual(result.exit_status, SUCCESS)
+        self.assertEqual(result.stdout, 'Hello John!\n')
+        self.assertEqual(result.stderr, 'Greeting sent\n')
+        self.assertIsNone(result.exception)
+
+    def test_exceptions_are_mapped_to_exit_statuses(self):
+        runner: InProcessRunner = InProcessRunner(create_cli)
+        unsupported_command: RunResult = runner.run(['program.exe', 'gret', 'John'])
+        crash: RunResult = runner.run(['program.exe', 'exit', 'crash'])
+
+        self.assertEqual(unsupported_command.exit_status, USAGE_ERROR)
+        self.assertIsInstance(unsupported_command.exception, UnsupportedCommand)
+        self.assertEqual(unsupported_command.stderr, 'Command gret is not supported!\n')
+        self.assertEqual(crash.exit_status, FAILURE)
+        self.assertIn('RuntimeError: Handler crashed', crash.stderr)
+        self.assertEqual(runner.run(['program.exe', 'exit', '4']).exit_status, 4)
+        self.assertEqual(runner.run(['program.exe', 'exit', '0']).exit_status, SUCCESS)
+        self.assertEqual(runner.run(['program.exe', 'exit', 'message']).stderr, 'Exit message\n')
+
+        runner = InProcessRunner(create_cli, {ErrorCode.UNSUPPORTED_COMMAND: 64})
+
+        self.assertEqual(runner.run(['program.exe', 'gret', 'John']).exit_status, 64)
+
+    def test_environment_changes_are_reverted(self):
+        runner: InProcessRunner = InProcessRunner(create_cli)
+        working_directory: str = os.getcwd()
+
+        self.assertEqual(runner.run(['program.exe', 'set', 'value']).exit_status, 3)
+        self.assertNotIn(VARIABLE_NAME, os.environ)
+        self.assertEqual(os.getcwd(), working_directory)
+        self.assertEqual(runner.run(['program.exe', 'greet', 'John'], {VARIABLE_NAME: ' Smith'}).stdout,
+                         'Hello John Smith!\n')
+        self.assertNotIn(VARIABLE_NAME, os.environ)
+
+    def test_interface_is_reused_unless_disabled(self):
+        created: List[CommandLineInterface] = []
+
+        def create_counted_cli() -> CommandLineInterface:
+            created.append(create_cli())
+            return created[-1]
+
+        InProcessRunner(create_counted_cli, max_workers=1).run_all([['program.exe', 'greet', 'John']] * 3)
+
+        self.assertEqual(len(created), 1)
+
+        InProcessRunner(create_counted_cli, max_workers=1, reuse_interface=False).run_all(
+            [['program.exe', 'greet', 'John']] * 3)
+
+        self.assertEqual(len(created), 4)
+
+    def test_cases_are_run_in_pool_of_workers(self):
+        cases: List[List[str]] = [['program.exe', 'greet', str(i)] for i in range(20)] + \
+                                 [['program.exe', 'exit', 'crash'], ['program.exe', 'gret', 'John']]
+        results: List[RunResult] = InProcessRunner(create_cli, max_workers=2).run_all(cases, {VARIABLE_NAME: '?'})
+
+        self.assertEqual([result.argv for result in results], cases)
+        self.assertEqual([result.stdout for result in results[:20]], [f'Hello {i}?!\n' for i in range(20)])
+        self.assertEqual([result.exit_status for result in results[20:]], [FAILURE, USAGE_ERROR])
+        self.assertIsInstance(results[21].exception, UnsupportedCommand)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+import itertools
+import os
+import tempfile
+import unittest
+from typing import List, Optional
+
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.command_line_interface import CommandLineInterface
+from comlint.constraint_type import ConstraintType
+from comlint.exceptions.ambiguous_abbreviation import AmbiguousAbbreviation
+from comlint.exceptions.comlint_error import ComlintError
+from comlint.exceptions.forbidden_option_value import ForbiddenOptionValue
+from comlint.exceptions.missing_command_value import MissingCommandValue
+from comlint.exceptions.missing_file import MissingFile
+from comlint.exceptions.missing_option_value import MissingOptionValue
+from comlint.exceptions.missing_required_option import MissingRequiredOption
+from comlint.exceptions.mutually_exclusive_elements import MutuallyExclusiveElements
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.exceptions.unsupported_command_value import UnsupportedCommandValue
+from comlint.exceptions.unsupported_flag import UnsupportedFlag
+from comlint.incremental_parser import IncrementalParser
+from comlint.value_type import ValueType
+
+
+def create_cli(abbreviations_enabled: bool = False) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], abbreviations_enabled=abbreviations_enabled)
+    cli.add_command('install', 'Installs package', 1, allowed_options=['-d', '-m'], allowed_flags=['--verbose'],
+                    required_options=['-d'])
+    cli.add_command('mode', 'Switches mode', 1, allowed_values=['fast', 'slow'], allowed_flags=['--quiet',
+                                                                                                 '--verbose'])
+    cli.add_option('-d', 'Installation directory')
+    cli.add_option('-m', 'Installation mode', allowed_values=['user', 'system'])
+    cli.add_flag('--verbose', 'Verbose output')
+    cli.add_flag('--quiet', 'Quiet output')
+
+    return cli
+
+# aliases (added by create_cli_with_aliases) and abbreviations of names of the interface created by create_cli
+RESOLVED_TOKENS: List[str] = ['ins', 'inst', 'mo', 'i', 'install', 'numpy', 'fast', '-dir', '-d', '-m', 'user',
+                              '--verb', '--v', '--q', '--x']
+
+
+def create_cli_with_aliases() -> CommandLineInterface:
+    cli: CommandLineInterface = create_cli()
+    cli.add_alias('ins', 'install')
+    cli.add_alias('-dir', '-d')
+    cli.add_alias('--v', '--verbose')
+
+    return cli
+
+
+class TestIncrementalParser(unittest.TestCase):
+    def test_valid_command_line_has_no_diagnostics(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+
+        self.assertEqual(parser.update(['program.exe', 'install', 'numpy', '-d', '/opt', '--verbose']), [])
+
+    def test_diagnostics_of_unfinished_command_line(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+
+        diagnostics: List[ComlintError] = parser.update(['program.exe', 'install'])
+        self.assertEqual([type(diagnostic) for diagnostic in diagnostics],
+                         [MissingCommandValue, MissingRequiredOption])
+
+        diagnostics = parser.append('numpy')
+        self.assertEqual([type(diagnostic) for diagnostic in diagnostics], [MissingRequiredOption])
+
+        diagnostics = parser.append('-d')
+        self.assertEqual([type(diagnostic) for diagnostic in diagnostics], [MissingOptionValue])
+
+        self.assertEqual(parser.append('/opt'), [])
+
+    def test_all_invalid_tokens_are_reported(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+
+        diagnostics: List[ComlintError] = parser.update(['program.exe', 'install', 'numpy', '-d', '/opt', '-m',
+                                                         'global', '--unknown'])
+
+        self.assertEqual([type(diagnostic) for diagnostic in diagnostics], [ForbiddenOptionValue, UnsupportedFlag])
+        self.assertEqual([diagnostic.position for diagnostic in diagnostics], [6, 7])
+
+    def test_diagnostics_match_exceptions_raised_by_parse(self):
+        cli: CommandLineInterface = create_cli()
+        argv: List[str] = ['program.exe', 'mode', 'medium']
+
+        with self.assertRaises(UnsupportedCommandValue) as context:
+            cli.parse(argv)
+
+        diagnostic: ComlintError = IncrementalParser(cli).update(argv)[0]
+        self.assertIsInstance(diagnostic, UnsupportedCommandValue)
+        self.assertEqual((diagnostic.token, diagnostic.position, str(diagnostic)),
+                         (context.exception.token, context.exception.position, str(context.exception)))
+
+    def test_aliases_and_abbreviations_are_resolved_like_by_parse(self):
+        for cli in (create_cli_with_aliases(), create_cli(abbreviations_enabled=True)):
+            for length in range(1, 4):
+                for tokens in itertools.product(RESOLVED_TOKENS, repeat=length):
+                    argv: List[str] = ['program.exe', *tokens]
+                    expected_error: Optional[type] = None
+
+                    try:
+                        cli.parse(argv)
+                    except ComlintError as e:
+                        expected_error = type(e)
+
+                    diagnostics: List[ComlintError] = IncrementalParser(cli).update(argv)
+                    diagnostic_types: List[type] = [type(diagnostic) for diagnostic in diagnostics]
+
+                    if expected_error is None:
+                        self.assertEqual(diagnostic_types, [], argv)
+                    else:
+                        self.assertIn(expected_error, diagnostic_types, argv)
+
+    def test_ambiguous_abbreviation_is_reported(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'], abbreviations_enabled=True)
+        cli.add_command('install', 'Installs package')
+        cli.add_command('instance', 'Creates instance')
+
+        self.assertEqual([type(diagnostic) for diagnostic in IncrementalParser(cli).update(['program.exe', 'inst'])],
+                         [AmbiguousAbbreviation])
+
+    def test_only_tokens_after_first_change_are_parsed_again(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+        parser.update(['program.exe', 'install', 'numpy', '-d', '/opt', '--verbose'])
+        self.assertEqual(parser.num_of_parsed_tokens, 5)
+
+        self.assertEqual(parser.update(['program.exe', 'install', 'numpy', '-d', '/usr', '--verbose']), [])
+        self.assertEqual(parser.num_of_parsed_tokens, 7)
+
+        diagnostics: List[ComlintError] = parser.update(['program.exe', 'install', 'numpy', '-d'])
+        self.assertEqual(parser.num_of_parsed_tokens, 7)
+        self.assertEqual([type(diagnostic) for diagnostic in diagnostics], [MissingOptionValue])
+
+    def test_reset_discards_state_and_number_of_parsed_tokens(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+        parser.update(['program.exe', 'install', 'numpy', '-d', '/opt'])
+        parser.reset()
+
+        self.assertEqual(parser.num_of_parsed_tokens, 0)
+        self.assertEqual(parser.get_expected_element_types(),
+                         {CommandLineElementType.COMMAND, CommandLineElementType.OPTION, CommandLineElementType.FLAG})
+
+    def test_missing_files_are_reported(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_command('read', 'Reads file', 1, allowed_options=['-o'], value_type=ValueType.FILE)
+        cli.add_option('-o', 'Output file', value_type=ValueType.FILE)
+        parser: IncrementalParser = IncrementalParser(cli)
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path: str = os.path.join(directory, 'input.txt')
+            output_path: str = os.path.join(directory, 'output.txt')
+            argv: List[str] = ['program.exe', 'read', input_path, '-o', output_path]
+
+            with self.assertRaises(MissingFile) as context:
+                cli.parse(argv)
+
+            diagnostics: List[ComlintError] = parser.update(argv)
+            self.assertEqual([type(diagnostic) for diagnostic in diagnostics], [MissingFile])
+            self.assertEqual(str(diagnostics[0]), str(context.exception))
+            self.assertEqual(diagnostics[0].details['num_of_missing_files'], 2)
+
+            for path in (input_path, output_path):
+                with open(path, 'w'):
+                    pass
+
+            self.assertEqual(parser.get_diagnostics(), [])
+
+    def test_changed_command_discards_whole_state(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+        parser.update(['program.exe', 'instal', 'numpy'])
+        self.assertEqual([type(diagnostic) for diagnostic in parser.get_diagnostics()], [UnsupportedCommand])
+
+        self.assertEqual(parser.update(['program.exe', 'mode', 'fast']), [])
+
+    def test_constraints_are_reported(self):
+        cli: CommandLineInterface = create_cli()
+        cli.add_constraint('mode', ConstraintType.MUTUALLY_EXCLUSIVE, ['--quiet', '--verbose'])
+        parser: IncrementalParser = IncrementalParser(cli)
+
+        diagnostics: List[ComlintError] = parser.update(['program.exe', 'mode', 'fast', '--quiet', '--verbose'])
+
+        self.assertEqual([type(diagnostic) for diagnostic in diagnostics], [MutuallyExclusiveElements])
+
+    def test_help_has_no_diagnostics(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+
+        self.assertEqual(parser.update(['program.exe', 'help', 'unknown', '--unknown']), [])
+        self.assertEqual(parser.get_expected_element_types(), set())
+
+    def test_expected_element_types(self):
+        parser: IncrementalParser = IncrementalParser(create_cli())
+        self.assertEqual(parser.get_expected_element_types(),
+                         {CommandLineElementType.COMMAND, CommandLineElementType.OPTION, CommandLineElementType.FLAG})
+
+        parser.append('install')
+        self.assertEqual(parser.get_expected_element_types(), {CommandLineElementType.CUSTOM_VALUE})
+
+        parser.append('numpy')
+        self.assertEqual(parser.get_expected_element_types(), {CommandLineElementType.OPTION,
+                                                               CommandLineElementType.FLAG})
+
+        parser.append('-m')
+        self.assertEqual(parser.get_expected_element_types(), {CommandLineElementType.CUSTOM_VALUE})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from typing import List
 
+from comlint.command_line_element_type import CommandLineElementType
 from comlint.command_properties import CommandProperties
 from comlint.flag_properties import FlagProperties
 from comlint.interface_helper import InterfaceHelper, Commands, Options, Flags
@@ -89,3 +90,34 @@ class TestInterfaceHelper(unittest.TestCase):
         help_text: str = InterfaceHelper.get_help(program_name, program_description, commands, options, flags)
 
         self.assertEqual(help_text, expected_help)
+
+    def test_get_search_terms_returns_terms_after_search_flag(self):
+        self.assertEqual(InterfaceHelper.get_search_terms(['program.exe', 'help', '--search', 'a', 'b']), ['a', 'b'])
+        self.assertEqual(InterfaceHelper.get_search_terms(['program.exe', 'help']), [])
+        self.assertEqual(InterfaceHelper.get_search_terms(['program.exe', 'help', 'a']), [])
+
+    def test_get_search_help_renders_only_matching_entries(self):
+        commands: Commands = {'add': CommandProperties(ANY, NONE, NONE, 'Add files', 1, NONE),
+                              'commit': CommandProperties(ANY, ['-m'], NONE, 'Commit changes', 0, NONE)}
+        options: Options = {'-m': OptionProperties('Commit message', ANY, '')}
+        flags: Flags = {'--verbose': FlagProperties('Show verbose output')}
+        results: List = [(CommandLineElementType.COMMAND, 'commit'), (CommandLineElementType.OPTION, '-m')]
+
+        help_text: str = InterfaceHelper.get_search_help('SomeProgram', ['commit'], commands, options, flags, results)
+
+        expected_help_text: str = 'Usage of SomeProgram matching "commit"\n' \
+                                  '\n' \
+                                  'COMMANDS:\n' \
+                                  'commit                   Commit changes\n' \
+                                  "  allowed options        ['-m']\n" \
+                                  '\n' \
+                                  'OPTIONS:\n' \
+                                  '-m                       Commit message\n' \
+                                  '\n'
+        self.assertEqual(help_text, expected_help_text)
+
+    def test_get_search_help_reports_no_matches(self):
+        help_text: str = InterfaceHelper.get_search_help('SomeProgram', ['xyz'], {}, {}, {}, [])
+
+        self.assertEqual(help_text, 'Usage of SomeProgram matching "xyz"\n\nNo matching commands, options or flags '
+                                    'found.\n')
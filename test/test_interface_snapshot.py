@@ -0,0 +1,86 @@
+import threading
+import unittest
+from typing import List, Tuple
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.comlint_error import ComlintError
+from comlint.exceptions.forbidden_option_value import ForbiddenOptionValue
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.exceptions.unsupported_command_value import UnsupportedCommandValue
+from comlint.interface_snapshot import InterfaceSnapshot
+from comlint.parsed_command import ParsedCommand
+
+NUM_OF_THREADS: int = 8
+NUM_OF_PARSES_PER_THREAD: int = 2000
+
+
+def create_cli(parse_cache_size: int = 0) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], parse_cache_size=parse_cache_size)
+    cli.add_command('merge', 'Merge branches', num_of_required_values=2, allowed_options=['-s'],
+                    allowed_flags=['--verbose'], required_options=['-s'])
+    cli.add_command('checkout', 'Checkout branch', num_of_required_values=1, allowed_values=['main', 'develop'])
+    cli.add_option('-s', 'Merging strategy', allowed_values=['recursive', 'resolve'])
+    cli.add_flag('--verbose', 'Be verbose')
+
+    return cli
+
+
+class TestInterfaceSnapshot(unittest.TestCase):
+    def test_snapshot_parses_like_original_interface(self):
+        cli: CommandLineInterface = create_cli()
+        argv: List[str] = ['program.exe', 'merge', 'a', 'b', '-s', 'resolve', '--verbose']
+
+        self.assertEqual(cli.snapshot().parse(argv), cli.parse(argv))
+
+    def test_snapshot_is_not_affected_by_later_changes(self):
+        allowed_values: List[str] = ['main']
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        cli.add_command('checkout', 'Checkout branch', num_of_required_values=1, allowed_values=allowed_values)
+        snapshot: InterfaceSnapshot = cli.snapshot()
+
+        allowed_values.append('develop')
+        cli.add_command('pull', 'Pull changes')
+
+        self.assertEqual(cli.parse(['program.exe', 'pull']).name, 'pull')
+        with self.assertRaises(UnsupportedCommandValue):
+            cli.parse(['program.exe', 'checkout', 'develop'])
+        with self.assertRaises(UnsupportedCommandValue):
+            snapshot.parse(['program.exe', 'checkout', 'develop'])
+        with self.assertRaises(UnsupportedCommand):
+            snapshot.parse(['program.exe', 'pull'])
+
+    def test_snapshot_may_be_used_by_many_threads_at_once(self):
+        snapshot: InterfaceSnapshot = create_cli(parse_cache_size=4).snapshot()
+        cases: List[Tuple[List[str], object]] = [
+            (['program.exe', 'merge', 'a', 'b', '-s', 'resolve'],
+             ParsedCommand('merge', ['a', 'b'], {'-s': 'resolve'}, {'--verbose': False})),
+            (['program.exe', 'merge', 'c', 'd', '-s', 'recursive', '--verbose'],
+             ParsedCommand('merge', ['c', 'd'], {'-s': 'recursive'}, {'--verbose': True})),
+            (['program.exe', 'checkout', 'main'], ParsedCommand('checkout', ['main'], {}, {'--verbose': False})),
+            (['program.exe', 'checkout', 'feature'], UnsupportedCommandValue),
+            (['program.exe', 'merge', 'a', 'b', '-s', 'octopus'], ForbiddenOptionValue),
+            (['program.exe', 'push'], UnsupportedCommand),
+        ]
+        mismatches: List[str] = []
+
+        def parse_many(thread_index: int) -> None:
+            for i in range(NUM_OF_PARSES_PER_THREAD):
+                argv, expected_outcome = cases[(thread_index + i) % len(cases)]
+
+                try:
+                    outcome: object = snapshot.parse(argv)
+                except ComlintError as e:
+                    outcome = type(e)
+
+                if outcome != expected_outcome:
+                    mismatches.append(f'{argv}: {outcome}')
+
+        threads: List[threading.Thread] = [threading.Thread(target=parse_many, args=(i,))
+                                           for i in range(NUM_OF_THREADS)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mismatches, [])
@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+from typing import List
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.invocation_journal import InvocationJournal
+from comlint.journal_record import JournalRecord
+from comlint.journal_replay import JournalReplay
+from comlint.parsed_command import ParsedCommand
+from comlint.replay_report import ReplayReport
+
+
+class StatusHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> int:
+        return int(command.values[0])
+
+
+class ListHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> List[str]:
+        return command.values
+
+
+def create_cli(journal: InvocationJournal = None) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], journal=journal)
+    cli.add_command('exit', 'Exit with status', num_of_required_values=1)
+    cli.add_command_handler('exit', StatusHandler())
+
+    return cli
+
+
+class TestInvocationJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, 'journal.log')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_records_are_read_back(self):
+        journal: InvocationJournal = InvocationJournal(self.path)
+        records: List[JournalRecord] = [JournalRecord(['program.exe', 'add', 'zażółć'], 1.5, 0.25, 0.5, 0, ''),
+                                        JournalRecord(['program.exe', ''], 2.5, 0.125, 0.0, 1, 'UnsupportedCommand')]
+
+        for record in records:
+            journal.record(record)
+
+        self.assertEqual(list(journal.read()), records)
+
+    def test_truncated_record_is_ignored(self):
+        journal: InvocationJournal = InvocationJournal(self.path)
+        journal.record(JournalRecord(['program.exe', 'a'], 1.0, 0.0, 0.0, 0, ''))
+        journal.record(JournalRecord(['program.exe', 'b'], 2.0, 0.0, 0.0, 0, ''))
+
+        with open(self.path, 'r+b') as journal_file:
+            journal_file.truncate(os.path.getsize(self.path) - 1)
+
+        self.assertEqual([record.argv for record in journal.read()], [['program.exe', 'a']])
+
+    def test_journal_is_rotated_by_size(self):
+        journal: InvocationJournal = InvocationJournal(self.path, max_file_size=100, max_num_of_files=3)
+
+        for i in range(20):
+            journal.record(JournalRecord(['program.exe', f'command_{i}'], float(i), 0.0, 0.0, 0, ''))
+
+        argvs: List[List[str]] = [record.argv for record in journal.read()]
+
+        self.assertEqual(len(journal.get_files()), 3)
+        self.assertTrue(all(os.path.getsize(path) <= 100 for path in journal.get_files()))
+        self.assertEqual(argvs[-1], ['program.exe', 'command_19'])
+        self.assertEqual(argvs, sorted(argvs, key=lambda argv: int(argv[1].split('_')[1])))
+        self.assertLess(len(argvs), 20)
+
+    def test_run_and_parse_are_recorded(self):
+        journal: InvocationJournal = InvocationJournal(self.path)
+        cli: CommandLineInterface = create_cli(journal)
+
+        self.assertEqual(cli.run(['program.exe', 'exit', '3']), 3)
+        cli.parse(['program.exe', 'exit', '0'])
+        with self.assertRaises(UnsupportedCommand):
+            cli.run(['program.exe', 'quit'])
+
+        records: List[JournalRecord] = list(journal.read())
+
+        self.assertEqual([record.argv for record in records], [['program.exe', 'exit', '3'],
+                                                               ['program.exe', 'exit', '0'],
+                                                               ['program.exe', 'quit']])
+        self.assertEqual([record.exit_status for record in records], [3, 0, 1])
+        self.assertEqual([record.outcome for record in records], ['', '', 'UnsupportedCommand'])
+        self.assertTrue(all(record.parse_duration >= 0.0 and record.handler_duration >= 0.0 for record in records))
+        self.assertEqual(records[1].handler_duration, 0.0)
+
+    def test_non_integer_results_are_recorded_as_exit_statuses(self):
+        journal: InvocationJournal = InvocationJournal(self.path)
+        cli: CommandLineInterface = create_cli(journal)
+        cli.add_command('list', 'List values', num_of_required_values=2)
+        cli.add_command_handler('list', ListHandler())
+
+        self.assertEqual(cli.run(['program.exe', 'list', 'a', 'b']), ['a', 'b'])
+
+        self.assertEqual([record.exit_status for record in journal.read()], [1])
+
+    def test_replay_reports_latencies_and_failures(self):
+        journal: InvocationJournal = InvocationJournal(self.path)
+        recording_cli: CommandLineInterface = create_cli(journal)
+        recording_cli.run(['program.exe', 'exit', '0'])
+        with self.assertRaises(UnsupportedCommand):
+            recording_cli.run(['program.exe', 'quit'])
+
+        report: ReplayReport = JournalReplay.replay(create_cli(), journal.read(), full_run=True,
+                                                    num_of_repetitions=3)
+
+        self.assertEqual(len(report.latencies), 6)
+        self.assertEqual(report.num_of_failures, 3)
+        self.assertIn('p99', report.get_summary())
+
+
+class TestReplayReport(unittest.TestCase):
+    def test_get_percentile_returns_nearest_rank(self):
+        report: ReplayReport = ReplayReport(latencies=[float(i) for i in range(100, 0, -1)])
+
+        self.assertEqual(report.get_percentile(50), 50.0)
+        self.assertEqual(report.get_percentile(99), 99.0)
+        self.assertEqual(report.get_percentile(100), 100.0)
+        self.assertEqual(report.get_percentile(0), 1.0)
+        self.assertEqual(ReplayReport().get_percentile(50), 0.0)
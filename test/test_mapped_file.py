@@ -0,0 +1,110 @@
+import io
+import os
+import tempfile
+import unittest
+from typing import List
+from unittest.mock import MagicMock
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.error_code import ErrorCode
+from comlint.exceptions.missing_file import MissingFile
+from comlint.mapped_file import MappedFile
+from comlint.parsed_command import ParsedCommand
+from comlint.record_writer import RecordWriter
+from comlint.value_type import ValueType
+
+
+class TestMappedFile(unittest.TestCase):
+    def setUp(self):
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, 'input.txt')
+        self.empty_path: str = os.path.join(self.directory.name, 'empty.txt')
+
+        with open(self.path, 'wb') as input_file:
+            input_file.write(b'first\nsecond\nthird')
+        with open(self.empty_path, 'wb'):
+            pass
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_file_is_opened_on_first_access_only(self):
+        mapped_file: MappedFile = MappedFile(self.path)
+
+        self.assertFalse(mapped_file.is_open())
+        self.assertEqual(len(mapped_file), 18)
+        self.assertTrue(mapped_file.is_open())
+
+        mapped_file.close()
+        self.assertFalse(mapped_file.is_open())
+
+    def test_view_and_lines_are_slices_of_the_file(self):
+        with MappedFile(self.path) as mapped_file:
+            view: memoryview = mapped_file.view(6, 12)
+            lines: List[bytes] = [bytes(line) for line in mapped_file.lines()]
+
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(bytes(view), b'second')
+            self.assertEqual(lines, [b'first\n', b'second\n', b'third'])
+
+            view.release()
+
+    def test_empty_file(self):
+        with MappedFile(self.empty_path) as mapped_file:
+            self.assertEqual(len(mapped_file), 0)
+            self.assertEqual(list(mapped_file.lines()), [])
+
+    def test_closing_with_views_still_referenced_does_not_fail(self):
+        mapped_file: MappedFile = MappedFile(self.path)
+        view: memoryview = mapped_file.view(0, 5)
+
+        mapped_file.close()
+
+        self.assertEqual(bytes(view), b'first')
+
+
+class TestCommandLineInterfaceFileValues(unittest.TestCase):
+    def setUp(self):
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, 'input.txt')
+
+        with open(self.path, 'wb') as input_file:
+            input_file.write(b'a\nb\n')
+
+        self.cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        self.cli.add_command('count', 'Count lines', num_of_required_values=2, allowed_options=['-i', '-o'],
+                             value_type=ValueType.FILE)
+        self.cli.add_option('-i', 'Input file', value_type=ValueType.FILE)
+        self.cli.add_option('-o', 'Output name')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_all_missing_files_are_reported_at_once(self):
+        with self.assertRaises(MissingFile) as context:
+            self.cli.parse(['program.exe', 'count', self.path, 'missing_1', '-i', 'missing_2', '-o', 'missing_3'])
+
+        self.assertEqual(context.exception.error_code, ErrorCode.MISSING_FILE)
+        self.assertEqual((context.exception.token, context.exception.position), ('missing_1', 3))
+        self.assertEqual(context.exception.details['missing_files'],
+                         [('missing_1', 'count', 3), ('missing_2', '-i', 5)])
+        self.assertIn('2 missing file(s)', str(context.exception))
+
+    def test_handler_receives_lazy_handles_which_are_closed_afterwards(self):
+        handles: List[MappedFile] = []
+
+        def count_lines(command: ParsedCommand):
+            handles.extend(command.files.values())
+            return [sum(1 for _ in command.files[command.options['-i']].lines())]
+
+        handler: CommandHandlerInterface = CommandHandlerInterface()
+        handler.run = MagicMock(side_effect=count_lines)
+        stream: io.StringIO = io.StringIO()
+        self.cli.add_command_handler('count', handler, RecordWriter(stream))
+
+        self.cli.run(['program.exe', 'count', self.path, self.path, '-i', self.path, '-o', 'name'])
+
+        self.assertEqual(stream.getvalue(), '2\n')
+        self.assertEqual(len(handles), 1)
+        self.assertFalse(handles[0].is_open())
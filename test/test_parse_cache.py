@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+from typing import List
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.exceptions.missing_file import MissingFile
+from comlint.exceptions.unsupported_command import UnsupportedCommand
+from comlint.parse_cache import ParseCache
+from comlint.parsed_command import ParsedCommand
+from comlint.value_type import ValueType
+
+
+class TestParseCache(unittest.TestCase):
+    def test_get_returns_none_and_counts_miss_for_unknown_key(self):
+        cache: ParseCache = ParseCache(max_size=2)
+
+        self.assertIsNone(cache.get(('program.exe', 'command')))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+
+    def test_get_returns_equal_copy_of_stored_parsed_command(self):
+        cache: ParseCache = ParseCache(max_size=2)
+        parsed_command: ParsedCommand = ParsedCommand('command', ['value'], {'-option': 'x'}, {'--flag': True})
+
+        cache.put(('program.exe', 'command'), parsed_command)
+        cached_command: ParsedCommand = cache.get(('program.exe', 'command'))
+
+        self.assertEqual(cached_command, parsed_command)
+        self.assertIsNot(cached_command, parsed_command)
+        self.assertEqual(cache.hits, 1)
+
+    def test_modifying_returned_parsed_command_does_not_affect_cache(self):
+        cache: ParseCache = ParseCache(max_size=2)
+        cache.put(('program.exe', 'command'), ParsedCommand('command', ['value'], {'-option': 'x'}, {'--flag': True}))
+
+        cached_command: ParsedCommand = cache.get(('program.exe', 'command'))
+        cached_command.values.append('other')
+        cached_command.options['-option'] = 'y'
+        cached_command.flags['--flag'] = False
+
+        self.assertEqual(cache.get(('program.exe', 'command')),
+                         ParsedCommand('command', ['value'], {'-option': 'x'}, {'--flag': True}))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache: ParseCache = ParseCache(max_size=2)
+
+        cache.put(('a',), ParsedCommand('a', [], {}, {}))
+        cache.put(('b',), ParsedCommand('b', [], {}, {}))
+        cache.get(('a',))
+        cache.put(('c',), ParsedCommand('c', [], {}, {}))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(('a',)))
+        self.assertIsNone(cache.get(('b',)))
+        self.assertIsNotNone(cache.get(('c',)))
+
+
+class TestCommandLineInterfaceParseCache(unittest.TestCase):
+    def create_cli(self) -> CommandLineInterface:
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'], parse_cache_size=8)
+
+        cli.add_command('command', 'Some command', num_of_required_values=1, allowed_options=['-option'],
+                        allowed_flags=['--flag'])
+        cli.add_option('-option', 'Some option')
+        cli.add_flag('--flag', 'Some flag')
+
+        return cli
+
+    def test_repeated_command_line_is_served_from_cache(self):
+        cli: CommandLineInterface = self.create_cli()
+        argv: List[str] = ['program.exe', 'command', 'value', '-option', 'x', '--flag']
+
+        first: ParsedCommand = cli.parse(argv)
+        second: ParsedCommand = cli.parse(argv)
+
+        self.assertEqual(first, second)
+        self.assertEqual(cli.parse_cache.hits, 1)
+        self.assertEqual(cli.parse_cache.misses, 1)
+
+    def test_cache_is_invalidated_when_definition_changes(self):
+        cli: CommandLineInterface = self.create_cli()
+        argv: List[str] = ['program.exe', 'command', 'value']
+
+        cli.parse(argv)
+        cli.add_flag('--other_flag', 'Other flag')
+        parsed_command: ParsedCommand = cli.parse(argv)
+
+        self.assertEqual(cli.parse_cache.hits, 0)
+        self.assertEqual(parsed_command.flags, {'--flag': False, '--other_flag': False})
+
+    def test_errors_are_not_cached(self):
+        cli: CommandLineInterface = self.create_cli()
+
+        for _ in range(2):
+            with self.assertRaises(UnsupportedCommand):
+                cli.parse(['program.exe', 'unsupported'])
+
+        self.assertEqual(len(cli.parse_cache), 0)
+
+    def test_command_lines_with_files_are_not_cached(self):
+        cli: CommandLineInterface = self.create_cli()
+        cli.add_command('show', 'Show file', num_of_required_values=1, allowed_options=['-file'],
+                        value_type=ValueType.FILE)
+        cli.add_option('-file', 'Some file', value_type=ValueType.FILE)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'file.txt')
+
+            with open(path, 'w', encoding='utf-8'):
+                pass
+
+            for argv in (['program.exe', 'show', path], ['program.exe', 'command', 'value', '-option', 'x'],
+                         ['program.exe', 'show', __file__, '-file', path]):
+                cli.parse(argv)
+
+            os.remove(path)
+
+            with self.assertRaises(MissingFile):
+                cli.parse(['program.exe', 'show', path])
+            with self.assertRaises(MissingFile):
+                cli.parse(['program.exe', 'show', __file__, '-file', path])
+
+        self.assertEqual(len(cli.parse_cache), 1)
+
+    def test_cache_is_disabled_by_default(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'command'])
+        cli.add_command('command', 'Some command')
+
+        cli.parse()
+        cli.parse()
+
+        self.assertEqual(cli.parse_cache.hits, 0)
+        self.assertEqual(len(cli.parse_cache), 0)
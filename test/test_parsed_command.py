@@ -1,6 +1,8 @@
+import pickle
 import unittest
 
 from comlint.parsed_command import ParsedCommand
+from comlint.resource_context import ResourceContext
 from comlint.types import CommandName, CommandValues, OptionsMap, FlagsMap
 
 
@@ -22,3 +24,12 @@ class TestParsedCommand(unittest.TestCase):
         parsed_command: ParsedCommand = ParsedCommand(command_name, values, options, flags)
 
         self.assertFalse(parsed_command.is_option_used(option_name='-some_option_name'))
+
+    def test_pickled_parsed_command_does_not_contain_resources(self):
+        parsed_command: ParsedCommand = ParsedCommand('command', ['value'], {'-option_name': 'option_value'}, {})
+        parsed_command.resources = ResourceContext()
+        unpickled_command: ParsedCommand = pickle.loads(pickle.dumps(parsed_command))
+
+        self.assertEqual(unpickled_command, parsed_command)
+        self.assertIsNone(unpickled_command.resources)
+        self.assertIsNotNone(parsed_command.resources)
@@ -0,0 +1,158 @@
+import contextlib
+import io
+import random
+import types
+import unittest
+from typing import Any, List, Tuple
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.constraint_type import ConstraintType
+from comlint.exceptions.comlint_error import ComlintError
+from comlint.parser_generator import ParserGenerator
+from comlint.value_type import ValueType
+
+TOKENS: List[str] = ['add', 'commit', 'merge', 'submodule', 'push', 'update', 'recursive', 'resolve', 'file.txt',
+                     __file__, '-m', '-c', '-F', '-s', '-b', '-x', '--verbose', '--amend', '--interactive', '--unknown',
+                     '-', '--', '']
+HELP_TOKENS: List[str] = ['help', '-h', '--help', '--search', 'commit', 'merge', 'message', 'file', 'br', 'verbose',
+                          'zzz', '-m', '--amend', '']
+ABBREVIATED_TOKENS: List[str] = ['a', 'ad', 'co', 'ci', 'm', 'su', 's', 'u', 'rec', '-M', '--verb', '--a', '--int',
+                                 '--i', '--', '-m', '--amend', 'merge', 'sy', '--ad', __file__]
+
+
+def create_cli(allow_no_arguments: bool = True, abbreviations_enabled: bool = False) -> CommandLineInterface:
+    cli: CommandLineInterface = CommandLineInterface(['program.exe'], program_name='program',
+                                                     description='Some program', allow_no_arguments=allow_no_arguments,
+                                                     abbreviations_enabled=abbreviations_enabled)
+
+    cli.add_command('add', 'Add files to commit', num_of_required_values=1, allowed_flags=['--verbose',
+                                                                                           '--interactive'],
+                    value_type=ValueType.FILE)
+    cli.add_command('commit', 'Commit changes', allowed_options=['-m', '-c', '-F'],
+                    allowed_flags=['--verbose', '--amend'])
+    cli.add_command('merge', 'Merge two branches', num_of_required_values=2, allowed_options=['-s', '-m'],
+                    required_options=['-s'])
+    cli.add_command('submodule', 'Perform operation on submodule', num_of_required_values=1,
+                    allowed_values=['add', 'update'], allowed_flags=['--verbose'])
+    cli.add_option('-b', 'Specify branch name')
+    cli.add_option('-m', 'Provide message')
+    cli.add_option('-c', 'Provide commit hash')
+    cli.add_option('-F', 'Take commit message from file', value_type=ValueType.FILE)
+    cli.add_option('-s', 'Specify merging strategy', allowed_values=['recursive', 'resolve', 'subtree'])
+    cli.add_flag('--verbose', 'Show verbose output')
+    cli.add_flag('--interactive', 'Add files to commit interactively')
+    cli.add_flag('--amend', 'Join to previous commit')
+    cli.add_constraint('commit', ConstraintType.MUTUALLY_EXCLUSIVE, ['-m', '-c'])
+    cli.add_constraint('commit', ConstraintType.REQUIRES, ['--amend', '-c'])
+    cli.add_constraint('commit', ConstraintType.AT_LEAST_ONE, ['-m', '-c', '--amend'])
+    cli.add_constraint('add', ConstraintType.CONFLICTS_WITH, ['--interactive', '--verbose'])
+
+    return cli
+
+
+def load_generated_module(cli: CommandLineInterface) -> types.ModuleType:
+    module: types.ModuleType = types.ModuleType('generated_parser')
+    exec(compile(ParserGenerator.generate(cli), 'generated_parser.py', 'exec'), module.__dict__)
+
+    return module
+
+
+def get_outcome(parse: Any, argv: List[str]) -> Tuple[Any, str]:
+    output: io.StringIO = io.StringIO()
+
+    try:
+        with contextlib.redirect_stdout(output):
+            return parse(argv), output.getvalue()
+    except ComlintError as e:
+        return (type(e), str(e), e.error_code, e.token, e.position, e.command), output.getvalue()
+
+
+class TestParserGenerator(unittest.TestCase):
+    def assert_same_outcome(self, cli: CommandLineInterface, module: types.ModuleType, argv: List[str]) -> None:
+        self.assertEqual(get_outcome(module.parse, argv), get_outcome(cli.parse, argv), msg=f'argv: {argv}')
+
+    def test_generated_parser_matches_generic_parser_for_known_command_lines(self):
+        cli: CommandLineInterface = create_cli()
+        module: types.ModuleType = load_generated_module(cli)
+        command_lines: List[List[str]] = [
+            ['program.exe'],
+            ['program.exe', 'help'],
+            ['program.exe', '--help'],
+            ['program.exe', 'add', 'file.txt', '--verbose'],
+            ['program.exe', 'add', __file__, '--verbose'],
+            ['program.exe', 'commit', '-F', __file__, '--amend', '-c', 'hash'],
+            ['program.exe', 'commit', '-F', 'file.txt', '-m', 'message'],
+            ['program.exe', 'add'],
+            ['program.exe', 'add', '--verbose'],
+            ['program.exe', 'add', 'file.txt', '--amend'],
+            ['program.exe', 'commit', '-m', 'message', '--amend'],
+            ['program.exe', 'commit', '-m'],
+            ['program.exe', 'commit'],
+            ['program.exe', 'commit', '-m', 'message', '-c', 'hash'],
+            ['program.exe', 'commit', '-c', 'hash', '--amend'],
+            ['program.exe', 'add', 'file.txt', '--verbose', '--interactive'],
+            ['program.exe', 'commit', '-s', 'resolve'],
+            ['program.exe', 'merge', 'a', 'b', '-s', 'resolve', '-m', 'message'],
+            ['program.exe', 'merge', 'a', 'b', '-m', 'message'],
+            ['program.exe', 'merge', 'a', 'b', '-s', 'octopus'],
+            ['program.exe', 'submodule', 'update', '--verbose'],
+            ['program.exe', 'submodule', 'upd'],
+            ['program.exe', 'pus'],
+            ['program.exe', '-x', 'value'],
+            ['program.exe', '--verb'],
+            ['program.exe', '-b', 'branch', '--verbose'],
+        ]
+
+        for argv in command_lines:
+            self.assert_same_outcome(cli, module, argv)
+
+    def test_generated_parser_matches_generic_parser_for_random_command_lines(self):
+        randomizer: random.Random = random.Random(2024)
+
+        for allow_no_arguments in [True, False]:
+            cli: CommandLineInterface = create_cli(allow_no_arguments)
+            module: types.ModuleType = load_generated_module(cli)
+
+            for _ in range(3000):
+                argv: List[str] = ['program.exe'] + randomizer.choices(TOKENS, k=randomizer.randint(0, 6))
+                self.assert_same_outcome(cli, module, argv)
+
+    def test_generated_parser_resolves_aliases_and_abbreviations_like_generic_parser(self):
+        randomizer: random.Random = random.Random(2025)
+
+        for abbreviations_enabled in [True, False]:
+            cli: CommandLineInterface = create_cli(abbreviations_enabled=abbreviations_enabled)
+            cli.add_alias('ci', 'commit')
+            cli.add_alias('-M', '-m')
+            cli.add_alias('--int', '--interactive')
+            cli.add_alias('--add', '--interactive')
+            cli.add_alias('sync', 'merge')
+            module: types.ModuleType = load_generated_module(cli)
+
+            for _ in range(3000):
+                argv: List[str] = ['program.exe'] + randomizer.choices(ABBREVIATED_TOKENS, k=randomizer.randint(0, 6))
+                self.assert_same_outcome(cli, module, argv)
+
+    def test_generated_parser_prints_command_and_search_help_like_generic_parser(self):
+        randomizer: random.Random = random.Random(2026)
+        cli: CommandLineInterface = create_cli()
+        module: types.ModuleType = load_generated_module(cli)
+        command_lines: List[List[str]] = [
+            ['program.exe', 'help', 'commit'],
+            ['program.exe', '--help', 'merge'],
+            ['program.exe', 'help', 'unknown'],
+            ['program.exe', 'help', '--search'],
+            ['program.exe', 'help', '--search', 'commit', 'message'],
+            ['program.exe', '-h', '--search', 'branch'],
+            ['program.exe', 'help', '--search', 'zzz'],
+        ]
+
+        for argv in command_lines:
+            self.assert_same_outcome(cli, module, argv)
+        for _ in range(1000):
+            argv: List[str] = ['program.exe', randomizer.choice(HELP_TOKENS[:3])] + \
+                              randomizer.choices(HELP_TOKENS, k=randomizer.randint(0, 4))
+            self.assert_same_outcome(cli, module, argv)
+
+    def test_generated_source_is_deterministic(self):
+        self.assertEqual(ParserGenerator.generate(create_cli()), ParserGenerator.generate(create_cli()))
@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from typing import List
+
+from comlint.command_line_interface import CommandLineInterface
+from comlint.error_code import ErrorCode
+from comlint.exceptions.invalid_plugin import InvalidPlugin
+from comlint.plugin_loader import PluginLoader
+
+PLUGIN_MODULE_NAME: str = 'comlint_test_plugin'
+PLUGIN_GROUP: str = 'comlint_test.plugins'
+PLUGIN_SOURCE: str = '''
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_plugin_interface import CommandPluginInterface
+from comlint.value_type import ValueType
+
+IMPORTED_MODULES.append(__name__)
+
+
+class GreetCommandHandler(CommandHandlerInterface):
+    def run(self, command):
+        RUN_COMMANDS.append((command.name, command.values, command.options))
+
+
+class GreetingPlugin(CommandPluginInterface):
+    def get_commands(self):
+        return [{'command_name': 'greet', 'description': 'Greets somebody', 'num_of_required_values': 1,
+                 'allowed_options': ['-l'], 'allowed_flags': ['--loud']},
+                ('wave', 'Waves at somebody', 0, None, None, ['--loud'])]
+
+    def get_options(self):
+        return [('-l', 'Language', ('en', 'pl'), ValueType.TEXT)]
+
+    def get_flags(self):
+        return [('--loud', 'Loud greeting')]
+
+    def get_command_handler(self, command_name):
+        return GreetCommandHandler() if command_name == 'greet' else None
+
+
+not_a_plugin = object()
+'''
+
+IMPORTED_MODULES: List[str] = []
+RUN_COMMANDS: List[tuple] = []
+
+
+class TestPluginLoader(unittest.TestCase):
+    def setUp(self):
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.manifest_path: str = os.path.join(self.directory.name, 'plugins.json')
+        self.__write_plugin('1.0', 'GreetingPlugin')
+        sys.path.insert(0, self.directory.name)
+        IMPORTED_MODULES.clear()
+        RUN_COMMANDS.clear()
+
+    def tearDown(self):
+        sys.path.remove(self.directory.name)
+        sys.modules.pop(PLUGIN_MODULE_NAME, None)
+        self.directory.cleanup()
+
+    def test_plugin_commands_are_added_to_interface(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'greet', 'world', '-l', 'pl'])
+        PluginLoader(self.manifest_path, PLUGIN_GROUP).load(cli)
+
+        self.assertEqual(list(cli.get_commands().keys()), ['greet', 'wave'])
+        self.assertEqual(cli.get_options()['-l'].allowed_values, ('en', 'pl'))
+        self.assertIn('Greets somebody', cli.get_help())
+        self.assertEqual(cli.run(), 0)
+        self.assertEqual(RUN_COMMANDS, [('greet', ['world'], {'-l': 'pl'})])
+
+    def test_plugin_is_imported_only_when_manifest_is_outdated_or_command_is_run(self):
+        PluginLoader(self.manifest_path, PLUGIN_GROUP).load(CommandLineInterface(['program.exe']))
+        self.assertEqual(IMPORTED_MODULES, [PLUGIN_MODULE_NAME])
+
+        sys.modules.pop(PLUGIN_MODULE_NAME)
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'greet', 'world'])
+        PluginLoader(self.manifest_path, PLUGIN_GROUP).load(cli)
+        self.assertIn('Waves at somebody', cli.get_help())
+        self.assertEqual(IMPORTED_MODULES, [PLUGIN_MODULE_NAME])
+
+        cli.run()
+        self.assertEqual(IMPORTED_MODULES, [PLUGIN_MODULE_NAME, PLUGIN_MODULE_NAME])
+
+    def test_manifest_is_rebuilt_when_plugin_version_changes(self):
+        PluginLoader(self.manifest_path, PLUGIN_GROUP).load(CommandLineInterface(['program.exe']))
+        with open(self.manifest_path, 'r', encoding='utf-8') as manifest_file:
+            fingerprint: str = json.load(manifest_file)['fingerprint']
+
+        self.__write_plugin('1.1', 'GreetingPlugin')
+        sys.modules.pop(PLUGIN_MODULE_NAME)
+        PluginLoader(self.manifest_path, PLUGIN_GROUP).load(CommandLineInterface(['program.exe']))
+
+        self.assertEqual(IMPORTED_MODULES, [PLUGIN_MODULE_NAME, PLUGIN_MODULE_NAME])
+        with open(self.manifest_path, 'r', encoding='utf-8') as manifest_file:
+            self.assertNotEqual(json.load(manifest_file)['fingerprint'], fingerprint)
+
+    def test_shared_options_and_flags_are_not_added_again(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        cli.add_flag('--loud', 'Loud output')
+        PluginLoader(self.manifest_path, PLUGIN_GROUP).load(cli)
+
+        self.assertEqual(cli.get_flags()['--loud'].description, 'Loud output')
+
+    def test_plugin_without_handler_raises_error(self):
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'wave'])
+        PluginLoader(self.manifest_path, PLUGIN_GROUP).load(cli)
+
+        with self.assertRaises(InvalidPlugin) as context:
+            cli.run()
+
+        self.assertEqual(context.exception.error_code, ErrorCode.INVALID_PLUGIN)
+
+    def test_object_not_implementing_plugin_interface_raises_error(self):
+        self.__write_plugin('1.0', 'not_a_plugin')
+
+        with self.assertRaises(InvalidPlugin) as context:
+            PluginLoader(self.manifest_path, PLUGIN_GROUP).load(CommandLineInterface(['program.exe']))
+
+        self.assertEqual(context.exception.token, 'greeting')
+
+    def __write_plugin(self, version: str, plugin_object: str) -> None:
+        for file_name in os.listdir(self.directory.name):
+            if file_name.endswith('.dist-info'):
+                for dist_info_file_name in os.listdir(os.path.join(self.directory.name, file_name)):
+                    os.remove(os.path.join(self.directory.name, file_name, dist_info_file_name))
+                os.rmdir(os.path.join(self.directory.name, file_name))
+
+        dist_info_path: str = os.path.join(self.directory.name, f'comlint_test_plugin-{version}.dist-info')
+        os.mkdir(dist_info_path)
+
+        with open(os.path.join(dist_info_path, 'METADATA'), 'w', encoding='utf-8') as metadata_file:
+            metadata_file.write(f'Metadata-Version: 2.1\nName: comlint-test-plugin\nVersion: {version}\n')
+        with open(os.path.join(dist_info_path, 'entry_points.txt'), 'w', encoding='utf-8') as entry_points_file:
+            entry_points_file.write(f'[{PLUGIN_GROUP}]\ngreeting = {PLUGIN_MODULE_NAME}:{plugin_object}\n')
+        with open(os.path.join(self.directory.name, f'{PLUGIN_MODULE_NAME}.py'), 'w',
+                  encoding='utf-8') as module_file:
+            module_file.write(f'from {__name__} import IMPORTED_MODULES, RUN_COMMANDS\n{PLUGIN_SOURCE}')
+
+
+if __name__ == '__main__':
+    unittest.main()
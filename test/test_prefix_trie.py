@@ -0,0 +1,49 @@
+import unittest
+
+from comlint.prefix_trie import PrefixTrie, AMBIGUOUS_TARGET
+
+
+def create_trie() -> PrefixTrie:
+    trie: PrefixTrie = PrefixTrie()
+    trie.add('install', 'install')
+    trie.add('instance', 'instance')
+    trie.add('in', 'install')
+    trie.add('status', 'status')
+    trie.add('st', 'status')
+
+    return trie
+
+
+class TestPrefixTrie(unittest.TestCase):
+    def test_unique_prefix_is_resolved_to_its_target(self):
+        trie: PrefixTrie = create_trie()
+
+        self.assertEqual(trie.resolve('insta'), AMBIGUOUS_TARGET)
+        self.assertEqual(trie.resolve('instal'), 'install')
+        self.assertEqual(trie.resolve('installation'), None)
+        self.assertEqual(trie.resolve('s'), 'status')
+        self.assertEqual(trie.resolve('x'), None)
+
+    def test_stored_name_is_resolved_even_if_it_is_prefix_of_other_names(self):
+        trie: PrefixTrie = create_trie()
+
+        self.assertEqual(trie.resolve('in'), 'install')
+        self.assertEqual(trie.resolve('instance'), 'instance')
+
+    def test_get_targets_returns_sorted_targets_of_prefix(self):
+        trie: PrefixTrie = create_trie()
+
+        self.assertEqual(trie.get_targets('i'), ['install', 'instance'])
+        self.assertEqual(trie.get_targets('st'), ['status'])
+        self.assertEqual(trie.get_targets('x'), [])
+
+    def test_items_contain_every_prefix(self):
+        trie: PrefixTrie = PrefixTrie()
+        trie.add('ab', 'ab')
+        trie.add('ac', 'ac')
+
+        self.assertEqual(sorted(trie.items()), [('a', AMBIGUOUS_TARGET), ('ab', 'ab'), ('ac', 'ac')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import contextlib
+import io
+import unittest
+from typing import Iterator, List
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.output_format import OutputFormat
+from comlint.parsed_command import ParsedCommand
+from comlint.record_writer import RecordWriter
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.num_of_writes: int = 0
+
+    def write(self, text: str) -> int:
+        self.num_of_writes += 1
+        return super().write(text)
+
+
+class BrokenStream(io.StringIO):
+    def write(self, text: str) -> int:
+        raise BrokenPipeError()
+
+
+class RecordsHandler(CommandHandlerInterface):
+    def run(self, command: ParsedCommand) -> Iterator[dict]:
+        for value in command.values:
+            yield {'value': value, 'length': len(value)}
+
+
+class ValueHandler(CommandHandlerInterface):
+    def __init__(self, value: object):
+        self.value: object = value
+
+    def run(self, command: ParsedCommand) -> object:
+        return self.value
+
+
+class TestRecordWriter(unittest.TestCase):
+    def test_text_records_are_written_in_lines(self):
+        stream: io.StringIO = io.StringIO()
+
+        num_of_records: int = RecordWriter(stream).write_records(['a', 1, 'c'])
+
+        self.assertEqual(num_of_records, 3)
+        self.assertEqual(stream.getvalue(), 'a\n1\nc\n')
+
+    def test_json_lines_records_are_written(self):
+        stream: io.StringIO = io.StringIO()
+
+        RecordWriter(stream, OutputFormat.JSON_LINES).write_records([{'a': 1}, [1, 2], 'x'])
+
+        self.assertEqual(stream.getvalue(), '{"a": 1}\n[1, 2]\n"x"\n')
+
+    def test_csv_dict_records_are_written_with_header(self):
+        stream: io.StringIO = io.StringIO()
+
+        RecordWriter(stream, OutputFormat.CSV).write_records([{'name': 'a', 'size': 1}, {'name': 'b,c', 'size': 2}])
+
+        self.assertEqual(stream.getvalue(), 'name,size\na,1\n"b,c",2\n')
+
+    def test_csv_sequence_and_scalar_records_are_written(self):
+        stream: io.StringIO = io.StringIO()
+
+        RecordWriter(stream, OutputFormat.CSV).write_records([('a', 1), 'b'])
+
+        self.assertEqual(stream.getvalue(), 'a,1\nb\n')
+
+    def test_records_are_written_in_large_chunks(self):
+        stream: CountingStream = CountingStream()
+        records: List[str] = [f'record_{i}' for i in range(10000)]
+
+        RecordWriter(stream, buffer_size=16 * 1024).write_records(records)
+
+        self.assertEqual(stream.getvalue(), ''.join(f'{record}\n' for record in records))
+        self.assertLess(stream.num_of_writes, 10)
+
+    def test_broken_pipe_stops_writing_and_closes_generator(self):
+        closed: List[bool] = []
+
+        def records() -> Iterator[int]:
+            try:
+                for i in range(1000000):
+                    yield i
+            finally:
+                closed.append(True)
+
+        record_writer: RecordWriter = RecordWriter(BrokenStream(), buffer_size=16)
+        record_writer.write_records(records())
+
+        self.assertTrue(record_writer.broken_pipe)
+        self.assertEqual(closed, [True])
+
+    def test_command_line_interface_run_writes_yielded_records(self):
+        stream: io.StringIO = io.StringIO()
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'stat', 'ab', 'cde'])
+
+        cli.add_command('stat', 'Print statistics', num_of_required_values=2)
+        cli.add_command_handler('stat', RecordsHandler(), RecordWriter(stream, OutputFormat.JSON_LINES))
+
+        self.assertEqual(cli.run(), 0)
+        self.assertEqual(stream.getvalue(), '{"value": "ab", "length": 2}\n{"value": "cde", "length": 3}\n')
+
+    def test_records_produced_before_failure_are_written(self):
+        stream: io.StringIO = io.StringIO()
+
+        def records() -> Iterator[str]:
+            yield 'first'
+            yield 'second'
+            raise ValueError('failure')
+
+        with self.assertRaises(ValueError):
+            RecordWriter(stream).write_records(records())
+
+        self.assertEqual(stream.getvalue(), 'first\nsecond\n')
+
+    def test_results_are_written_only_with_record_writer(self):
+        for value in ['text', ['a', 'b'], 2.5]:
+            cli: CommandLineInterface = CommandLineInterface(['program.exe', 'show'])
+            cli.add_command('show', 'Show value')
+            cli.add_command_handler('show', ValueHandler(value))
+            output: io.StringIO = io.StringIO()
+
+            with contextlib.redirect_stdout(output):
+                exit_status: object = cli.run()
+
+            self.assertEqual((exit_status, output.getvalue()), (value, ''))
+
+    def test_bool_results_are_written_as_records(self):
+        stream: io.StringIO = io.StringIO()
+        cli: CommandLineInterface = CommandLineInterface(['program.exe', 'check'])
+        cli.add_command('check', 'Check something')
+        cli.add_command_handler('check', ValueHandler(False), RecordWriter(stream))
+
+        self.assertEqual(cli.run(), 0)
+        self.assertEqual(stream.getvalue(), 'False\n')
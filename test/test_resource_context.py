@@ -0,0 +1,214 @@
+import threading
+import time
+import unittest
+from typing import List
+
+from comlint.exceptions.duplicated_resource import DuplicatedResource
+from comlint.exceptions.unsupported_resource import UnsupportedResource
+from comlint.resource_context import ResourceContext
+
+
+class FakeConnection:
+    def __init__(self, name: str, closed: List[str]):
+        self.name: str = name
+        self.closed: List[str] = closed
+
+    def close(self) -> None:
+        self.closed.append(self.name)
+
+
+class FakeThreadPool:
+    def __init__(self, closed: List[str]):
+        self.closed: List[str] = closed
+
+    def shutdown(self) -> None:
+        self.closed.append('pool')
+
+
+class TestResourceContext(unittest.TestCase):
+    def test_resource_is_created_lazily_and_shared(self):
+        created: List[str] = []
+        context: ResourceContext = ResourceContext()
+        context.register('cache', lambda ctx: created.append('cache') or {})
+
+        self.assertFalse(context.is_created('cache'))
+        self.assertEqual(created, [])
+        self.assertIs(context.get('cache'), context.get('cache'))
+        self.assertTrue(context.is_created('cache'))
+        self.assertEqual(created, ['cache'])
+
+        context.close()
+
+    def test_factory_may_get_resources_it_depends_on(self):
+        closed: List[str] = []
+        context: ResourceContext = ResourceContext()
+        context.register('database', lambda ctx: FakeConnection('database', closed))
+        context.register('repository', lambda ctx: FakeConnection(f'repository of {ctx.get("database").name}', closed))
+
+        self.assertEqual(context.get('repository').name, 'repository of database')
+
+        context.close()
+
+        self.assertEqual(closed, ['repository of database', 'database'])
+        self.assertFalse(context.is_created('database'))
+
+    def test_resources_are_closed_with_closer_or_close_or_shutdown_method(self):
+        closed: List[str] = []
+        with ResourceContext() as context:
+            context.register('connection', lambda ctx: FakeConnection('connection', closed))
+            context.register('pool', lambda ctx: FakeThreadPool(closed))
+            context.register('file', lambda ctx: 'file', closer=lambda instance: closed.append(f'{instance} closer'))
+            context.register('number', lambda ctx: 42)
+            context.get('connection')
+            context.get('pool')
+            context.get('file')
+            context.get('number')
+
+        self.assertEqual(closed, ['file closer', 'pool', 'connection'])
+
+    def test_all_resources_are_closed_even_if_closing_one_of_them_fails(self):
+        closed: List[str] = []
+        context: ResourceContext = ResourceContext()
+        context.register('first', lambda ctx: FakeConnection('first', closed))
+        context.register('failing', lambda ctx: 'failing', closer=lambda instance: 1 / 0)
+        context.get('first')
+        context.get('failing')
+
+        self.assertRaises(ZeroDivisionError, context.close)
+        self.assertEqual(closed, ['first'])
+
+    def test_pooled_instances_are_reused(self):
+        created: List[object] = []
+        context: ResourceContext = ResourceContext()
+        context.register('connection', lambda ctx: created.append(object()) or created[-1], pool_size=2)
+
+        with context.acquire('connection') as first:
+            with context.acquire('connection') as second:
+                self.assertIsNot(first, second)
+        with context.acquire('connection') as third:
+            self.assertIn(third, [first, second])
+
+        self.assertEqual(len(created), 2)
+        self.assertRaises(UnsupportedResource, context.get, 'connection')
+
+        context.close()
+
+    def test_acquire_waits_for_released_instance_when_pool_is_exhausted(self):
+        context: ResourceContext = ResourceContext()
+        context.register('connection', lambda ctx: object(), pool_size=1)
+        acquired: List[object] = []
+
+        def acquire_in_thread() -> None:
+            with context.acquire('connection') as connection:
+                acquired.append(connection)
+
+        with context.acquire('connection') as first:
+            thread: threading.Thread = threading.Thread(target=acquire_in_thread)
+            thread.start()
+            thread.join(0.05)
+
+            self.assertTrue(thread.is_alive())
+            self.assertEqual(acquired, [])
+
+        thread.join()
+
+        self.assertEqual(acquired, [first])
+
+        context.close()
+
+    def test_close_wakes_up_callers_waiting_for_pooled_resource(self):
+        context: ResourceContext = ResourceContext()
+        context.register('connection', lambda ctx: object(), pool_size=1)
+        acquired: List[object] = []
+
+        def acquire_in_thread() -> None:
+            with context.acquire('connection') as connection:
+                acquired.append(connection)
+
+        with context.acquire('connection') as first:
+            thread: threading.Thread = threading.Thread(target=acquire_in_thread)
+            thread.start()
+            thread.join(0.05)
+            context.close()
+            thread.join(1)
+
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(len(acquired), 1)
+            self.assertIsNot(acquired[0], first)
+
+        context.close()
+
+    def test_slow_factory_does_not_block_other_resources(self):
+        context: ResourceContext = ResourceContext()
+        factory_started: threading.Event = threading.Event()
+        factory_released: threading.Event = threading.Event()
+        context.register('slow', lambda ctx: factory_started.set() or factory_released.wait() and object())
+        context.register('fast', lambda ctx: object())
+        thread: threading.Thread = threading.Thread(target=context.get, args=('slow',))
+        thread.start()
+        factory_started.wait()
+
+        self.assertIsNotNone(context.get('fast'))
+        self.assertFalse(context.is_created('slow'))
+
+        factory_released.set()
+        thread.join()
+
+        self.assertTrue(context.is_created('slow'))
+
+        context.close()
+
+    def test_shared_resource_is_created_once_by_concurrent_callers(self):
+        created: List[object] = []
+        context: ResourceContext = ResourceContext()
+        context.register('cache', lambda ctx: time.sleep(0.01) or created.append(object()) or created[-1])
+        instances: List[object] = []
+        threads: List[threading.Thread] = [threading.Thread(target=lambda: instances.append(context.get('cache')))
+                                           for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(instances, created * 8)
+
+        context.close()
+
+    def test_failing_factory_releases_its_reservation(self):
+        attempts: List[int] = []
+        context: ResourceContext = ResourceContext()
+        context.register('connection', lambda ctx: attempts.append(1) or (1 / (len(attempts) - 1)), pool_size=1)
+
+        with self.assertRaises(ZeroDivisionError):
+            with context.acquire('connection'):
+                pass
+        with context.acquire('connection') as connection:
+            self.assertEqual(connection, 1.0)
+
+        context.close()
+
+    def test_acquire_of_not_pooled_resource_returns_shared_instance(self):
+        context: ResourceContext = ResourceContext()
+        context.register('cache', lambda ctx: {})
+
+        with context.acquire('cache') as cache:
+            self.assertIs(cache, context.get('cache'))
+
+        context.close()
+
+    def test_negative_cases(self):
+        context: ResourceContext = ResourceContext()
+        context.register('cache', lambda ctx: {})
+
+        self.assertRaises(DuplicatedResource, context.register, 'cache', lambda ctx: {})
+        self.assertRaises(UnsupportedResource, context.get, 'database')
+        self.assertRaises(UnsupportedResource, context.is_created, 'database')
+        with self.assertRaises(UnsupportedResource):
+            with context.acquire('database'):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
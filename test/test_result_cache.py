@@ -0,0 +1,173 @@
+import io
+import os
+import tempfile
+import time
+import unittest
+from typing import List
+from unittest.mock import MagicMock
+
+from comlint.command_handler_interface import CommandHandlerInterface
+from comlint.command_line_interface import CommandLineInterface
+from comlint.disk_result_cache import DiskResultCache
+from comlint.memory_result_cache import MemoryResultCache
+from comlint.record_writer import RecordWriter
+from comlint.types import FAILURE, SUCCESS
+
+
+class TestMemoryResultCache(unittest.TestCase):
+    def test_get_counts_hits_and_misses(self):
+        cache: MemoryResultCache = MemoryResultCache(max_size=2)
+
+        self.assertIsNone(cache.get(('command', (), (), ())))
+        cache.put(('command', (), (), ()), ('record',))
+
+        self.assertEqual(cache.get(('command', (), (), ())), ('record',))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache: MemoryResultCache = MemoryResultCache(max_size=2)
+
+        cache.put(('a', (), (), ()), SUCCESS)
+        cache.put(('b', (), (), ()), SUCCESS)
+        cache.get(('a', (), (), ()))
+        cache.put(('c', (), (), ()), SUCCESS)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(('b', (), (), ())))
+
+    def test_invalidate_removes_entries_of_given_command_only(self):
+        cache: MemoryResultCache = MemoryResultCache(max_size=4)
+
+        cache.put(('a', ('1',), (), ()), SUCCESS)
+        cache.put(('a', ('2',), (), ()), SUCCESS)
+        cache.put(('b', (), (), ()), SUCCESS)
+        cache.invalidate('a')
+
+        self.assertEqual(len(cache), 1)
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+
+class TestDiskResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_entry_is_shared_between_cache_instances(self):
+        DiskResultCache(self.directory.name).put(('command', ('value',), (), ()), ('record_1', 'record_2'))
+        cache: DiskResultCache = DiskResultCache(self.directory.name)
+
+        self.assertEqual(cache.get(('command', ('value',), (), ())), ('record_1', 'record_2'))
+        self.assertIsNone(cache.get(('command', ('other',), (), ())))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_expired_entry_is_missing_and_removed(self):
+        cache: DiskResultCache = DiskResultCache(self.directory.name, time_to_live=-1)
+
+        cache.put(('command', (), (), ()), SUCCESS)
+
+        self.assertIsNone(cache.get(('command', (), (), ())))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_invalidate_removes_entries_of_given_command_only(self):
+        cache: DiskResultCache = DiskResultCache(self.directory.name)
+
+        cache.put(('a', (), (), ()), SUCCESS)
+        cache.put(('b', (), (), ()), SUCCESS)
+        cache.invalidate('a')
+
+        self.assertIsNone(cache.get(('a', (), (), ())))
+        self.assertEqual(cache.get(('b', (), (), ())), SUCCESS)
+
+    def test_invalidate_removes_only_entries_of_the_cache(self):
+        cache: DiskResultCache = DiskResultCache(self.directory.name)
+        other_path: str = os.path.join(self.directory.name, 'other.pickle')
+
+        with open(other_path, 'wb') as other_file:
+            other_file.write(b'other')
+        cache.put(('a', (), (), ()), SUCCESS)
+        cache.invalidate()
+
+        self.assertIsNone(cache.get(('a', (), (), ())))
+        self.assertEqual(os.listdir(self.directory.name), ['other.pickle'])
+
+    def test_unpicklable_result_is_not_cached(self):
+        cache: DiskResultCache = DiskResultCache(self.directory.name)
+
+        cache.put(('command', (), (), ()), (lambda: None,))
+
+        self.assertIsNone(cache.get(('command', (), (), ())))
+
+
+class TestCommandLineInterfaceResultCaching(unittest.TestCase):
+    def setUp(self):
+        self.cli: CommandLineInterface = CommandLineInterface(['program.exe'])
+        self.cli.add_command('query', 'Some query', num_of_required_values=1, allowed_options=['-a', '-b'],
+                             allowed_flags=['--x', '--y'])
+        self.cli.add_command('update', 'Some update')
+        self.cli.add_option('-a', 'Option a')
+        self.cli.add_option('-b', 'Option b')
+        self.cli.add_flag('--x', 'Flag x')
+        self.cli.add_flag('--y', 'Flag y')
+        self.cache: MemoryResultCache = MemoryResultCache(max_size=8)
+        self.stream: io.StringIO = io.StringIO()
+        self.handler: CommandHandlerInterface = CommandHandlerInterface()
+        self.handler.run = MagicMock(side_effect=lambda command: (f'result {time.perf_counter_ns()}' for _ in range(1)))
+        self.cli.add_command_handler('query', self.handler, RecordWriter(self.stream), self.cache)
+
+    def test_handler_is_skipped_and_same_records_are_written_on_hit(self):
+        self.cli.run(['program.exe', 'query', 'value', '-a', '1', '-b', '2', '--x'])
+        self.cli.run(['program.exe', 'query', 'value', '--x', '-b', '2', '-a', '1'])
+
+        lines: List[str] = self.stream.getvalue().splitlines()
+        self.assertEqual(self.handler.run.call_count, 1)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0], lines[1])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_different_arguments_are_cached_separately(self):
+        self.cli.run(['program.exe', 'query', 'value', '--x'])
+        self.cli.run(['program.exe', 'query', 'value', '--y'])
+        self.cli.run(['program.exe', 'query', 'other'])
+
+        self.assertEqual(self.handler.run.call_count, 3)
+
+    def test_failed_exit_status_is_not_cached(self):
+        self.handler.run = MagicMock(return_value=FAILURE)
+
+        self.assertEqual(self.cli.run(['program.exe', 'query', 'value']), FAILURE)
+        self.assertEqual(self.cli.run(['program.exe', 'query', 'value']), FAILURE)
+        self.assertEqual(self.handler.run.call_count, 2)
+
+    def test_running_invalidating_command_drops_cached_results(self):
+        update_handler: CommandHandlerInterface = CommandHandlerInterface()
+        update_handler.run = MagicMock(return_value=None)
+        self.cli.add_command_handler('update', update_handler, invalidated_commands=['query'])
+
+        self.cli.run(['program.exe', 'query', 'value'])
+        self.cli.run(['program.exe', 'update'])
+        self.cli.run(['program.exe', 'query', 'value'])
+
+        self.assertEqual(self.handler.run.call_count, 2)
+
+    def test_running_cached_invalidating_command_drops_cached_results(self):
+        update_handler: CommandHandlerInterface = CommandHandlerInterface()
+        update_handler.run = MagicMock(return_value=None)
+        self.cli.add_command_handler('update', update_handler, result_cache=MemoryResultCache(max_size=8),
+                                     invalidated_commands=['query'])
+
+        self.cli.run(['program.exe', 'query', 'value'])
+        self.cli.run(['program.exe', 'update'])
+        self.cli.run(['program.exe', 'query', 'value'])
+
+        self.assertEqual(self.handler.run.call_count, 2)
+        self.assertEqual(update_handler.run.call_count, 1)
+
+    def test_invalidate_cached_results(self):
+        self.cli.run(['program.exe', 'query', 'value'])
+        self.cli.invalidate_cached_results('query')
+        self.cli.run(['program.exe', 'query', 'value'])
+
+        self.assertEqual(self.handler.run.call_count, 2)
@@ -0,0 +1,39 @@
+import unittest
+from typing import List
+
+from comlint.command_line_element_type import CommandLineElementType
+from comlint.command_line_token import CommandLineToken
+from comlint.tokenizer import Tokenizer
+
+
+class TestTokenizer(unittest.TestCase):
+    def test_tokenize_classifies_every_argument_once(self):
+        argv: List[str] = ['program.exe', 'merge', 'a', '-s', 'resolve', '--verbose', 'b']
+
+        tokens: List[CommandLineToken] = Tokenizer.tokenize(argv)
+
+        self.assertEqual(tokens, [CommandLineToken(CommandLineElementType.COMMAND, 'merge', 1),
+                                  CommandLineToken(CommandLineElementType.CUSTOM_VALUE, 'a', 2),
+                                  CommandLineToken(CommandLineElementType.OPTION, '-s', 3),
+                                  CommandLineToken(CommandLineElementType.CUSTOM_VALUE, 'resolve', 4),
+                                  CommandLineToken(CommandLineElementType.FLAG, '--verbose', 5),
+                                  CommandLineToken(CommandLineElementType.CUSTOM_VALUE, 'b', 6)])
+
+    def test_tokenize_returns_no_tokens_for_program_name_only(self):
+        self.assertEqual(Tokenizer.tokenize(['program.exe']), [])
+
+    def test_command_is_recognized_only_directly_after_program_name(self):
+        self.assertEqual(Tokenizer.get_element_type('merge', 1), CommandLineElementType.COMMAND)
+        self.assertEqual(Tokenizer.get_element_type('merge', 2), CommandLineElementType.CUSTOM_VALUE)
+
+    def test_get_element_type_handles_edge_cases(self):
+        self.assertEqual(Tokenizer.get_element_type('', 1), CommandLineElementType.CUSTOM_VALUE)
+        self.assertEqual(Tokenizer.get_element_type('-', 2), CommandLineElementType.CUSTOM_VALUE)
+        self.assertEqual(Tokenizer.get_element_type('--', 2), CommandLineElementType.CUSTOM_VALUE)
+        self.assertEqual(Tokenizer.get_element_type('-o', 1), CommandLineElementType.OPTION)
+        self.assertEqual(Tokenizer.get_element_type('---', 2), CommandLineElementType.FLAG)
+
+    def test_token_texts_are_interned(self):
+        argv: List[str] = ['program.exe', ''.join(['com', 'mand'])]
+
+        self.assertIs(Tokenizer.tokenize(argv)[0].text, Tokenizer.tokenize(['program.exe', 'command'])[0].text)
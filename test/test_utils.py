@@ -31,3 +31,10 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.get_similar_values(some_list, value='file', delimiter=', '), 'open_file, close_file')
         self.assertEqual(utils.get_similar_values(some_list, value='run_open_file', delimiter=', '), 'open_file')
         self.assertEqual(utils.get_similar_values(some_list, value='abcdef', delimiter=', '), '')
+
+    def test_find_similar_returns_proper_values(self):
+        some_list: list = ['open_file', 'open_folder', 'close_file', 'close_folder']
+
+        self.assertEqual(utils.find_similar(some_list, value='open'), ['open_file', 'open_folder'])
+        self.assertEqual(utils.find_similar(some_list, value='run_open_file'), ['open_file'])
+        self.assertEqual(utils.find_similar(some_list, value='abcdef'), [])